@@ -0,0 +1,64 @@
+import os
+
+from asv_runner.benchmarks.mark import skip_params_if
+
+from foapy import binding, intervals, mode
+from foapy.characteristics import (
+    arithmetic_mean,
+    average_remoteness,
+    depth,
+    geometric_mean,
+    volume,
+)
+
+from .cases import best_case, dna_case, normal_case, worst_case
+
+length = [5, 50, 500, 5000, 50000, 500000, 5000000, 50000000]
+skip = [
+    (5000000, "Worst"),
+    (5000000, "DNA"),
+    (5000000, "Normal"),
+    (5000000, "Best"),
+    (50000000, "Worst"),
+    (50000000, "DNA"),
+    (50000000, "Normal"),
+    (50000000, "Best"),
+]
+
+
+class CharacteristicsSuite:
+    params = (length, ["Best", "DNA", "Normal", "Worst"])
+    param_names = ["length", "case"]
+
+    intervals = None
+
+    def setup(self, length, case):
+        if case == "Best":
+            data = best_case(length)
+        elif case == "DNA":
+            data = dna_case(length)
+        elif case == "Normal":
+            data = normal_case(length)
+        elif case == "Worst":
+            data = worst_case(length)
+        self.intervals = intervals(data, binding.start, mode.normal)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_arithmetic_mean(self, length, case):
+        arithmetic_mean(self.intervals)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_average_remoteness(self, length, case):
+        average_remoteness(self.intervals)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_depth(self, length, case):
+        depth(self.intervals)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_geometric_mean(self, length, case):
+        geometric_mean(self.intervals)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_volume(self, length, case):
+        volume(self.intervals)
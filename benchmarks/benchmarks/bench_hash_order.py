@@ -0,0 +1,51 @@
+import os
+
+from asv_runner.benchmarks.mark import skip_params_if
+
+from foapy.core._sort import hash_order, sort_groups
+
+from .cases import dna_case, word_case
+
+length = [5, 50, 500, 5000, 50000, 500000, 5000000]
+skip = [
+    (5000000, "DNA", "object"),
+    (5000000, "DNA", "str"),
+    (5000000, "Words", "object"),
+    (5000000, "Words", "str"),
+]
+
+
+class HashOrderSuite:
+    """
+    Unique elements by a hash table against the stable sort
+    for strings and Python objects.
+    """
+
+    params = (length, ["DNA", "Words"], ["str", "object"])
+    param_names = ["length", "case", "dtype"]
+
+    data = None
+
+    def setup(self, length, case, dtype):
+        if case == "DNA":
+            self.data = dna_case(length)
+        elif case == "Words":
+            self.data = word_case(length)
+        if dtype == "object":
+            self.data = self.data.astype(object)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_hash(self, length, case, dtype):
+        hash_order(self.data)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def time_sort(self, length, case, dtype):
+        sort_groups(self.data)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def peakmem_hash(self, length, case, dtype):
+        return hash_order(self.data)
+
+    @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
+    def peakmem_sort(self, length, case, dtype):
+        return sort_groups(self.data)
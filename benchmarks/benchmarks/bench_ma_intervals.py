@@ -6,8 +6,8 @@ from foapy.ma import intervals, order
 
 from .ma_cases import best_case, dna_case, normal_case, worst_case
 
-length = [5, 50, 500]
-# , 5000, 50000, 500000, 5000000, 50000000
+length = [5, 50, 500, 5000]
+# , 50000, 500000, 5000000, 50000000
 skip = [
     (5000000, "Worst", 1, 1),
     (5000000, "DNA", 1, 1),
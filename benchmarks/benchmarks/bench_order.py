@@ -4,7 +4,7 @@ from asv_runner.benchmarks.mark import skip_params_if
 
 from foapy import order
 
-from .cases import best_case, dna_case, normal_case, worst_case
+from .cases import best_case, dna_case, normal_case, word_case, worst_case
 
 length = [5, 50, 500, 5000, 50000, 500000, 5000000, 50000000]
 skip = [
@@ -12,17 +12,19 @@ skip = [
     (5000000, "DNA"),
     (5000000, "Normal"),
     (5000000, "Best"),
+    (5000000, "Words"),
     (50000000, "Worst"),
     (50000000, "DNA"),
     (50000000, "Normal"),
     (50000000, "Best"),
+    (50000000, "Words"),
 ]
 
 timeout = 600
 
 
 class OrderSuite:
-    params = (length, ["Best", "DNA", "Normal", "Worst"])
+    params = (length, ["Best", "DNA", "Normal", "Worst", "Words"])
     param_names = ["length", "case"]
 
     data = None
@@ -36,6 +38,8 @@ class OrderSuite:
             self.data = normal_case(length)
         elif case == "Worst":
             self.data = worst_case(length)
+        elif case == "Words":
+            self.data = word_case(length)
 
     @skip_params_if(skip, os.getenv("QUICK_BENCHMARK") == "true")
     def time_order(self, length, case):
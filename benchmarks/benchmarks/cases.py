@@ -11,6 +11,18 @@ def dna_case(length):
     return numpy.random.choice(nucleotides, length)
 
 
+def word_case(length):
+    # Word tokens of a text: 2-12 letters with Zipf-distributed frequencies
+    letters = numpy.array(list("abcdefghijklmnopqrstuvwxyz"))
+    vocabulary = numpy.array(
+        [
+            "".join(numpy.random.choice(letters, size))
+            for size in numpy.random.randint(2, 13, 10000)
+        ]
+    )
+    return vocabulary[numpy.random.zipf(1.2, length) % len(vocabulary)]
+
+
 def normal_case(length):
     alphabet = numpy.arange(0, fix(length * 0.2), dtype=int)
     return numpy.random.choice(alphabet, length)
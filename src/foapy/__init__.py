@@ -26,21 +26,36 @@ except NameError:
 if __FOAPY_SETUP__:
     sys.stderr.write("Running from foapy source directory.\n")
 else:
+    from foapy.core import IntervalsStream  # noqa: F401
+    from foapy.core import PreparedSequence  # noqa: F401
+    from foapy.core import Workspace  # noqa: F401
     from foapy.core import alphabet  # noqa: F401
     from foapy.core import binding  # noqa: F401
     from foapy.core import intervals  # noqa: F401
+    from foapy.core import mapped_intervals  # noqa: F401
+    from foapy.core import mapped_order  # noqa: F401
     from foapy.core import mode  # noqa: F401
     from foapy.core import order  # noqa: F401
+    from foapy.core import parallel_intervals  # noqa: F401
 
     # public submodules are imported lazily, therefore are accessible from
     # __getattr__. Note that `distutils` (deprecated) and `array_api`
     # (experimental label) are not added here, because `from foapy import *`
     # must not raise any warnings - that's too disruptive.
-    __foapy_submodules__ = {"ma", "exceptions", "core", "characteristics"}
+    __foapy_submodules__ = {
+        "ma",
+        "batch",
+        "exceptions",
+        "core",
+        "characteristics",
+        "io",
+    }
 
     __all__ = list(
         __foapy_submodules__
-        | {"order", "intervals", "alphabet", "binding", "mode"}
+        | {"order", "intervals", "alphabet", "binding", "mode", "PreparedSequence"}
+        | {"Workspace", "parallel_intervals", "IntervalsStream"}
+        | {"mapped_intervals", "mapped_order"}
         | {"__version__", "__array_namespace_info__"}
     )
 
@@ -64,6 +79,16 @@ else:
 
             return ma
 
+        if attr == "batch":
+            import foapy.batch as batch
+
+            return batch
+
+        if attr == "io":
+            import foapy.io as io
+
+            return io
+
         raise AttributeError(
             "module {!r} has no attribute " "{!r}".format(__name__, attr)
         )
@@ -77,6 +102,12 @@ else:
             "alphabet",
             "binding",
             "mode",
+            "PreparedSequence",
+            "Workspace",
+            "parallel_intervals",
+            "IntervalsStream",
+            "mapped_intervals",
+            "mapped_order",
             "version",
         }
         return list(public_symbols)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from foapy.batch._sort import as_batch, group_records, sort_records
+from foapy.core import RaggedArray
+
+
+def alphabet(X) -> RaggedArray:
+    """
+    Get alphabets of every sequence of a batch.
+
+    Every alphabet is the list of unique values of a sequence in order
+    of their first appearance, the same as [foapy.alphabet()][foapy.alphabet]
+    returns for a single sequence.
+
+    Parameters
+    ----------
+    X : array_like or RaggedArray
+        Batch of sequences of equal length as a 2-dimensional array
+        or [RaggedArray][foapy.core.RaggedArray] of variable-length sequences
+        (concatenated values plus offsets).
+
+    Returns
+    -------
+    : RaggedArray
+        [RaggedArray][foapy.core.RaggedArray] with the alphabet of every sequence.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not d2 array
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    source = [[3, 1, 3, 2], [2, 2, 2, 2]]
+    alphabet = foapy.batch.alphabet(source)
+    print(alphabet)
+    # RaggedArray([[3, 1, 2], [2]])
+    print(alphabet.lengths)
+    # [3 1]
+    ```
+    """  # noqa: E501
+
+    values, offsets, shape = as_batch(X)
+
+    perm, mask = sort_records(values, offsets, shape)
+    first_positions = np.sort(perm[mask[:-1]])
+    _, alphabet_offsets = group_records(first_positions, offsets)
+    return RaggedArray(values[first_positions], alphabet_offsets)
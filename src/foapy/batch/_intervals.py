@@ -0,0 +1,150 @@
+import numpy as np
+from numpy import ndarray
+
+from foapy.batch._sort import as_batch, group_records, sort_records
+from foapy.core import RaggedArray
+from foapy.core import binding as constants_binding
+from foapy.core import mode as constants_mode
+from foapy.core._intervals import intervals_dtype, validate_intervals_args
+
+
+def intervals(X, binding: int, mode: int, dtype=None) -> ndarray:
+    """
+    Extract intervals from every sequence of a batch.
+
+    Sequences of the batch give the same intervals as
+    [foapy.intervals()][foapy.intervals] gives for a single sequence.
+    All sequences are stable sorted at once and the intervals
+    of the whole batch are scattered into one buffer.
+
+    Parameters
+    ----------
+    X : array_like or RaggedArray
+        Batch of sequences of equal length as a 2-dimensional array
+        or [RaggedArray][foapy.core.RaggedArray] of variable-length sequences
+        (concatenated values plus offsets).
+    binding: int
+        [start][foapy.binding.start] = 1 - Intervals are extracted from left to right.
+        [end][foapy.binding.end] = 2 – Intervals are extracted from right to left.
+    mode: int
+        [lossy][foapy.mode.lossy] = 1,
+        [normal][foapy.mode.normal] = 2,
+        [cycle][foapy.mode.cycle] = 3 or
+        [redundant][foapy.mode.redundant] = 4.
+        See [foapy.intervals()][foapy.intervals] for details.
+    dtype: dtype or "auto", optional
+        Integer dtype of the intervals. Defaults to `np.intp`.
+        See [foapy.intervals()][foapy.intervals] for details.
+
+    Returns
+    -------
+    : ndarray or RaggedArray
+        (batch, length) array of intervals for
+        [normal][foapy.mode.normal] and [cycle][foapy.mode.cycle] modes
+        of a 2-dimensional X.
+        [RaggedArray][foapy.core.RaggedArray] with the intervals of every
+        sequence for [lossy][foapy.mode.lossy] and
+        [redundant][foapy.mode.redundant] modes, since their count depends
+        on the alphabet power of the sequence, and for any mode
+        if X is RaggedArray.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not d2 array
+
+    ValueError
+        When binding, mode or dtype is not valid
+
+    Examples
+    --------
+
+    Get intervals of a batch of sequences and their characteristics.
+    Characteristics of [foapy.characteristics.ma][foapy.characteristics.ma]
+    that depend only on intervals (arithmetic_mean, average_remoteness,
+    depth, geometric_mean and volume) calculate values for every row.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = [['a', 'b', 'a', 'c'], ['c', 'c', 'a', 'b']]
+    intervals = foapy.batch.intervals(source, foapy.binding.start, foapy.mode.normal)
+    print(intervals)
+    # [[1 2 2 4]
+    #  [1 1 3 4]]
+    print(foapy.characteristics.ma.depth(intervals))
+    # [4. 3.5849625]
+
+    lossy = foapy.batch.intervals(source, foapy.binding.start, foapy.mode.lossy)
+    print(lossy)
+    # RaggedArray([[2], [1]])
+    ```
+
+    Get intervals of variable-length sequences given as values plus offsets.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = foapy.core.RaggedArray(['a', 'b', 'a', 'c', 'c', 'b', 'c'], [0, 3, 7])
+    intervals = foapy.batch.intervals(source, foapy.binding.end, foapy.mode.normal)
+    print(intervals)
+    # RaggedArray([[2, 2, 1], [1, 2, 2, 1]])
+    print(intervals.data, intervals.offsets)
+    # [2 2 1 1 2 2 1] [0 3 7]
+    ```
+    """  # noqa: E501
+
+    validate_intervals_args(binding, mode)
+    if isinstance(binding, (list, tuple)) or isinstance(mode, (list, tuple)):
+        raise ValueError(
+            {"message": "Batched intervals take a single binding and mode."}
+        )
+
+    values, offsets, shape = as_batch(X)
+    lengths = np.diff(offsets)
+    dtype = intervals_dtype(dtype, int(lengths.max()) if lengths.shape[0] else 0)
+
+    perm, mask = sort_records(values, offsets, shape)
+    first = perm[mask[:-1]]
+    last = perm[mask[1:]]
+    records, power_offsets = group_records(first, offsets)
+    # Positions of the first and the last occurrences inside their sequences
+    starts = offsets[records]
+    first_local = first - starts
+    last_local = last - starts
+    length = lengths[records]
+    del starts
+
+    result = np.empty(values.shape[0], dtype=dtype)
+    distances = np.subtract(perm[1:], perm[:-1], dtype=dtype, casting="unsafe")
+    if binding == constants_binding.start:
+        result[perm[1:]] = distances
+        del distances
+        result[first] = first_local + 1
+        boundary = first
+        boundary_cycle = first_local + length - last_local
+    else:
+        result[perm[:-1]] = distances
+        del distances
+        result[last] = length - last_local
+        boundary = last
+        boundary_cycle = length - last_local + first_local
+
+    if mode == constants_mode.cycle:
+        result[boundary] = boundary_cycle
+    if mode in {constants_mode.normal, constants_mode.cycle}:
+        if shape is not None:
+            return result.reshape(shape)
+        return RaggedArray(result, offsets)
+
+    if mode == constants_mode.lossy:
+        not_boundary = np.ones(values.shape[0], dtype=bool)
+        not_boundary[boundary] = False
+        return RaggedArray(result[not_boundary], offsets - power_offsets)
+
+    # Redundant boundary intervals follow the sort order inside every sequence
+    if binding == constants_binding.start:
+        result = np.insert(result, offsets[records + 1], length - last_local)
+    else:
+        result = np.insert(result, offsets[records], first_local + 1)
+    return RaggedArray(result, offsets + power_offsets)
@@ -0,0 +1,95 @@
+import numpy as np
+from numpy import ndarray
+
+from foapy.batch._sort import as_batch, group_records, sort_records
+from foapy.core import RaggedArray
+
+
+def order(X, return_alphabet: bool = False) -> ndarray:
+    """
+    Decompose every sequence of a batch into an order and an alphabet.
+
+    Sequences of the batch are decomposed the same way as
+    [foapy.order()][foapy.order] decomposes a single sequence,
+    but all sequences are sorted and numbered by one vectorized pass
+    instead of a Python call per sequence.
+
+    Parameters
+    ----------
+    X : array_like or RaggedArray
+        Batch of sequences of equal length as a 2-dimensional array
+        or [RaggedArray][foapy.core.RaggedArray] of variable-length sequences
+        (concatenated values plus offsets).
+
+    return_alphabet : bool, optional
+        If True also return alphabets of the sequences
+
+    Returns
+    -------
+    order : ndarray or RaggedArray
+        (batch, length) array with the order of every sequence,
+        RaggedArray with the same offsets as X if X is RaggedArray.
+
+    alphabet : RaggedArray
+        [RaggedArray][foapy.core.RaggedArray] with the alphabet of every sequence.
+        Only provided if `return_alphabet` is True.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not d2 array
+
+    Examples
+    --------
+
+    Get orders of a batch of sequences.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = [['a', 'b', 'a', 'c'], ['c', 'c', 'a', 'b']]
+    order, alphabet = foapy.batch.order(source, True)
+    print(order)
+    # [[0 1 0 2]
+    #  [0 0 1 2]]
+    print(alphabet)
+    # RaggedArray([['a', 'b', 'c'], ['c', 'a', 'b']])
+    ```
+
+    Get orders of variable-length sequences given as values plus offsets.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = foapy.core.RaggedArray(['a', 'b', 'a', 'c', 'c', 'b'], [0, 3, 6])
+    print(foapy.batch.order(source))
+    # RaggedArray([[0, 1, 0], [0, 0, 1]])
+    ```
+    """  # noqa: E501
+
+    values, offsets, shape = as_batch(X)
+
+    perm, mask = sort_records(values, offsets, shape)
+    first_mask = mask[:-1]
+
+    # Groups of equal elements are numbered through the whole batch
+    groups = np.empty(values.shape[0], dtype=np.intp)
+    groups[perm] = np.cumsum(first_mask) - 1
+
+    # First occurrences sorted by position are ordered by sequence, then
+    # by appearance within the sequence: rank them inside their sequences
+    first_positions = np.sort(perm[first_mask])
+    records, alphabet_offsets = group_records(first_positions, offsets)
+    appearance = np.empty(first_positions.shape[0], dtype=np.intp)
+    appearance[groups[first_positions]] = (
+        np.arange(first_positions.shape[0]) - alphabet_offsets[records]
+    )
+
+    result = appearance[groups]
+    if shape is not None:
+        result = result.reshape(shape)
+    else:
+        result = RaggedArray(result, offsets)
+    if return_alphabet:
+        return result, RaggedArray(values[first_positions], alphabet_offsets)
+    return result
@@ -0,0 +1,219 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from foapy.batch._sort import as_batch
+from foapy.characteristics._profile import characteristics_list
+from foapy.core import binding as constants_binding
+from foapy.core import mode as constants_mode
+from foapy.core._intervals import validate_intervals_args
+
+executors = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def profile(
+    X,
+    characteristics=None,
+    binding=constants_binding.start,
+    mode=constants_mode.normal,
+    dtype=None,
+    workers=None,
+    chunk_size=None,
+    executor="thread",
+):
+    """
+    Calculate characteristics of every sequence of a batch on several cores.
+
+    Every sequence is decomposed by [foapy.ma.order()][foapy.ma.order]
+    into a [SparseOrder][foapy.ma.SparseOrder], its congeneric intervals
+    are extracted by [foapy.ma.intervals()][foapy.ma.intervals]
+    and the characteristics are calculated by
+    [foapy.characteristics.profile()][foapy.characteristics.profile].
+    Sequences are split into chunks which are distributed between workers,
+    results are collected in the order of the sequences.
+
+    The thread executor suits long sequences, where the time is spent
+    in NumPy kernels releasing the GIL. The process executor suits many short
+    sequences, where the time is spent in Python code: the values
+    of the batch are placed into shared memory once and workers
+    read their chunks from it without copying.
+
+    Parameters
+    ----------
+    X : array_like or RaggedArray
+        Batch of sequences of equal length as a 2-dimensional array
+        or [RaggedArray][foapy.core.RaggedArray] of variable-length sequences
+        (concatenated values plus offsets).
+    characteristics : iterable of str, optional
+        Names of characteristics to calculate, all characteristics
+        of [foapy.characteristics.profile()][foapy.characteristics.profile]
+        by default.
+    binding : int, optional
+        Binding of the intervals, [start][foapy.binding.start] by default.
+    mode : int, optional
+        Mode of the intervals, [normal][foapy.mode.normal] by default.
+    dtype : dtype, optional
+        The dtype of the characteristics.
+    workers : int, optional
+        Number of workers, the number of CPUs by default.
+        One worker calculates everything in the calling thread.
+    chunk_size : int, optional
+        Number of sequences in a chunk of work. By default every worker
+        gets about four chunks.
+    executor : str, optional
+        "thread" (default) or "process".
+
+    Returns
+    -------
+    : dict
+        Arrays with values of the requested characteristics of every sequence
+        by their names.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not d2 array or RaggedArray
+
+    ValueError
+        When binding, mode, executor or a characteristic name is not valid
+
+    ValueError
+        When workers or chunk_size is not a positive integer
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    source = [['a', 'b', 'a', 'c'], ['c', 'c', 'a', 'b']]
+    result = foapy.batch.profile(source, ["depth", "regularity"], workers=2)
+    print(result)
+    # {'depth': array([4.       , 3.5849625]), 'regularity': array([0.97098354, 1.        ])}
+    ```
+    """  # noqa: E501
+
+    validate_intervals_args(binding, mode)
+    if isinstance(binding, (list, tuple)) or isinstance(mode, (list, tuple)):
+        raise ValueError({"message": "Batch profile takes a single binding and mode."})
+    if executor not in executors:
+        message = f"Invalid executor {executor}. Use 'thread' or 'process'."
+        raise ValueError({"message": message})
+    if (workers is not None and workers < 1) or (
+        chunk_size is not None and chunk_size < 1
+    ):
+        message = (
+            f"Invalid workers {workers} or chunk size {chunk_size}. "
+            "Use positive integers."
+        )
+        raise ValueError({"message": message})
+    names = characteristics_list(characteristics)
+
+    values, offsets, _ = as_batch(X)
+    batch = offsets.shape[0] - 1
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-batch // (workers * 4)))
+    bounds = [
+        (start, min(start + chunk_size, batch)) for start in range(0, batch, chunk_size)
+    ]
+
+    task = (names, binding, mode, dtype)
+    if workers == 1 or len(bounds) <= 1:
+        chunks = [
+            profile_chunk(values, offsets[start : stop + 1], *task)
+            for start, stop in bounds
+        ]
+    elif executor == "thread":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = list(
+                pool.map(
+                    lambda bound: profile_chunk(
+                        values, offsets[bound[0] : bound[1] + 1], *task
+                    ),
+                    bounds,
+                )
+            )
+    else:
+        chunks = profile_processes(values, offsets, bounds, task, workers)
+
+    result = {}
+    for name in names:
+        parts = [chunk[name] for chunk in chunks]
+        result[name] = np.concatenate(parts) if len(parts) != 0 else np.array([])
+    return result
+
+
+def profile_chunk(values, offsets, names, binding, mode, dtype):
+    """
+    Calculate characteristics of sequences `values[offsets[j]:offsets[j + 1]]`.
+    """
+    from foapy.characteristics import profile as sequence_profile
+    from foapy.ma import intervals, order
+
+    rows = []
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        sparse = order(np.ma.masked_array(values[start:stop]), sparse=True)
+        grouped = intervals(sparse, binding, mode)
+        rows.append(sequence_profile(grouped, names, dtype=dtype))
+    return {name: np.array([row[name] for row in rows]) for name in names}
+
+
+def profile_processes(values, offsets, bounds, task, workers):
+    """
+    Calculate chunks of the batch in processes reading values from shared memory.
+    """
+    if values.dtype.hasobject:
+        # Python objects cannot be shared, chunks are sent to workers
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    profile_chunk,
+                    values[offsets[start] : offsets[stop]],
+                    offsets[start : stop + 1] - offsets[start],
+                    *task,
+                )
+                for start, stop in bounds
+            ]
+            return [future.result() for future in futures]
+
+    values = np.ascontiguousarray(values)
+    memory = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        shared = np.ndarray(values.shape, dtype=values.dtype, buffer=memory.buf)
+        shared[:] = values
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    profile_shared_chunk,
+                    memory.name,
+                    values.dtype.str,
+                    values.shape[0],
+                    offsets[start : stop + 1],
+                    *task,
+                )
+                for start, stop in bounds
+            ]
+            chunks = [future.result() for future in futures]
+        del shared
+    finally:
+        memory.close()
+        memory.unlink()
+    return chunks
+
+
+def profile_shared_chunk(memory_name, dtype_str, length, offsets, *task):
+    """
+    Calculate a chunk of the batch from values placed into shared memory.
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        values = np.ndarray(length, dtype=np.dtype(dtype_str), buffer=memory.buf)
+        chunk = profile_chunk(values, offsets, *task)
+        del values
+    finally:
+        memory.close()
+    return chunk
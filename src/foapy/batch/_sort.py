@@ -0,0 +1,106 @@
+import numpy as np
+
+from foapy.core import RaggedArray
+from foapy.core._sort import sort_keys
+from foapy.exceptions import Not1DArrayException
+
+
+def as_batch(X):
+    """
+    Split X into flat values and offsets of its sequences.
+
+    Returns the values, the offsets and the (batch, length) shape of X,
+    the shape is None when X is a RaggedArray of variable-length sequences.
+    """
+    if isinstance(X, RaggedArray):
+        values = np.asanyarray(X.data)
+        if values.ndim != 1:
+            message = f"Incorrect array form. Expected d1 array, exists {values.ndim}"
+            raise Not1DArrayException({"message": message})
+        offsets = X.offsets
+        if offsets[0] != 0 or offsets[-1] != values.shape[0]:
+            values = values[offsets[0] : offsets[-1]]
+            offsets = offsets - offsets[0]
+        return values, offsets, None
+
+    ar = np.asanyarray(X)
+    if ar.ndim != 2:
+        message = f"Incorrect array form. Expected d2 array, exists {ar.ndim}"
+        raise Not1DArrayException({"message": message})
+    batch, length = ar.shape
+    offsets = np.arange(batch + 1, dtype=np.intp) * length
+    return ar.reshape(-1), offsets, ar.shape
+
+
+def sort_records(values, offsets, shape):
+    """
+    Stable sort values of every sequence and mark borders of groups.
+
+    Returns the permutation of the flat values, which sorts every
+    sequence in place, and a mask of `len(values) + 1` items: `mask[:-1]`
+    marks first and `mask[1:]` marks last occurrences of every element
+    in every sequence.
+    """
+    keys = sort_keys(values)
+
+    if shape is not None:
+        # Rows of equal length are sorted by one argsort along the rows
+        batch, length = shape
+        perm = keys.reshape(shape).argsort(axis=1, kind="mergesort")
+        perm += offsets[:-1, None]
+        perm = perm.reshape(-1)
+    else:
+        perm = sort_by_record(keys, offsets)
+
+    sorted_keys = keys[perm]
+    del keys
+
+    mask = np.empty(values.shape[0] + 1, dtype=bool)
+    mask[:1] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=mask[1:-1])
+    del sorted_keys
+    # Equal values of neighbouring sequences belong to different groups
+    mask[offsets] = True
+    return perm, mask
+
+
+def sort_by_record(keys, offsets):
+    """
+    One global stable sort of keys of variable-length sequences
+    keyed by (sequence, value).
+    """
+    records = np.repeat(
+        np.arange(offsets.shape[0] - 1, dtype=np.intp), np.diff(offsets)
+    )
+    if keys.shape[0] == 0:
+        return records
+
+    # Integer keys are combined with the sequence number into one key,
+    # when it fits into int64, otherwise keys are sorted lexicographically
+    if keys.dtype.kind in "iu":
+        low = keys.min()
+        values_range = int(keys.max()) - int(low) + 1
+        if values_range * (offsets.shape[0] - 1) <= np.iinfo(np.int64).max:
+            # Differences are exact in unsigned wrapping arithmetic,
+            # bytes of the keys are read in the native byte order
+            unsigned = np.dtype(f"u{keys.dtype.itemsize}")
+            native = keys.astype(keys.dtype.newbyteorder("="), copy=False)
+            shifted = native.view(unsigned) - np.asarray(low).view(unsigned)
+            combined = records.astype(np.int64)
+            combined *= values_range
+            combined += shifted.astype(np.int64)
+            return combined.argsort(kind="mergesort")
+
+    return np.lexsort((keys, records))
+
+
+def group_records(positions, offsets):
+    """
+    Sequences of positions of the flat values and offsets of the positions
+    grouped by sequence. Positions must be ascending within every sequence.
+    """
+    records = np.searchsorted(offsets, positions, side="right") - 1
+    counts = np.bincount(records, minlength=offsets.shape[0] - 1)
+    grouped_offsets = np.zeros(offsets.shape[0], dtype=np.intp)
+    np.cumsum(counts, out=grouped_offsets[1:])
+    return records, grouped_offsets
@@ -10,18 +10,22 @@ except NameError:
 if __FOAPY_SETUP__:
     sys.stderr.write("Running from foapy.characteristics source directory.\n")
 else:
+    from ._accumulator import Accumulator  # noqa: F401
     from ._arithmetic_mean import arithmetic_mean  # noqa: F401
     from ._average_remoteness import average_remoteness  # noqa: F401
     from ._depth import depth  # noqa: F401
     from ._descriptive_information import descriptive_information  # noqa: F401
     from ._geometric_mean import geometric_mean  # noqa: F401
     from ._identifying_information import identifying_information  # noqa: F401
+    from ._profile import profile  # noqa: F401
     from ._regularity import regularity  # noqa: F401
+    from ._sliding_profile import sliding_profile  # noqa: F401
     from ._uniformity import uniformity  # noqa: F401
     from ._volume import volume  # noqa: F401
 
     __all__ = list(
         {
+            "Accumulator",
             "volume",
             "arithmetic_mean",
             "geometric_mean",
@@ -29,7 +33,9 @@ else:
             "depth",
             "descriptive_information",
             "identifying_information",
+            "profile",
             "regularity",
+            "sliding_profile",
             "uniformity",
         }
     )
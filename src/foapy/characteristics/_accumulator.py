@@ -0,0 +1,202 @@
+import numpy as np
+
+from foapy.characteristics._profile import (
+    characteristics_list,
+    sums_characteristics,
+)
+from foapy.characteristics.ma._accumulator import Accumulator as ElementsAccumulator
+
+
+class Accumulator:
+    """
+    Running sums of congeneric intervals of a sequence, ready to derive
+    its characteristics.
+
+    All characteristics of [foapy.characteristics][foapy.characteristics]
+    are sums over the intervals or over the elements of the alphabet:
+    depth is the sum of logarithms, arithmetic mean is the sum divided
+    by the count, identifying information needs the sum and the count
+    of intervals per element. An accumulator keeps them per element
+    in [foapy.characteristics.ma.Accumulator][foapy.characteristics.ma.Accumulator],
+    so the characteristics of a stream or of a partitioned sequence
+    are calculated without materializing all intervals at once.
+
+    Parameters
+    ----------
+    dtype : dtype, optional
+        The dtype of the sums and the characteristics.
+
+    Examples
+    --------
+
+    Calculate characteristics of a sequence given by chunks.
+
+    ``` py linenums="1"
+    import foapy
+
+    stream = foapy.IntervalsStream(foapy.mode.normal)
+    accumulator = foapy.characteristics.Accumulator()
+    for chunk in [['a', 'b', 'a'], ['c', 'a', 'd']]:
+        accumulator.update(*stream.update(chunk, return_order=True))
+    print(accumulator.depth())
+    # 7.584962500721156
+    print(accumulator.profile(["regularity", "uniformity"]))
+    # {'regularity': 0.9759306487558015, 'uniformity': 0.035149463749769794}
+    ```
+
+    Reduce accumulators of partitions calculated in parallel.
+
+    ``` py linenums="1"
+    import foapy
+    from functools import reduce
+
+    def partition(intervals_grouped):
+        accumulator = foapy.characteristics.Accumulator()
+        accumulator.update(intervals_grouped)
+        return accumulator
+
+    parts = [partition([[1, 2], [2]]), partition([[4], [], [3]])]
+    total = reduce(lambda left, right: left.merge(right) or left, parts)
+    print(total.arithmetic_mean())
+    # 2.4
+    ```
+    """  # noqa: E501
+
+    def __init__(self, dtype=None):
+        self.dtype = dtype
+        self.elements = ElementsAccumulator(dtype)
+
+    def update(self, intervals, order=None, power=None):
+        """
+        Add intervals to the sums.
+
+        Parameters
+        ----------
+        intervals : array_like or RaggedArray
+            An array of intervals grouped by element
+            or [RaggedArray][foapy.core.RaggedArray] returned by
+            [foapy.ma.intervals()][foapy.ma.intervals]. A flat array
+            of intervals when order is given.
+        order : array_like, optional
+            Indexes of the elements of the intervals in the alphabet,
+            as returned by [IntervalsStream][foapy.IntervalsStream].
+        power : int, optional
+            Count of elements in the alphabet. Elements without intervals,
+            e.g. occurring once in [lossy][foapy.mode.lossy] mode,
+            are counted only up to the largest index otherwise.
+
+        Raises
+        -------
+        ValueError
+            When intervals and order have different lengths
+        """
+        self.elements.update(intervals, order, power)
+
+    def merge(self, other):
+        """
+        Add sums of another accumulator, e.g. of the next partition
+        of the sequence.
+
+        Parameters
+        ----------
+        other : Accumulator
+            Accumulator with the same indexes of the elements.
+        """
+        self.elements.merge(other.elements)
+
+    def profile(self, characteristics=None) -> dict:
+        """
+        Calculate characteristics of the accumulated intervals.
+
+        Parameters
+        ----------
+        characteristics : iterable of str, optional
+            Names of characteristics to calculate, all characteristics
+            of [foapy.characteristics.profile()][foapy.characteristics.profile]
+            by default.
+
+        Returns
+        -------
+        : dict
+            Values of the requested characteristics by their names.
+
+        Raises
+        -------
+        ValueError
+            When a characteristic name is unknown
+        """
+        characteristics = characteristics_list(characteristics)
+        elements = self.elements
+        sums = elements.sums if elements.sums is not None else np.zeros(0)
+        depth = np.sum(elements.depth(), dtype=self.dtype)
+        return sums_characteristics(
+            elements.counts,
+            sums,
+            depth,
+            characteristics,
+            self.dtype,
+            volume=lambda: np.power(2, depth, dtype=self.dtype),
+        )
+
+    def arithmetic_mean(self):
+        """
+        Same as [foapy.characteristics.arithmetic_mean()][foapy.characteristics.arithmetic_mean]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["arithmetic_mean"])["arithmetic_mean"]
+
+    def average_remoteness(self):
+        """
+        Same as [foapy.characteristics.average_remoteness()][foapy.characteristics.average_remoteness]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["average_remoteness"])["average_remoteness"]
+
+    def depth(self):
+        """
+        Same as [foapy.characteristics.depth()][foapy.characteristics.depth]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["depth"])["depth"]
+
+    def descriptive_information(self):
+        """
+        Same as [foapy.characteristics.descriptive_information()][foapy.characteristics.descriptive_information]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["descriptive_information"])["descriptive_information"]
+
+    def geometric_mean(self):
+        """
+        Same as [foapy.characteristics.geometric_mean()][foapy.characteristics.geometric_mean]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["geometric_mean"])["geometric_mean"]
+
+    def identifying_information(self):
+        """
+        Same as [foapy.characteristics.identifying_information()][foapy.characteristics.identifying_information]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["identifying_information"])["identifying_information"]
+
+    def regularity(self):
+        """
+        Same as [foapy.characteristics.regularity()][foapy.characteristics.regularity]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["regularity"])["regularity"]
+
+    def uniformity(self):
+        """
+        Same as [foapy.characteristics.uniformity()][foapy.characteristics.uniformity]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return self.profile(["uniformity"])["uniformity"]
+
+    def volume(self):
+        """
+        Same as [foapy.characteristics.volume()][foapy.characteristics.volume]
+        of the accumulated intervals, derived from the depth as a float.
+        """  # noqa: E501
+        return self.profile(["volume"])["volume"]
@@ -57,8 +57,14 @@ def arithmetic_mean(intervals, dtype=None):
 
     n = len(intervals)
 
-    # Check for an empty list or a list with zeros
-    if n == 0 or all(x == 0 for x in intervals):
+    # Check for an empty list
+    if n == 0:
         return 0
 
-    return np.sum(intervals, dtype=dtype) / n
+    total = np.sum(intervals, dtype=dtype)
+
+    # Intervals are non-negative, so zero sum means a list with zeros
+    if total == 0:
+        return 0
+
+    return total / n
@@ -1,4 +1,7 @@
-def average_remoteness(intervals, dtype=None):
+import numpy as np
+
+
+def average_remoteness(intervals, dtype=None, workspace=None):
     """
     Calculates average remoteness of intervals.
 
@@ -14,6 +17,9 @@ def average_remoteness(intervals, dtype=None):
         An array of intervals
     dtype : dtype, optional
         The dtype of the output
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] holding the buffer for logarithms
+        of intervals between calls
 
     Returns
     -------
@@ -45,8 +51,15 @@ def average_remoteness(intervals, dtype=None):
 
     n = len(intervals)
 
-    # Check for an empty list or a list with zeros
-    if n == 0 or all(x == 0 for x in intervals):
+    # Check for an empty list
+    if n == 0:
+        return 0
+
+    with np.errstate(divide="ignore"):
+        depth_value = depth(intervals, dtype=dtype, workspace=workspace)
+
+    # Zero intervals turn depth into -inf, only then check for a list with zeros
+    if np.isneginf(depth_value) and not np.any(intervals):
         return 0
 
-    return depth(intervals, dtype=dtype) / n
+    return depth_value / n
@@ -1,7 +1,9 @@
 import numpy as np
 
+from foapy.characteristics.ma._segments import log2_values
 
-def depth(intervals, dtype=None):
+
+def depth(intervals, dtype=None, workspace=None):
     """
     Calculates depth of intervals.
 
@@ -16,6 +18,9 @@ def depth(intervals, dtype=None):
         An array of intervals
     dtype : dtype, optional
         The dtype of the output.
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] holding the buffer for logarithms
+        of intervals between calls
 
     Returns
     -------
@@ -43,4 +48,4 @@ def depth(intervals, dtype=None):
     # 7.5849625007211561815
     ```
     """
-    return np.sum(np.log2(intervals, dtype=dtype), dtype=dtype)
+    return np.sum(log2_values(intervals, dtype, workspace), dtype=dtype)
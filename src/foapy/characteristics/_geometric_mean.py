@@ -1,7 +1,7 @@
 import numpy as np
 
 
-def geometric_mean(intervals, dtype=None):
+def geometric_mean(intervals, dtype=None, workspace=None):
     """
     Calculates average geometric value of intervals lengths.
 
@@ -16,6 +16,9 @@ def geometric_mean(intervals, dtype=None):
         An array of intervals
     dtype : dtype, optional
         The dtype of the output
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] holding the buffer for logarithms
+        of intervals between calls
 
     Returns
     -------
@@ -45,10 +48,17 @@ def geometric_mean(intervals, dtype=None):
     """
     n = len(intervals)
 
-    # Check for an empty list or a list with zeros
-    if n == 0 or all(x == 0 for x in intervals):
+    # Check for an empty list
+    if n == 0:
         return 0
 
     from foapy.characteristics import depth
 
-    return np.power(2, depth(intervals, dtype=dtype) / n, dtype=dtype)
+    with np.errstate(divide="ignore"):
+        depth_value = depth(intervals, dtype=dtype, workspace=workspace)
+
+    # Zero intervals turn depth into -inf, only then check for a list with zeros
+    if np.isneginf(depth_value) and not np.any(intervals):
+        return 0
+
+    return np.power(2, depth_value / n, dtype=dtype)
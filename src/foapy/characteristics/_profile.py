@@ -0,0 +1,170 @@
+import numpy as np
+
+from foapy.characteristics.ma._segments import as_ragged, segment_sum
+
+characteristics_names = (
+    "arithmetic_mean",
+    "average_remoteness",
+    "depth",
+    "descriptive_information",
+    "geometric_mean",
+    "identifying_information",
+    "regularity",
+    "uniformity",
+    "volume",
+)
+
+
+def profile(intervals_grouped, characteristics=None, dtype=None):
+    """
+    Calculates several characteristics of intervals grouped by element of the alphabet at once.
+
+    Every characteristic is derived from the same intermediate values
+    computed in a single pass over the intervals: counts of intervals
+    \\( n \\) and \\( n_j \\), the sum of logarithms
+    \\( \\sum_{i=1}^{n} \\log_2 \\Delta_{i} \\) and the sums of intervals
+    per element \\( \\sum_{i=1}^{n_j} \\Delta_{ij} \\).
+    The intervals are concatenated and logarithmized only once,
+    while separate calls of [depth][foapy.characteristics.depth],
+    [regularity][foapy.characteristics.regularity],
+    [uniformity][foapy.characteristics.uniformity], etc. repeat that work.
+
+    Parameters
+    ----------
+    intervals_grouped : array_like or RaggedArray
+        An array of intervals grouped by element
+        or [RaggedArray][foapy.core.RaggedArray] returned by
+        [foapy.ma.intervals()][foapy.ma.intervals]
+    characteristics : iterable of str, optional
+        Names of characteristics to calculate. All characteristics
+        are calculated by default: arithmetic_mean, average_remoteness,
+        depth, descriptive_information, geometric_mean, identifying_information,
+        regularity, uniformity and volume.
+    dtype : dtype, optional
+        The dtype of the output
+
+    Returns
+    -------
+    : dict
+        Values of the requested characteristics by their names.
+
+    Raises
+    -------
+    ValueError
+        When a characteristic name is unknown
+
+    Examples
+    --------
+
+    Calculate characteristics of a sequence.
+
+    ``` py linenums="1"
+    import foapy
+    import numpy as np
+
+    source = np.array(['a', 'b', 'a', 'c', 'a', 'd'])
+    order = foapy.ma.order(source)
+    intervals_grouped = foapy.ma.intervals(order, foapy.binding.start, foapy.mode.normal)
+
+    result = foapy.characteristics.profile(
+        intervals_grouped, ["depth", "regularity", "uniformity"]
+    )
+    print(result)
+    # {'depth': 7.584962500721156, 'regularity': 0.9759306487558015, 'uniformity': 0.035149463749769794}
+    ```
+    """  # noqa: E501
+
+    characteristics = characteristics_list(characteristics)
+
+    intervals = as_ragged(intervals_grouped)
+    data = intervals.data
+    sums = segment_sum(data, intervals.offsets, dtype=dtype)
+    depth = np.sum(np.log2(data, dtype=dtype), dtype=dtype)
+    return sums_characteristics(
+        intervals.lengths,
+        sums,
+        depth,
+        characteristics,
+        dtype,
+        volume=lambda: np.prod(data, dtype=dtype),
+    )
+
+
+def characteristics_list(characteristics):
+    """
+    List names of the requested characteristics, all of them by default.
+    """
+    if characteristics is None:
+        return list(characteristics_names)
+    characteristics = list(characteristics)
+    unknown = [c for c in characteristics if c not in characteristics_names]
+    if len(unknown) != 0:
+        raise ValueError({"message": f"Unknown characteristics {unknown}."})
+    return characteristics
+
+
+def sums_characteristics(n_j, sums, depth, characteristics, dtype, volume):
+    """
+    Derive characteristics from counts and sums of intervals of every element
+    and the sum of logarithms of all intervals.
+    """
+    n = int(np.sum(n_j))
+    total = np.sum(sums, dtype=dtype) if n != 0 else 0
+    not_empty = n_j != 0
+    information = (
+        np.sum(
+            n_j[not_empty] * np.log2(sums[not_empty] / n_j[not_empty], dtype=dtype),
+            dtype=dtype,
+        )
+        if n != 0
+        else 0
+    )
+    values = derive_characteristics(
+        n, total, depth, information, characteristics, dtype, volume
+    )
+    return {name: value[()] for name, value in values.items()}
+
+
+def derive_characteristics(
+    n, total, depth, information, characteristics, dtype, volume
+):
+    """
+    Derive characteristics from the count, the sum and the sum of logarithms
+    of intervals and the sum over elements of counts of their intervals
+    multiplied by logarithms of their mean intervals. Arguments are scalars
+    or arrays of values of several sequences, volume is a callable.
+
+    Means and logarithms are guarded the same way as in the separate
+    characteristics: empty or zero intervals give zero.
+    """
+    n = np.asarray(n)
+    depth = np.asarray(depth, dtype=dtype)
+    has_intervals = (n != 0) & (np.asarray(total) != 0)
+    safe_n = np.where(n != 0, n, 1)
+    zero = np.zeros_like(depth)
+
+    identifying_information = np.where(
+        n != 0, np.divide(information, safe_n, dtype=depth.dtype), zero
+    )
+    average_remoteness = np.where(
+        has_intervals, np.divide(depth, safe_n, dtype=depth.dtype), zero
+    )
+    geometric_mean = np.where(
+        has_intervals, np.power(2, average_remoteness, dtype=depth.dtype), zero
+    )
+    descriptive_information = np.power(2, identifying_information, dtype=depth.dtype)
+
+    values = {
+        "arithmetic_mean": lambda: np.where(
+            has_intervals, np.divide(total, safe_n, dtype=depth.dtype), zero
+        ),
+        "average_remoteness": lambda: average_remoteness,
+        "depth": lambda: depth,
+        "descriptive_information": lambda: descriptive_information,
+        "geometric_mean": lambda: geometric_mean,
+        "identifying_information": lambda: identifying_information,
+        "regularity": lambda: geometric_mean / descriptive_information,
+        "uniformity": lambda: identifying_information - average_remoteness,
+        "volume": lambda: np.asarray(volume()),
+    }
+    return {name: values[name]() for name in characteristics}
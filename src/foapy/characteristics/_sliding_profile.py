@@ -0,0 +1,236 @@
+import numpy as np
+
+from foapy.characteristics._profile import (
+    characteristics_list,
+    derive_characteristics,
+)
+from foapy.core import binding as constants_binding
+from foapy.core import mode as constants_mode
+from foapy.core._intervals import validate_intervals_args
+from foapy.core._sort import sort_groups
+from foapy.exceptions import Not1DArrayException
+
+# Count of (window, element) pairs processed at once, bounds the memory
+block_pairs = 2**22
+
+
+def sliding_profile(
+    X,
+    window,
+    step=1,
+    characteristics=None,
+    binding=constants_binding.start,
+    mode=constants_mode.normal,
+    dtype=None,
+):
+    """
+    Calculate characteristics of every window of a sequence.
+
+    Windows `X[k * step : k * step + window]` are not decomposed one by one.
+    Intervals of an element inside a window are the distances between
+    its consecutive occurrences, which are the same for all windows
+    containing both occurrences, plus the boundary intervals of its first
+    and last occurrences in the window. The sequence is sorted once,
+    sums of logarithms of the distances are accumulated along it,
+    and every window gets the sums of intervals of every element present
+    in it from the first and the last occurrence of the element
+    in the window.
+
+    The work is proportional to the length of the sequence plus
+    the count of distinct elements summed over the windows, instead of
+    a sort of every window by [foapy.intervals()][foapy.intervals].
+
+    Parameters
+    ----------
+    X : array_like
+        Sequence to calculate characteristics of its windows.
+        Must be a 1-dimensional array.
+    window : int
+        Length of the windows.
+    step : int, optional
+        Distance between starts of neighbouring windows, 1 by default.
+    characteristics : iterable of str, optional
+        Names of characteristics to calculate, all characteristics
+        of [foapy.characteristics.profile()][foapy.characteristics.profile]
+        by default. Volume is calculated as `2 ** depth`.
+    binding : int, optional
+        Binding of the intervals, [start][foapy.binding.start] by default.
+    mode : int, optional
+        Mode of the intervals, [normal][foapy.mode.normal] by default.
+    dtype : dtype, optional
+        The dtype of the sums of logarithms and of the characteristics.
+
+    Returns
+    -------
+    : dict
+        Arrays with values of the requested characteristics of every window
+        by their names.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not a 1-dimensional array
+
+    ValueError
+        When window, step, binding, mode or a characteristic name
+        is not valid
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    source = ['a', 'b', 'a', 'c', 'a', 'd', 'a', 'b']
+    result = foapy.characteristics.sliding_profile(source, 4, step=2, characteristics=["depth", "uniformity"])
+    print(result)
+    # {'depth': array([4., 4., 4.]), 'uniformity': array([0.04248125, 0.04248125, 0.04248125])}
+    ```
+    """  # noqa: E501
+
+    validate_intervals_args(binding, mode)
+    if isinstance(binding, (list, tuple)) or isinstance(mode, (list, tuple)):
+        raise ValueError(
+            {"message": "Sliding profile takes a single binding and mode."}
+        )
+    if window < 1 or step < 1:
+        message = f"Invalid window {window} or step {step}. Use positive integers."
+        raise ValueError({"message": message})
+    characteristics = characteristics_list(characteristics)
+
+    ar = np.asanyarray(X)
+    if ar.ndim != 1:
+        message = f"Incorrect array form. Expected d1 array, exists {ar.ndim}"
+        raise Not1DArrayException({"message": message})
+    length = ar.shape[0]
+    windows = (length - window) // step + 1 if length >= window else 0
+
+    sums = window_sums(ar, window, step, windows, binding, mode, dtype)
+    return window_characteristics(sums, characteristics, dtype)
+
+
+def window_sums(ar, window, step, windows, binding, mode, dtype):
+    """
+    Sums over elements present in every window: count of intervals,
+    sum of intervals, sum of logarithms of intervals and
+    sum of counts multiplied by logarithms of mean intervals.
+    """
+    log_dtype = np.log2(np.ones(1), dtype=dtype).dtype
+    counts = np.zeros(windows, dtype=np.int64)
+    totals = np.zeros(windows, dtype=np.int64)
+    depths = np.zeros(windows, dtype=log_dtype)
+    informations = np.zeros(windows, dtype=log_dtype)
+    if windows == 0:
+        return counts, totals, depths, informations
+
+    length = ar.shape[0]
+    perm, mask = sort_groups(ar)
+    group_starts = mask[:-1]
+    groups = np.cumsum(group_starts) - 1
+    # Positions grouped by element: searchsorted of (element, position) keys
+    keys = groups * (length + 1) + perm
+
+    # Logarithms of distances to the previous occurrence summed along the sort
+    distances = np.empty(length, dtype=np.intp)
+    distances[1:] = perm[1:] - perm[:-1]
+    distances[group_starts] = 1
+    log_prefix = np.zeros(length + 1, dtype=log_dtype)
+    np.cumsum(np.log2(distances, dtype=dtype), out=log_prefix[1:])
+    del distances
+
+    # Every occurrence is the first in the window of its element for
+    # the windows containing it, but not the previous occurrence
+    first_window = np.maximum(-((window - 1 - perm) // step), 0)
+    last_window = np.minimum(perm // step, windows - 1)
+    previous_last = np.empty(length, dtype=np.intp)
+    previous_last[1:] = last_window[:-1]
+    previous_last[group_starts] = -1
+    first_window = np.maximum(first_window, previous_last + 1)
+    del previous_last
+    pairs = np.maximum(last_window - first_window + 1, 0)
+    del last_window
+
+    pairs_offsets = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum(pairs, out=pairs_offsets[1:])
+    bounds = np.searchsorted(
+        pairs_offsets, np.arange(0, pairs_offsets[-1], block_pairs), side="right"
+    )
+    bounds = np.append(bounds - 1, length)
+
+    for begin, end in zip(bounds[:-1], bounds[1:]):
+        block = np.arange(begin, end)
+        block_counts = pairs[begin:end]
+        size = int(block_counts.sum())
+        lo = np.repeat(block, block_counts)
+        # Windows of every pair run from first_window of its occurrence
+        shift = np.repeat(
+            first_window[begin:end] - (pairs_offsets[begin:end] - pairs_offsets[begin]),
+            block_counts,
+        )
+        k = shift + np.arange(size)
+        del shift
+        start = k * step
+        hi = np.searchsorted(keys, groups[lo] * (length + 1) + start + window)
+
+        first = perm[lo] - start
+        last = perm[hi - 1] - start
+        n_j = hi - lo
+        log_j = log_prefix[hi] - log_prefix[lo + 1]
+        if mode == constants_mode.lossy:
+            n_j = n_j - 1
+            s_j = last - first
+        elif mode == constants_mode.cycle:
+            s_j = np.full(size, window)
+            log_j += np.log2(window - last + first, dtype=dtype)
+        elif mode == constants_mode.redundant:
+            n_j = n_j + 1
+            s_j = np.full(size, window + 1)
+            log_j += np.log2(first + 1, dtype=dtype)
+            log_j += np.log2(window - last, dtype=dtype)
+        elif binding == constants_binding.start:
+            s_j = last + 1
+            log_j += np.log2(first + 1, dtype=dtype)
+        else:
+            s_j = window - first
+            log_j += np.log2(window - last, dtype=dtype)
+
+        not_empty = n_j != 0
+        information = np.zeros(size, dtype=log_dtype)
+        information[not_empty] = n_j[not_empty] * np.log2(
+            s_j[not_empty] / n_j[not_empty], dtype=dtype
+        )
+
+        counts += np.bincount(k, weights=n_j, minlength=windows).astype(np.int64)
+        totals += np.bincount(k, weights=s_j, minlength=windows).astype(np.int64)
+        depths += accumulate(k, log_j, windows)
+        informations += accumulate(k, information, windows)
+
+    return counts, totals, depths, informations
+
+
+def accumulate(k, values, windows):
+    """
+    Sum values by window keeping their dtype, bincount sums in float64 only.
+    """
+    if values.dtype == np.float64:
+        return np.bincount(k, weights=values, minlength=windows)
+    result = np.zeros(windows, dtype=values.dtype)
+    np.add.at(result, k, values)
+    return result
+
+
+def window_characteristics(sums, characteristics, dtype):
+    """
+    Derive characteristics of every window from its sums the same way
+    as [foapy.characteristics.profile()][foapy.characteristics.profile].
+    """
+    n, total, depth, information = sums
+    return derive_characteristics(
+        n,
+        total,
+        depth,
+        information,
+        characteristics,
+        dtype,
+        volume=lambda: np.power(2, depth, dtype=dtype),
+    )
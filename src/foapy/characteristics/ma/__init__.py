@@ -10,6 +10,7 @@ except NameError:
 if __FOAPY_SETUP__:
     sys.stderr.write("Running from foapy.characteristics.ma source directory.\n")
 else:
+    from ._accumulator import Accumulator  # noqa: F401
     from ._arithmetic_mean import arithmetic_mean  # noqa: F401
     from ._average_remoteness import average_remoteness  # noqa: F401
     from ._depth import depth  # noqa: F401
@@ -21,6 +22,7 @@ else:
 
     __all__ = list(
         {
+            "Accumulator",
             "volume",
             "arithmetic_mean",
             "geometric_mean",
@@ -0,0 +1,258 @@
+import numpy as np
+from numpy import ndarray
+
+from foapy.characteristics.ma._segments import (
+    as_ragged,
+    log2_values,
+    segment_mean,
+    segment_sum,
+)
+
+
+class Accumulator:
+    """
+    Running sums of congeneric intervals of every element of the alphabet.
+
+    The characteristics of [foapy.characteristics.ma][foapy.characteristics.ma]
+    depend on intervals of an element only through their count, sum
+    and sum of logarithms, the volume is kept in the log form as the sum
+    of logarithms and does not overflow. An accumulator keeps these three
+    values per element, so intervals can be fed by chunks and accumulators
+    of partitions of a sequence can be merged, without materializing
+    all intervals at once.
+
+    Elements are identified by their indexes in the alphabet: the same index
+    must denote the same element in every chunk and every merged accumulator.
+
+    Parameters
+    ----------
+    dtype : dtype, optional
+        The dtype of the sums and the characteristics.
+
+    Examples
+    --------
+
+    Accumulate intervals of a sequence given by chunks.
+
+    ``` py linenums="1"
+    import foapy
+
+    stream = foapy.IntervalsStream(foapy.mode.normal)
+    accumulator = foapy.characteristics.ma.Accumulator()
+    for chunk in [['a', 'b', 'a'], ['c', 'a', 'd']]:
+        accumulator.update(*stream.update(chunk, return_order=True))
+    print(accumulator.arithmetic_mean())
+    # [1.66666667 2.         4.         6.        ]
+    ```
+
+    Merge accumulators of two partitions.
+
+    ``` py linenums="1"
+    import foapy
+
+    left = foapy.characteristics.ma.Accumulator()
+    left.update([[1, 2], [2]])
+    right = foapy.characteristics.ma.Accumulator()
+    right.update([[4], [1], [3]])
+    left.merge(right)
+    print(left.volume())
+    # [8. 2. 3.]
+    ```
+    """  # noqa: E501
+
+    def __init__(self, dtype=None):
+        self.dtype = dtype
+        self.counts = np.zeros(0, dtype=np.intp)
+        self.sums = None
+        self.log_sums = None
+
+    def __len__(self):
+        return self.counts.shape[0]
+
+    def update(self, intervals, order=None, power=None):
+        """
+        Add intervals to the sums of their elements.
+
+        Parameters
+        ----------
+        intervals : array_like or RaggedArray
+            An array of intervals grouped by element
+            or [RaggedArray][foapy.core.RaggedArray] returned by
+            [foapy.ma.intervals()][foapy.ma.intervals]. A flat array
+            of intervals when order is given.
+        order : array_like, optional
+            Indexes of the elements of the intervals in the alphabet,
+            as returned by [IntervalsStream][foapy.IntervalsStream].
+        power : int, optional
+            Count of elements in the alphabet. Elements without intervals,
+            e.g. occurring once in [lossy][foapy.mode.lossy] mode,
+            are counted only up to the largest index otherwise.
+
+        Raises
+        -------
+        ValueError
+            When intervals and order have different lengths
+        """
+        if order is not None:
+            intervals = np.asanyarray(intervals)
+            order = np.asanyarray(order, dtype=np.intp)
+            if intervals.shape != order.shape:
+                message = (
+                    f"Intervals and order have different lengths "
+                    f"{intervals.shape} and {order.shape}"
+                )
+                raise ValueError({"message": message})
+            # Group the intervals by element
+            perm = np.argsort(order, kind="stable")
+            data = intervals[perm]
+            counts = np.bincount(order, minlength=power or 0)
+            offsets = np.zeros(counts.shape[0] + 1, dtype=np.intp)
+            np.cumsum(counts, out=offsets[1:])
+        else:
+            grouped = as_ragged(intervals)
+            offsets = grouped.offsets - grouped.offsets[0]
+            data = grouped.data[grouped.offsets[0] : grouped.offsets[-1]]
+            counts = grouped.lengths
+
+        if power is not None and counts.shape[0] < power:
+            counts = grow(counts, power, 0, counts.dtype)
+            offsets = grow(offsets, power + 1, offsets[-1], offsets.dtype)
+
+        self._add(
+            counts,
+            segment_sum(data, offsets, dtype=self.dtype),
+            segment_sum(log2_values(data, self.dtype), offsets, dtype=self.dtype),
+        )
+
+    def merge(self, other):
+        """
+        Add sums of another accumulator, e.g. of the next partition
+        of the sequence.
+
+        Parameters
+        ----------
+        other : Accumulator
+            Accumulator with the same indexes of the elements.
+        """
+        if other.sums is None:
+            return
+        self._add(other.counts, other.sums, other.log_sums)
+
+    def _add(self, counts, sums, log_sums):
+        size = max(len(self), counts.shape[0])
+        self.counts = grow(self.counts, size, 0, counts.dtype)
+        self.sums = grow(self.sums, size, 0, sums.dtype)
+        self.log_sums = grow(self.log_sums, size, 0, log_sums.dtype)
+
+        self.counts[: counts.shape[0]] += counts
+        self.sums[: sums.shape[0]] += sums
+        self.log_sums[: log_sums.shape[0]] += log_sums
+
+    def arithmetic_mean(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.arithmetic_mean()][foapy.characteristics.ma.arithmetic_mean]
+        of the accumulated intervals.
+        """  # noqa: E501
+        if self.sums is None:
+            return np.zeros(0)
+        return segment_mean(self.sums, self.counts)
+
+    def depth(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.depth()][foapy.characteristics.ma.depth]
+        of the accumulated intervals.
+        """  # noqa: E501
+        if self.log_sums is None:
+            return np.zeros(0)
+        return self.log_sums
+
+    def average_remoteness(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.average_remoteness()][foapy.characteristics.ma.average_remoteness]
+        of the accumulated intervals.
+        """  # noqa: E501
+        depth = self.depth()
+        return np.divide(
+            depth,
+            self.counts,
+            out=np.zeros_like(depth),
+            where=self.counts != 0,
+            dtype=self.dtype,
+        )
+
+    def geometric_mean(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.geometric_mean()][foapy.characteristics.ma.geometric_mean]
+        of the accumulated intervals.
+        """  # noqa: E501
+        average_remoteness = self.average_remoteness()
+        return np.power(
+            2,
+            average_remoteness,
+            out=np.zeros_like(average_remoteness),
+            where=self.counts != 0,
+            dtype=self.dtype,
+        )
+
+    def identifying_information(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.identifying_information()][foapy.characteristics.ma.identifying_information]
+        of the accumulated intervals.
+        """  # noqa: E501
+        arithmetic_mean = self.arithmetic_mean()
+        return np.log2(
+            arithmetic_mean,
+            out=np.zeros_like(arithmetic_mean),
+            where=self.counts != 0,
+            dtype=self.dtype,
+        )
+
+    def periodicity(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.periodicity()][foapy.characteristics.ma.periodicity]
+        of the accumulated intervals.
+        """  # noqa: E501
+        geometric_mean = self.geometric_mean()
+        arithmetic_mean = self.arithmetic_mean()
+        return np.divide(
+            geometric_mean,
+            arithmetic_mean,
+            out=np.zeros_like(geometric_mean),
+            where=arithmetic_mean != 0.0,
+            dtype=self.dtype,
+        )
+
+    def uniformity(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.uniformity()][foapy.characteristics.ma.uniformity]
+        of the accumulated intervals.
+        """  # noqa: E501
+        return np.subtract(
+            self.identifying_information(),
+            self.average_remoteness(),
+            dtype=self.dtype,
+        )
+
+    def volume(self) -> ndarray:
+        """
+        Same as [foapy.characteristics.ma.volume()][foapy.characteristics.ma.volume]
+        of the accumulated intervals, derived from the sum of logarithms
+        as a float.
+        """  # noqa: E501
+        if self.log_sums is None:
+            return np.ones(0)
+        return np.power(2, self.log_sums, dtype=self.dtype)
+
+
+def grow(values, size, fill, dtype):
+    """
+    Extend values to size items with fill value, promoting them to hold dtype.
+    """
+    if values is None:
+        values = np.empty(0, dtype=dtype)
+    dtype = np.result_type(values, dtype)
+    if values.shape[0] >= size and values.dtype == dtype:
+        return values
+    result = np.full(max(size, values.shape[0]), fill, dtype=dtype)
+    result[: values.shape[0]] = values
+    return result
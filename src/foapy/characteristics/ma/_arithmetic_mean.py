@@ -1,4 +1,8 @@
-import numpy as np
+from foapy.characteristics.ma._segments import (
+    as_ragged,
+    segment_mean,
+    segment_sum,
+)
 
 
 def arithmetic_mean(intervals, dtype=None):
@@ -18,8 +22,9 @@ def arithmetic_mean(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
 
@@ -61,9 +66,6 @@ def arithmetic_mean(intervals, dtype=None):
     ```
     """  # noqa: W605
 
-    return np.asanyarray(
-        [
-            np.sum(line, dtype=dtype) / len(line) if len(line) != 0 else 0
-            for line in intervals
-        ]
-    )
+    intervals = as_ragged(intervals)
+    sums = segment_sum(intervals.data, intervals.offsets, dtype=dtype)
+    return segment_mean(sums, intervals.lengths)
@@ -1,7 +1,9 @@
 import numpy as np
 
+from foapy.characteristics.ma._segments import as_ragged
 
-def average_remoteness(intervals, dtype=None):
+
+def average_remoteness(intervals, dtype=None, workspace=None):
     """
     Calculates average remoteness of the intervals grouped by congeneric sequence.
 
@@ -19,10 +21,14 @@ def average_remoteness(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] holding the buffer for logarithms
+        of intervals between calls
 
     Returns
     -------
@@ -64,8 +70,9 @@ def average_remoteness(intervals, dtype=None):
 
     from foapy.characteristics.ma import depth
 
-    size = np.array([len(elem) for elem in intervals])
-    depth_seq = depth(intervals, dtype=dtype)
+    intervals = as_ragged(intervals)
+    size = intervals.lengths
+    depth_seq = depth(intervals, dtype=dtype, workspace=workspace)
     res = np.divide(
         depth_seq,
         size,
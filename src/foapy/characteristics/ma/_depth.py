@@ -1,7 +1,7 @@
-import numpy as np
+from foapy.characteristics.ma._segments import as_ragged, log2_values, segment_sum
 
 
-def depth(intervals, dtype=None):
+def depth(intervals, dtype=None, workspace=None):
     """
     Calculates depth of the intervals grouped by congeneric sequence.
 
@@ -17,10 +17,14 @@ def depth(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] holding the buffer for logarithms
+        of intervals between calls
 
     Returns
     -------
@@ -59,6 +63,6 @@ def depth(intervals, dtype=None):
     # [4.        3.169925  3.9068906]
     ```
     """  # noqa: W605
-    return np.asanyarray(
-        [np.sum(np.log2(line, dtype=dtype), dtype=dtype) for line in intervals]
-    )
+    intervals = as_ragged(intervals)
+    log2_intervals = log2_values(intervals.data, dtype, workspace)
+    return segment_sum(log2_intervals, intervals.offsets, dtype=dtype)
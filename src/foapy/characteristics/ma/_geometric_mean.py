@@ -1,7 +1,9 @@
 import numpy as np
 
+from foapy.characteristics.ma._segments import as_ragged
 
-def geometric_mean(intervals, dtype=None):
+
+def geometric_mean(intervals, dtype=None, workspace=None):
     """
     Calculates average geometric values of the intervals grouped by congeneric sequence.
 
@@ -19,10 +21,14 @@ def geometric_mean(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] holding the buffer for logarithms
+        of intervals between calls
 
     Returns
     -------
@@ -61,17 +67,16 @@ def geometric_mean(intervals, dtype=None):
     # [2.         2.08008382 2.46621207]
     ```
     """  # noqa: W605
-    return np.asanyarray(
-        [
-            (
-                np.power(
-                    2,
-                    np.sum(np.log2(line, dtype=dtype), dtype=dtype) / len(line),
-                    dtype=dtype,
-                )  # noqa: E501 E261
-                if len(line) != 0
-                else 0
-            )
-            for line in intervals
-        ]
+    from foapy.characteristics.ma import average_remoteness
+
+    intervals = as_ragged(intervals)
+    average_remoteness_seq = average_remoteness(
+        intervals, dtype=dtype, workspace=workspace
+    )
+    return np.power(
+        2,
+        average_remoteness_seq,
+        out=np.zeros_like(average_remoteness_seq),
+        where=intervals.lengths != 0,
+        dtype=dtype,
     )
@@ -1,5 +1,7 @@
 import numpy as np
 
+from foapy.characteristics.ma._segments import as_ragged
+
 
 def identifying_information(intervals, dtype=None):
     """
@@ -20,8 +22,9 @@ def identifying_information(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
 
@@ -63,10 +66,13 @@ def identifying_information(intervals, dtype=None):
     ```
     """  # noqa: W605
 
-    return np.asanyarray(
-        [
-            np.log2(np.mean(line, dtype=dtype), dtype=dtype) if len(line) != 0 else 0
-            for line in intervals
-        ],
+    from foapy.characteristics.ma import arithmetic_mean
+
+    intervals = as_ragged(intervals)
+    arithmetic_mean_seq = arithmetic_mean(intervals, dtype=dtype)
+    return np.log2(
+        arithmetic_mean_seq,
+        out=np.zeros_like(arithmetic_mean_seq),
+        where=intervals.lengths != 0,
         dtype=dtype,
     )
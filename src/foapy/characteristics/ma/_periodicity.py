@@ -1,5 +1,7 @@
 import numpy as np
 
+from foapy.characteristics.ma._segments import as_ragged
+
 
 def periodicity(intervals, dtype=None):
     """
@@ -20,8 +22,9 @@ def periodicity(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
 
@@ -65,6 +68,7 @@ def periodicity(intervals, dtype=None):
 
     from foapy.characteristics.ma import arithmetic_mean, geometric_mean
 
+    intervals = as_ragged(intervals)
     geometric_mean_seq = geometric_mean(intervals, dtype=dtype)
     arithmetic_mean_seq = arithmetic_mean(intervals, dtype=dtype)
     return np.divide(
@@ -0,0 +1,59 @@
+import numpy as np
+
+from foapy.core import RaggedArray
+
+
+def as_ragged(intervals):
+    """
+    Represent congeneric intervals as one flat buffer plus offsets.
+
+    RaggedArray inputs are returned as is, lists of arrays are
+    concatenated once.
+    """
+    return RaggedArray.from_arrays(intervals)
+
+
+def segment_reduce(ufunc, values, offsets, initial, dtype=None):
+    """
+    Reduce every `values[offsets[j]:offsets[j + 1]]` segment with ufunc.
+
+    Unlike plain `ufunc.reduceat`, empty segments are reduced
+    to `initial` value.
+    """
+    lengths = np.diff(offsets)
+    not_empty = lengths != 0
+    if np.all(not_empty) and len(values) != 0:
+        return ufunc.reduceat(values, offsets[:-1], dtype=dtype)
+
+    result_dtype = dtype if dtype is not None else ufunc.reduce(values[:0]).dtype
+    result = np.full(lengths.shape, initial, dtype=result_dtype)
+    if len(values) != 0:
+        result[not_empty] = ufunc.reduceat(values, offsets[:-1][not_empty], dtype=dtype)
+    return result
+
+
+def segment_sum(values, offsets, dtype=None):
+    """
+    Sum of every segment, zero for empty segments.
+    """
+    return segment_reduce(np.add, values, offsets, 0, dtype=dtype)
+
+
+def segment_mean(sums, lengths):
+    """
+    Divide segment sums by segment lengths, zero for empty segments.
+    """
+    result = np.zeros(lengths.shape, dtype=np.result_type(sums, 1.0))
+    return np.divide(sums, lengths, out=result, where=lengths != 0)
+
+
+def log2_values(values, dtype=None, workspace=None):
+    """
+    Logarithms of values, placed into the workspace buffer when it is given.
+    """
+    if workspace is None:
+        return np.log2(values, dtype=dtype)
+    values = np.asanyarray(values)
+    result_dtype = np.log2(values[:0], dtype=dtype).dtype
+    out = workspace.buffer("log2", values.shape[0], result_dtype)
+    return np.log2(values, dtype=dtype, out=out)
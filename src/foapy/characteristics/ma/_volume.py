@@ -1,5 +1,7 @@
 import numpy as np
 
+from foapy.characteristics.ma._segments import as_ragged, segment_reduce
+
 
 def volume(intervals, dtype=None):
     """
@@ -19,8 +21,9 @@ def volume(intervals, dtype=None):
 
     Parameters
     ----------
-    intervals : array_like
-        An array of congeneric intervals array
+    intervals : array_like or RaggedArray
+        An array of congeneric intervals array or [RaggedArray][foapy.core.RaggedArray]
+        with intervals of all congeneric sequences in one buffer
     dtype : dtype, optional
         The dtype of the output
 
@@ -62,4 +65,7 @@ def volume(intervals, dtype=None):
     ```
     """  # noqa: W605
 
-    return np.asanyarray([np.prod(line, dtype=dtype) for line in intervals])
+    intervals = as_ragged(intervals)
+    return segment_reduce(
+        np.multiply, intervals.data, intervals.offsets, 1, dtype=dtype
+    )
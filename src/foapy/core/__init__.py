@@ -11,15 +11,36 @@ if __FOAPY_SETUP__:
     sys.stderr.write("Running from foapy.core source directory.\n")
 else:
     # isort: off
+    from ._workspace import Workspace  # noqa: F401
     from ._alphabet import alphabet  # noqa: F401
     from ._binding import binding  # noqa: F401
     from ._mode import mode  # noqa: F401
     from ._intervals import intervals  # noqa: F401
+    from ._intervals_stream import IntervalsStream  # noqa: F401
+    from ._mapped import mapped_intervals, mapped_order  # noqa: F401
     from ._order import order  # noqa: F401
+    from ._parallel_intervals import parallel_intervals  # noqa: F401
+    from ._prepared_sequence import PreparedSequence  # noqa: F401
+    from ._ragged import RaggedArray  # noqa: F401
 
     # isort: on
 
-    __all__ = list({"binding", "mode", "intervals", "order", "alphabet"})
+    __all__ = list(
+        {
+            "binding",
+            "mode",
+            "intervals",
+            "parallel_intervals",
+            "mapped_intervals",
+            "mapped_order",
+            "order",
+            "alphabet",
+            "RaggedArray",
+            "Workspace",
+            "IntervalsStream",
+            "PreparedSequence",
+        }
+    )
 
     def __dir__():
         return __all__
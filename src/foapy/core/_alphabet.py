@@ -1,6 +1,7 @@
 import numpy as np
 from numpy import ndarray
 
+from foapy.core._sort import hash_order, hashed, sort_keys
 from foapy.exceptions import Not1DArrayException
 
 
@@ -73,12 +74,17 @@ def alphabet(X) -> ndarray:
             {"message": f"Incorrect array form. Expected d1 array, exists {data.ndim}"}
         )
 
-    perm = data.argsort(kind="mergesort")
+    grouped = hash_order(data) if hashed(data) else None
+    if grouped is not None:
+        return data[grouped[1]]
+
+    keys = sort_keys(data)
+    perm = keys.argsort(kind="mergesort")
 
     mask_shape = data.shape
     unique_mask = np.empty(mask_shape, dtype=bool)
     unique_mask[:1] = True
-    unique_mask[1:] = data[perm[1:]] != data[perm[:-1]]
+    unique_mask[1:] = keys[perm[1:]] != keys[perm[:-1]]
 
     result_mask = np.full_like(unique_mask, False)
     result_mask[:1] = True
@@ -3,9 +3,14 @@ from numpy import ndarray
 
 from foapy.core import binding as constants_binding
 from foapy.core import mode as constants_mode
+from foapy.core._sort import order_groups, sort_groups
+from foapy.core._workspace import scratch
+from foapy.exceptions import Not1DArrayException
 
 
-def intervals(X, binding: int, mode: int) -> ndarray:
+def intervals(
+    X, binding, mode, dtype=None, out=None, workspace=None, power=None
+) -> ndarray:
     """
     Function to extract intervals from a sequence.
 
@@ -29,10 +34,13 @@ def intervals(X, binding: int, mode: int) -> ndarray:
     ----------
     X: array_like
         Array to exctact an intervals from. Must be a 1-dimensional array.
-    binding: int
+    binding: int or list of int
         [start][foapy.binding.start] = 1 - Intervals are extracted from left to right.
         [end][foapy.binding.end] = 2 – Intervals are extracted from right to left.
-    mode: int
+
+        A list of bindings extracts intervals for each of them from one sort
+        of the sequence.
+    mode: int or list of int
         Mode handling the intervals at the sequence boundaries:
 
         [lossy][foapy.mode.lossy] = 1 - Both interval from the start of the sequence
@@ -62,10 +70,36 @@ def intervals(X, binding: int, mode: int) -> ndarray:
         sequence are taken into account. Their placement in results
         array is determined by the binding.
 
+        A list of modes extracts intervals for each of them in one pass.
+        Normal and redundant intervals share one buffer.
+    dtype: dtype or "auto", optional
+        Integer dtype of the intervals. Defaults to `np.intp`.
+        "auto" selects `int32` when the sequence is short enough
+        for every interval (and every sum of intervals of one element)
+        to fit into it and `int64` otherwise, halving the memory
+        of the intervals for sequences shorter than 2^31.
+    out: ndarray, optional
+        1-dimensional integer array to place the intervals into. It must be
+        at least as long as the result, which is returned as a view
+        of its beginning. Only a single binding and mode are allowed.
+        The dtype of out is used when dtype is not given.
+    workspace: Workspace, optional
+        [Workspace][foapy.Workspace] with scratch buffers reused between calls.
+    power: int, optional
+        Power of the alphabet when X is an order returned by
+        [foapy.order()][foapy.order]: integers from 0 to `power - 1`.
+        The order is grouped by radix sort keys of the width given
+        by the power and a table of counts of its elements, instead of
+        scanning and comparing the values. An order of 8 or 16-bit integers
+        is used without a copy.
+
     Returns
     -------
-    order : ndarray
-        Intervals extracted from the sequence
+    order : ndarray or list
+        Intervals extracted from the sequence.
+        List of intervals in order of bindings if a list of bindings is given,
+        list of intervals in order of modes if a list of modes is given,
+        a list per binding of lists per mode if both are lists.
 
     Raises
     -------
@@ -75,6 +109,17 @@ def intervals(X, binding: int, mode: int) -> ndarray:
     ValueError
         When binding or mode is not valid
 
+    ValueError
+        When dtype is not an integer dtype or is too narrow
+        for the sequence length
+
+    ValueError
+        When out is shorter than the intervals, has a different dtype
+        or is given together with lists of bindings or modes
+
+    ValueError
+        When power is given and X has values out of `0..power - 1`
+
     Examples
     --------
 
@@ -89,6 +134,44 @@ def intervals(X, binding: int, mode: int) -> ndarray:
     # [1 2 2 3 2 5]
     ```
 
+    Get intervals bound to both the start and the end with one sort of the sequence.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = ['a', 'b', 'a', 'c', 'a', 'd']
+    bindings = [foapy.binding.start, foapy.binding.end]
+    start, end = foapy.intervals(source, bindings, foapy.mode.normal)
+    print(start)
+    # [1 2 2 4 2 6]
+    print(end)
+    # [2 5 2 3 2 1]
+    ```
+
+    Get intervals for all modes and both bindings in one call.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = ['a', 'b', 'a', 'c', 'a', 'd']
+    bindings = [foapy.binding.start, foapy.binding.end]
+    modes = [foapy.mode.lossy, foapy.mode.normal, foapy.mode.cycle, foapy.mode.redundant]
+    report = foapy.intervals(source, bindings, modes)
+    print(report[0])
+    # [array([2, 2]), array([1, 2, 2, 4, 2, 6]), array([2, 6, 2, 6, 2, 6]), array([1, 2, 2, 4, 2, 6, 2, 5, 3, 1])]
+    ```
+
+    Get intervals of an order with a known power of the alphabet.
+
+    ``` py linenums="1"
+    import foapy
+
+    order, alphabet = foapy.order(['a', 'b', 'a', 'c', 'a', 'd'], True)
+    intervals = foapy.intervals(order, foapy.binding.start, foapy.mode.normal, power=len(alphabet))
+    print(intervals)
+    # [1 2 2 4 2 6]
+    ```
+
     Get intervals from a emprty sequence.
     ``` py linenums="1"
     import foapy
@@ -109,11 +192,75 @@ def intervals(X, binding: int, mode: int) -> ndarray:
     ```
     """  # noqa: E501
 
+    validate_intervals_args(binding, mode)
+
+    ar = np.asanyarray(X)
+    if out is not None:
+        if isinstance(binding, (list, tuple)) or isinstance(mode, (list, tuple)):
+            message = "Parameter out requires a single binding and mode."
+            raise ValueError({"message": message})
+        if dtype is None:
+            dtype = out.dtype
+        elif np.dtype(dtype) != out.dtype:
+            message = f"Incorrect out dtype. Expected {dtype}, exists {out.dtype}"
+            raise ValueError({"message": message})
+    dtype = intervals_dtype(dtype, ar.shape[0] if ar.ndim != 0 else 0)
+
+    if power is None:
+        perm, mask = sort_groups(ar, workspace)
+    else:
+        if ar.ndim != 1:
+            message = f"Incorrect array form. Expected d1 array, exists {ar.ndim}"
+            raise Not1DArrayException({"message": message})
+        perm, mask = order_groups(ar, power, workspace)
+    first_mask = mask[:-1]
+    last_mask = mask[1:]
+
+    return select_intervals(
+        perm, first_mask, last_mask, binding, mode, dtype, out, workspace
+    )
+
+
+def intervals_dtype(dtype, length):
+    """
+    Resolve the integer dtype of intervals of a sequence of the given length.
+
+    None gives `np.intp`, "auto" gives the narrowest of `int32`/`int64`
+    able to hold `length + 1`: the largest interval and the largest sum
+    of intervals of one element. Narrower dtypes are not chosen
+    automatically since logarithms of them are calculated in half
+    or single precision.
+    """
+    if dtype is None:
+        return np.dtype(np.intp)
+    if isinstance(dtype, str) and dtype == "auto":
+        if length + 1 <= np.iinfo(np.int32).max:
+            return np.dtype(np.int32)
+        return np.dtype(np.int64)
+
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu":
+        message = f"Invalid dtype {dtype}. Use an integer dtype or 'auto'."
+        raise ValueError({"message": message})
+    if length + 1 > np.iinfo(dtype).max:
+        message = f"Dtype {dtype} is too narrow for a sequence of length {length}."
+        raise ValueError({"message": message})
+    return dtype
+
+
+def validate_intervals_args(binding, mode):
+    """
+    Check that binding and mode (or every item of their lists) are valid.
+    """
+    bindings = binding if isinstance(binding, (list, tuple)) else [binding]
+    modes = mode if isinstance(mode, (list, tuple)) else [mode]
+
     # Validate binding
-    if binding not in {constants_binding.start, constants_binding.end}:
-        raise ValueError(
-            {"message": "Invalid binding value. Use binding.start or binding.end."}
-        )
+    for _binding in bindings:
+        if _binding not in {constants_binding.start, constants_binding.end}:
+            raise ValueError(
+                {"message": "Invalid binding value. Use binding.start or binding.end."}
+            )
 
     # Validate mode
     valid_modes = [
@@ -122,54 +269,146 @@ def intervals(X, binding: int, mode: int) -> ndarray:
         constants_mode.cycle,
         constants_mode.redundant,
     ]
-    if mode not in valid_modes:
-        raise ValueError(
-            {"message": "Invalid mode value. Use mode.lossy,normal,cycle or redundant."}
-        )
-
-    ar = np.asanyarray(X)
+    for _mode in modes:
+        if _mode not in valid_modes:
+            raise ValueError(
+                {
+                    "message": "Invalid mode value. Use mode.lossy,normal,cycle or redundant."  # noqa: E501
+                }
+            )
+
+
+def select_intervals(
+    perm, first_mask, last_mask, binding, mode, dtype, out=None, workspace=None
+):
+    """
+    Extract intervals for a binding and a mode or for lists of them.
 
-    if ar.shape == (0,):
-        return []
+    The result is nested the same way as the arguments: a list per binding
+    of lists per mode.
+    """
+    bindings = binding if isinstance(binding, (list, tuple)) else [binding]
+    modes = mode if isinstance(mode, (list, tuple)) else [mode]
 
-    if binding == constants_binding.end:
-        ar = ar[::-1]
+    result = []
+    for _binding in bindings:
+        by_mode = sorted_intervals(
+            perm, first_mask, last_mask, _binding, modes, dtype, out, workspace
+        )
+        result.append(by_mode if isinstance(mode, (list, tuple)) else by_mode[0])
 
-    perm = ar.argsort(kind="mergesort")
+    if isinstance(binding, (list, tuple)):
+        return result
+    return result[0]
 
-    mask_shape = ar.shape
-    mask = np.empty(mask_shape[0] + 1, dtype=bool)
-    mask[:1] = True
-    mask[1:-1] = ar[perm[1:]] != ar[perm[:-1]]
-    mask[-1:] = True  # or  mask[-1] = True
 
-    first_mask = mask[:-1]
-    last_mask = mask[1:]
+def sorted_intervals(
+    perm, first_mask, last_mask, binding, modes, dtype, out=None, workspace=None
+):
+    """
+    Extract intervals for several modes from the stable sort permutation.
+
+    Both bindings are derived from the same forward sort: intervals
+    bound to the start are distances to the previous occurrence of
+    the element, intervals bound to the end are distances to the next one.
+    Boundary intervals of the redundant mode follow the order of the sort.
+
+    Modes differ only at boundary positions, so the intervals are scattered
+    into the sequence order once, straight from the permutation:
+    normal intervals are a view into the redundant buffer, cycle intervals
+    are a copy patched at the first (or last) occurrences and lossy
+    intervals skip them.
+    """
+    length = perm.shape[0]
+    first = perm[first_mask]
+    last = perm[last_mask]
+    power = first.shape[0]
+
+    buffer = None
+    if constants_mode.redundant in modes:
+        buffer = result_buffer(out, length + power, dtype)
+        if binding == constants_binding.start:
+            normal = buffer[:length]
+            buffer[length:] = length - last
+        else:
+            normal = buffer[power:]
+            buffer[:power] = first + 1
+    elif set(modes) == {constants_mode.lossy}:
+        # Normal intervals are only an intermediate result
+        normal = scratch(workspace, "intervals", length, dtype)
+    else:
+        normal = result_buffer(out, length, dtype)
+
+    # Distances between neighbours of the sort are the intervals
+    # of all but the first (or last) occurrences of every element
+    distances = scratch(workspace, "distances", max(length - 1, 0), dtype)
+    np.subtract(perm[1:], perm[:-1], out=distances, casting="unsafe")
+    if binding == constants_binding.start:
+        normal[perm[1:]] = distances
+        del distances
+        normal[first] = first + 1
+    else:
+        normal[perm[:-1]] = distances
+        del distances
+        normal[last] = length - last
+
+    return boundary_modes(
+        normal, buffer, first, last, binding, modes, dtype, out, workspace
+    )
+
+
+def boundary_modes(
+    normal, buffer, first, last, binding, modes, dtype, out=None, workspace=None
+):
+    """
+    Derive intervals of every mode from the normal intervals.
 
-    intervals = np.empty(ar.shape, dtype=np.intp)
-    intervals[1:] = perm[1:] - perm[:-1]
-
-    delta = len(ar) - perm[last_mask] if mode == constants_mode.cycle else 1
-    intervals[first_mask] = perm[first_mask] + delta
-
-    inverse_perm = np.empty(ar.shape, dtype=np.intp)
-    inverse_perm[perm] = np.arange(ar.shape[0])
-
-    if mode == constants_mode.lossy:
-        intervals[first_mask] = 0
-        intervals = intervals[inverse_perm]
-        result = intervals[intervals != 0]
-    elif mode == constants_mode.normal:
-        result = intervals[inverse_perm]
-    elif mode == constants_mode.cycle:
-        result = intervals[inverse_perm]
-    elif mode == constants_mode.redundant:
-        result = intervals[inverse_perm]
-        redundant_intervals = len(ar) - perm[last_mask]
-        if binding == constants_binding.end:
-            redundant_intervals = redundant_intervals[::-1]
-        result = np.concatenate((result, redundant_intervals))
-    if binding == constants_binding.end:
-        result = result[::-1]
+    first and last are positions of the first and last occurrences
+    of every element in sorted order, buffer holds the redundant intervals
+    around normal or is None when the redundant mode is not requested.
+    """
+    length = normal.shape[0]
+    power = first.shape[0]
+    if binding == constants_binding.start:
+        boundary = first
+        boundary_cycle = first + length - last
+    else:
+        boundary = last
+        boundary_cycle = length - last + first
+
+    result = []
+    for mode in modes:
+        if mode == constants_mode.lossy:
+            not_boundary = scratch(workspace, "not_boundary", length, bool)
+            not_boundary.fill(True)
+            not_boundary[boundary] = False
+            lossy = result_buffer(out, length - power, dtype)
+            result.append(np.compress(not_boundary, normal, out=lossy))
+        elif mode == constants_mode.normal:
+            result.append(normal)
+        elif mode == constants_mode.cycle:
+            # Patch boundary positions in place when no other mode needs them
+            if set(modes) == {constants_mode.cycle}:
+                cycle = normal
+            else:
+                cycle = normal.copy()
+            cycle[boundary] = boundary_cycle
+            result.append(cycle)
+        elif mode == constants_mode.redundant:
+            result.append(buffer)
 
     return result
+
+
+def result_buffer(out, size, dtype):
+    """
+    Get an array for a result of size items: a new one or the beginning of out.
+    """
+    if out is None:
+        return np.empty(size, dtype=dtype)
+    if out.ndim != 1 or out.shape[0] < size:
+        message = (
+            f"Incorrect out shape. Expected at least ({size},), exists {out.shape}"
+        )
+        raise ValueError({"message": message})
+    return out[:size]
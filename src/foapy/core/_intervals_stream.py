@@ -0,0 +1,253 @@
+import numpy as np
+from numpy import ndarray
+
+from foapy.core import binding as constants_binding
+from foapy.core import mode as constants_mode
+from foapy.core._intervals import intervals_dtype, validate_intervals_args
+from foapy.core._sort import sort_groups
+from foapy.exceptions import Not1DArrayException
+
+
+class IntervalsStream:
+    """
+    Stateful extractor of intervals from a sequence given by chunks.
+
+    [foapy.intervals()][foapy.intervals] needs the whole sequence in memory.
+    A stream consumes the sequence chunk by chunk and keeps only a table
+    of the elements seen so far with positions of their first and last
+    occurrences. Intervals [bound to the start][foapy.binding.start]
+    of every chunk are known as soon as the chunk is consumed,
+    the boundary intervals at the end of the sequence are emitted
+    by `finalize()`.
+
+    Concatenated results of `update()` and `finalize()` are equal
+    to the intervals of the whole sequence in [lossy][foapy.mode.lossy],
+    [normal][foapy.mode.normal] and [redundant][foapy.mode.redundant] modes.
+    In [cycle][foapy.mode.cycle] mode the interval of the first occurrence
+    depends on the last one: updates emit normal intervals
+    at `first_positions` and `finalize()` returns the cycle intervals
+    to put there.
+
+    Parameters
+    ----------
+    mode : int, optional
+        Mode of the intervals, [normal][foapy.mode.normal] by default.
+    dtype : dtype, optional
+        Integer dtype of the intervals. Defaults to `np.intp`.
+
+    Raises
+    -------
+    ValueError
+        When mode or dtype is not valid
+
+    Examples
+    --------
+
+    Extract intervals of a sequence read by chunks.
+
+    ``` py linenums="1"
+    import foapy
+
+    stream = foapy.IntervalsStream(foapy.mode.redundant)
+    for chunk in [['a', 'b'], ['a', 'c'], ['a', 'd']]:
+        print(stream.update(chunk))
+    print(stream.finalize())
+    # [1 2]
+    # [2 4]
+    # [2 6]
+    # [2 5 3 1]
+    ```
+
+    Put the cycle intervals of the first occurrences into the collected result.
+
+    ``` py linenums="1"
+    import foapy
+    import numpy as np
+
+    stream = foapy.IntervalsStream(foapy.mode.cycle)
+    result = np.concatenate([stream.update(chunk) for chunk in [[1, 2], [1, 3]]])
+    result[stream.first_positions] = stream.finalize()
+    print(result)
+    # [2 4 2 4]
+    ```
+    """  # noqa: E501
+
+    def __init__(self, mode=constants_mode.normal, dtype=None):
+        validate_intervals_args(constants_binding.start, mode)
+        if isinstance(mode, (list, tuple)):
+            raise ValueError({"message": "Intervals stream takes a single mode."})
+
+        self.mode = mode
+        self.dtype = intervals_dtype(dtype, 0)
+        self.length = 0
+
+        # Elements seen so far in sorted order with their first
+        # and last occurrences
+        self._symbols = None
+        self._first = np.empty(0, dtype=np.intp)
+        self._last = np.empty(0, dtype=np.intp)
+        # Indexes of the elements in order of their first appearance
+        self._ids = np.empty(0, dtype=np.intp)
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def power(self) -> int:
+        """
+        Count of unique elements seen so far.
+        """
+        return self._first.shape[0]
+
+    @property
+    def first_positions(self) -> ndarray:
+        """
+        Ascending positions of first occurrences of the alphabet elements.
+        """
+        return np.sort(self._first)
+
+    def alphabet(self) -> ndarray:
+        """
+        Get an alphabet of the sequence consumed so far.
+
+        Returns
+        -------
+        : ndarray
+            Array of unique values in order of their first appearance.
+        """
+        if self._symbols is None:
+            return np.empty(0)
+        alphabet = np.empty_like(self._symbols)
+        alphabet[self._ids] = self._symbols
+        return alphabet
+
+    def update(self, chunk, return_order: bool = False) -> ndarray:
+        """
+        Consume the next chunk of the sequence.
+
+        Parameters
+        ----------
+        chunk : array_like
+            Next elements of the sequence. Must be a 1-dimensional array.
+        return_order : bool, optional
+            If True also return indexes in the alphabet of the elements
+            the intervals belong to
+
+        Returns
+        -------
+        intervals : ndarray
+            Intervals of the elements of the chunk, without the first
+            occurrences in [lossy][foapy.mode.lossy] mode.
+
+        order : ndarray
+            Indexes of the elements of the intervals in the alphabet
+            in order of the first appearance.
+            Only provided if `return_order` is True.
+
+        Raises
+        -------
+        Not1DArrayException
+            When chunk is not a 1-dimensional array
+
+        ValueError
+            When dtype is too narrow for the length of the sequence
+        """
+        ar = np.asanyarray(chunk)
+        if ar.ndim != 1:
+            message = f"Incorrect array form. Expected d1 array, exists {ar.ndim}"
+            raise Not1DArrayException({"message": message})
+        size = ar.shape[0]
+        offset = self.length
+        intervals_dtype(self.dtype, offset + size)
+        if size == 0:
+            result = np.empty(0, dtype=self.dtype)
+            return (result, np.empty(0, dtype=np.intp)) if return_order else result
+
+        perm, mask = sort_groups(ar)
+        first = perm[mask[:-1]]
+        last = perm[mask[1:]]
+        result = np.empty(size, dtype=self.dtype)
+        result[perm[1:]] = perm[1:] - perm[:-1]
+        if return_order:
+            groups = np.empty(size, dtype=np.intp)
+            groups[perm] = np.cumsum(mask[:-1]) - 1
+        del perm, mask
+
+        # Match elements of the chunk with the seen ones: a stable sort
+        # puts the seen element before the same element of the chunk
+        symbols = ar[first]
+        if self._symbols is None:
+            self._symbols = symbols[:0]
+        known = self._symbols.shape[0]
+        merged = np.concatenate((self._symbols, symbols))
+        merged_perm, merged_mask = sort_groups(merged)
+        linked = ~merged_mask[1:-1]
+
+        # Last occurrence before the chunk, -1 for new elements
+        previous = np.full(first.shape[0], -1, dtype=np.intp)
+        previous[merged_perm[1:][linked] - known] = self._last[merged_perm[:-1][linked]]
+        result[first] = first + offset - previous
+
+        # Seen elements keep their indexes, new ones are numbered
+        # by their first occurrences
+        new = previous == -1
+        ids = np.empty(first.shape[0], dtype=np.intp)
+        ids[merged_perm[1:][linked] - known] = self._ids[merged_perm[:-1][linked]]
+        ids[new] = self.power + np.argsort(np.argsort(first[new]))
+
+        firsts = np.concatenate((self._first, first + offset))
+        lasts = np.concatenate((self._last, last + offset))
+        all_ids = np.concatenate((self._ids, ids))
+        self._symbols = merged[merged_perm[merged_mask[:-1]]]
+        self._first = firsts[merged_perm[merged_mask[:-1]]]
+        self._last = lasts[merged_perm[merged_mask[1:]]]
+        self._ids = all_ids[merged_perm[merged_mask[:-1]]]
+        self.length += size
+
+        order = ids[groups] if return_order else None
+        if self.mode == constants_mode.lossy:
+            boundary = first[new]
+            result = np.delete(result, boundary)
+            if return_order:
+                order = np.delete(order, boundary)
+        if return_order:
+            return result, order
+        return result
+
+    def finalize(self, return_order: bool = False) -> ndarray:
+        """
+        Get the intervals at the end of the sequence consumed so far.
+
+        Parameters
+        ----------
+        return_order : bool, optional
+            If True also return indexes in the alphabet of the elements
+            the intervals belong to
+
+        Returns
+        -------
+        intervals : ndarray
+            Intervals from the last occurrence of every element to the end
+            of the sequence in [redundant][foapy.mode.redundant] mode,
+            cycle intervals of the first occurrences in order of their
+            positions in [cycle][foapy.mode.cycle] mode, an empty array
+            in [lossy][foapy.mode.lossy] and [normal][foapy.mode.normal] modes.
+
+        order : ndarray
+            Indexes of the elements of the intervals in the alphabet.
+            Only provided if `return_order` is True.
+        """
+        if self.mode == constants_mode.redundant:
+            result = (self.length - self._last).astype(self.dtype)
+            order = self._ids
+        elif self.mode == constants_mode.cycle:
+            cycle = np.empty(self.power, dtype=self.dtype)
+            cycle[self._ids] = self._first + self.length - self._last
+            result = cycle
+            order = np.arange(self.power)
+        else:
+            result = np.empty(0, dtype=self.dtype)
+            order = np.empty(0, dtype=np.intp)
+        if return_order:
+            return result, order
+        return result
@@ -0,0 +1,343 @@
+import os
+
+import numpy as np
+from numpy import ndarray
+
+from foapy.core import binding as constants_binding
+from foapy.core import mode as constants_mode
+from foapy.core._intervals import intervals, intervals_dtype, validate_intervals_args
+from foapy.core._intervals_stream import IntervalsStream
+from foapy.exceptions import Not1DArrayException
+
+# Default memory budget of the temporaries, bytes
+default_memory = 2**28
+
+# Bytes of temporaries of IntervalsStream.update per element of a chunk
+# besides the chunk itself: permutation, sort keys, masks and results
+element_bytes = 48
+
+
+def mapped_intervals(
+    X,
+    binding,
+    mode,
+    out=None,
+    dtype=None,
+    memory=default_memory,
+    source_dtype=np.uint8,
+) -> ndarray:
+    """
+    Extract intervals from a sequence larger than memory.
+
+    The sequence is read from a memory-mapped array or a raw binary file
+    by chunks, which fit into the memory budget, and is processed
+    by [IntervalsStream][foapy.IntervalsStream], holding only
+    the first and last occurrences of every element between chunks.
+    Intervals are written into the output as soon as a chunk is processed,
+    intervals [bound to the end][foapy.binding.end] are extracted
+    from the chunks read backwards. The result is the same as
+    [foapy.intervals()][foapy.intervals] returns.
+
+    Parameters
+    ----------
+    X : array_like, np.memmap or path
+        Sequence to extract intervals from. Must be a 1-dimensional array.
+        A path is mapped as a raw binary file of `source_dtype` items.
+    binding : int
+        [start][foapy.binding.start] or [end][foapy.binding.end].
+    mode : int
+        [lossy][foapy.mode.lossy], [normal][foapy.mode.normal],
+        [cycle][foapy.mode.cycle] or [redundant][foapy.mode.redundant].
+    out : ndarray, np.memmap or path, optional
+        Array to write the intervals into or path of a raw binary file
+        to create. The file is resized to the length of the intervals.
+        An array must be long enough for the intervals and at least as long
+        as the sequence, the result is a view of its beginning. The length
+        is checked before any intervals are written.
+        A new in-memory array by default.
+    dtype : dtype or "auto", optional
+        Integer dtype of the intervals. Defaults to `np.intp`.
+    memory : int, optional
+        Budget of the temporary memory in bytes, 256 MiB by default.
+    source_dtype : dtype, optional
+        Dtype of the items of a file given by path, `np.uint8` by default.
+
+    Returns
+    -------
+    : ndarray or np.memmap
+        Intervals extracted from the sequence.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not a 1-dimensional array
+
+    ValueError
+        When binding or mode is not valid, lists of them are not supported
+
+    ValueError
+        When dtype is not valid or out is too short
+
+    Examples
+    --------
+
+    Extract intervals of a file of one byte symbols into another file.
+
+    ``` py linenums="1"
+    import foapy
+    import numpy as np
+
+    np.frombuffer(b"ACGTTGCA", dtype=np.uint8).tofile("sequence.bin")
+    result = foapy.mapped_intervals(
+        "sequence.bin", foapy.binding.start, foapy.mode.normal,
+        out="intervals.bin", dtype=np.int32, memory=2**20
+    )
+    print(result)
+    # [1 2 3 4 1 3 5 7]
+    ```
+    """  # noqa: E501
+
+    validate_intervals_args(binding, mode)
+    if isinstance(binding, (list, tuple)) or isinstance(mode, (list, tuple)):
+        message = "Mapped intervals take a single binding and mode."
+        raise ValueError({"message": message})
+
+    source = open_source(X, source_dtype)
+    length = source.shape[0]
+    dtype = intervals_dtype(dtype, length)
+    if length == 0:
+        result = intervals(source, binding, mode, dtype)
+        return open_output(out, 0, dtype)[0] if out is not None else result
+
+    chunk_size = max(1, memory // (element_bytes + 2 * source.dtype.itemsize))
+    size = length
+    if mode == constants_mode.redundant and may_be_short(out, 2 * length):
+        # Check the given array before writing into it: the elements
+        # are counted by a pass over the chunks
+        size += source_power(source, chunk_size)
+    result, path = open_output(out, size, dtype)
+    result = result[:length]
+    forward = binding == constants_binding.start
+
+    stream = IntervalsStream(mode, dtype)
+    written = 0
+    for begin, end in chunk_bounds(length, chunk_size, forward):
+        chunk = np.asarray(source[begin:end])
+        if forward:
+            values = stream.update(chunk)
+            result[written : written + values.shape[0]] = values
+        else:
+            values = stream.update(chunk[::-1])
+            result[length - written - values.shape[0] : length - written] = values[::-1]
+        written += values.shape[0]
+        del chunk, values
+
+    if mode == constants_mode.cycle:
+        positions = stream.first_positions
+        if not forward:
+            positions = length - 1 - positions
+        result[positions] = stream.finalize()
+    elif mode == constants_mode.lossy:
+        if not forward:
+            move(result, length - written, 0, written, chunk_size)
+        result = resize_output(result, out, path, written)
+    elif mode == constants_mode.redundant:
+        boundary = stream.finalize()
+        power = boundary.shape[0]
+        result = resize_output(result, out, path, length + power)
+        if forward:
+            result[length:] = boundary
+        else:
+            move(result, 0, power, length, chunk_size)
+            result[:power] = boundary
+    return result
+
+
+def mapped_order(
+    X,
+    return_alphabet: bool = False,
+    out=None,
+    memory=default_memory,
+    source_dtype=np.uint8,
+) -> ndarray:
+    """
+    Decompose a sequence larger than memory into an order.
+
+    The sequence is read by chunks, which fit into the memory budget,
+    and every element gets its index in the alphabet from
+    [IntervalsStream][foapy.IntervalsStream]. The result is the same
+    as [foapy.order()][foapy.order] returns.
+
+    Parameters
+    ----------
+    X : array_like, np.memmap or path
+        Sequence to decompose. Must be a 1-dimensional array.
+        A path is mapped as a raw binary file of `source_dtype` items.
+    return_alphabet : bool, optional
+        If True also return sequence's alphabet
+    out : ndarray, np.memmap or path, optional
+        Array to write the order into or path of a raw binary file of `np.intp`
+        items to create. A new in-memory array by default.
+    memory : int, optional
+        Budget of the temporary memory in bytes, 256 MiB by default.
+    source_dtype : dtype, optional
+        Dtype of the items of a file given by path, `np.uint8` by default.
+
+    Returns
+    -------
+    order : ndarray or np.memmap
+        Order of the sequence.
+
+    alphabet : ndarray
+        Alphabet of the sequence. Only provided if `return_alphabet` is True.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not a 1-dimensional array
+
+    ValueError
+        When out is too short
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+    import numpy as np
+
+    source = np.memmap("sequence.bin", dtype=np.uint8, mode="w+", shape=(6,))
+    source[:] = np.frombuffer(b"ABACAD", dtype=np.uint8)
+    order, alphabet = foapy.mapped_order(source, True, memory=2**20)
+    print(order)
+    # [0 1 0 2 0 3]
+    print(alphabet)
+    # [65 66 67 68]
+    ```
+    """  # noqa: E501
+
+    source = open_source(X, source_dtype)
+    length = source.shape[0]
+    chunk_size = max(1, memory // (element_bytes + 2 * source.dtype.itemsize))
+    result, _ = open_output(out, length, np.dtype(np.intp))
+
+    stream = IntervalsStream()
+    for begin, end in chunk_bounds(length, chunk_size, True):
+        chunk = np.asarray(source[begin:end])
+        _, result[begin:end] = stream.update(chunk, return_order=True)
+        del chunk
+
+    if return_alphabet:
+        alphabet = stream.alphabet() if length != 0 else source[:0]
+        return result, alphabet
+    return result
+
+
+def open_source(X, source_dtype):
+    """
+    Map a file given by path or represent X as an array without reading it.
+    """
+    if isinstance(X, (str, os.PathLike)):
+        source_dtype = np.dtype(source_dtype)
+        if os.path.getsize(X) == 0:
+            return np.empty(0, dtype=source_dtype)
+        return np.memmap(X, dtype=source_dtype, mode="r")
+
+    source = np.asanyarray(X)
+    if source.ndim != 1:
+        message = f"Incorrect array form. Expected d1 array, exists {source.ndim}"
+        raise Not1DArrayException({"message": message})
+    return source
+
+
+def open_output(out, size, dtype):
+    """
+    Get an array of size items for the result and the path of its file,
+    None when the array is not created by path.
+    """
+    if out is None:
+        return np.empty(size, dtype=dtype), None
+    if isinstance(out, (str, os.PathLike)):
+        return map_file(out, size, dtype), out
+    if out.ndim != 1 or out.shape[0] < size:
+        message = (
+            f"Incorrect out shape. Expected at least ({size},), exists {out.shape}"
+        )
+        raise ValueError({"message": message})
+    if out.dtype != dtype:
+        message = f"Incorrect out dtype. Expected {dtype}, exists {out.dtype}"
+        raise ValueError({"message": message})
+    return out[:size], None
+
+
+def may_be_short(out, size):
+    """
+    Whether out is a given array shorter than size items.
+    """
+    if out is None or isinstance(out, (str, os.PathLike)):
+        return False
+    return out.ndim == 1 and out.shape[0] < size
+
+
+def source_power(source, chunk_size):
+    """
+    Count distinct elements of the source reading it by chunks.
+    """
+    stream = IntervalsStream()
+    for begin, end in chunk_bounds(source.shape[0], chunk_size, True):
+        stream.update(np.asarray(source[begin:end]))
+    return stream.power
+
+
+def resize_output(result, out, path, size):
+    """
+    Resize the result to size items: a file created by path is truncated
+    or extended, a given out array is sliced, an allocated array is copied.
+    """
+    dtype = result.dtype
+    if path is not None:
+        result.flush()
+        del result
+        return map_file(path, size, dtype)
+    if out is not None:
+        return open_output(out, size, dtype)[0]
+    if result.shape[0] >= size:
+        return result[:size]
+    extended = np.empty(size, dtype=dtype)
+    extended[: result.shape[0]] = result
+    return extended
+
+
+def map_file(path, size, dtype):
+    """
+    Map a raw binary file of exactly size items, creating or resizing it.
+    """
+    with open(path, "a+b") as file:
+        file.truncate(size * dtype.itemsize)
+    if size == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r+", shape=(size,))
+
+
+def chunk_bounds(length, chunk_size, forward):
+    """
+    Bounds of chunks of a sequence from its start or from its end.
+    """
+    if forward:
+        for begin in range(0, length, chunk_size):
+            yield begin, min(begin + chunk_size, length)
+    else:
+        for end in range(length, 0, -chunk_size):
+            yield max(end - chunk_size, 0), end
+
+
+def move(result, source, target, count, chunk_size):
+    """
+    Move count items of the result from source to target position
+    by chunks, in the direction safe for overlapping ranges.
+    """
+    if source == target or count == 0:
+        return
+    bounds = list(chunk_bounds(count, chunk_size, target < source))
+    for begin, end in bounds:
+        result[target + begin : target + end] = result[source + begin : source + end]
@@ -1,10 +1,12 @@
 import numpy as np
 from numpy import ndarray
 
+from foapy.core._sort import hash_order, hashed, sort_groups
+from foapy.core._workspace import Workspace
 from foapy.exceptions import Not1DArrayException
 
 
-def order(X, return_alphabet: bool = False) -> ndarray:
+def order(X, return_alphabet: bool = False, out=None, workspace=None) -> ndarray:
     """
 
     Decompose an array into an order and an alphabet.
@@ -28,6 +30,12 @@ def order(X, return_alphabet: bool = False) -> ndarray:
     return_alphabet : bool, optional
         If True also return array's alphabet
 
+    out : ndarray, optional
+        Integer array of the same length as X to place the order into.
+
+    workspace : Workspace, optional
+        [Workspace][foapy.Workspace] with scratch buffers reused between calls.
+
     Returns
     -------
     order : ndarray
@@ -41,6 +49,9 @@ def order(X, return_alphabet: bool = False) -> ndarray:
     Not1DArrayException
         When X parameter is not d1 array
 
+    ValueError
+        When out has a different length than X
+
     Examples
     --------
 
@@ -93,27 +104,45 @@ def order(X, return_alphabet: bool = False) -> ndarray:
             {"message": f"Incorrect array form. Expected d1 array, exists {data.ndim}"}
         )
 
-    perm = data.argsort(kind="mergesort")
-
-    unique_mask = np.empty(data.shape, dtype=bool)
-    unique_mask[:1] = True
-    unique_mask[1:] = data[perm[1:]] != data[perm[:-1]]
-
-    result_mask = np.zeros_like(unique_mask)
-    result_mask[:1] = True
-    result_mask[perm[unique_mask]] = True
-
-    power = np.count_nonzero(unique_mask)
-
-    inverse_perm = np.empty(data.shape, dtype=np.intp)
-    inverse_perm[perm] = np.arange(data.shape[0])
-
-    result = np.cumsum(unique_mask) - 1
-    inverse_alphabet_perm = np.empty(power, dtype=np.intp)
-    inverse_alphabet_perm[result[inverse_perm][result_mask]] = np.arange(power)
-
-    result = inverse_alphabet_perm[result][inverse_perm]
+    length = data.shape[0]
+    if out is not None and out.shape != (length,):
+        message = f"Incorrect out shape. Expected ({length},), exists {out.shape}"
+        raise ValueError({"message": message})
+
+    grouped = hash_order(data) if hashed(data) else None
+    if grouped is not None:
+        result, first_positions = grouped
+        if out is not None:
+            out[:] = result
+            result = out
+        if return_alphabet:
+            return result, data[first_positions]
+        return result
+
+    if workspace is None:
+        workspace = Workspace()
+
+    perm, mask = sort_groups(data, workspace)
+    first_mask = mask[:-1]
+
+    # Number of the group of equal elements in the sorted order
+    # for every position of the array
+    sorted_groups = workspace.buffer("sorted_groups", length, np.intp)
+    np.cumsum(first_mask, dtype=np.intp, out=sorted_groups)
+    sorted_groups -= 1
+    groups = workspace.buffer("groups", length, np.intp)
+    groups[perm] = sorted_groups
+
+    # Groups are numbered by value, the order numbers them by first appearance
+    first_positions = np.sort(perm[first_mask])
+    power = first_positions.shape[0]
+    appearance = np.empty(power, dtype=np.intp)
+    appearance[groups[first_positions]] = np.arange(power)
+
+    if out is None:
+        out = np.empty(length, dtype=np.intp)
+    result = np.take(appearance, groups, out=out)
 
     if return_alphabet:
-        return result, data[result_mask]
+        return result, data[first_positions]
     return result
@@ -0,0 +1,223 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from numpy import ndarray
+
+from foapy.core import binding as constants_binding
+from foapy.core import mode as constants_mode
+from foapy.core._intervals import (
+    boundary_modes,
+    intervals,
+    intervals_dtype,
+    validate_intervals_args,
+)
+from foapy.core._sort import sort_groups
+from foapy.exceptions import Not1DArrayException
+
+# Largest default chunk, bounds the scratch memory of every worker
+default_chunk_size = 2**24
+
+
+def parallel_intervals(
+    X, binding, mode, dtype=None, workers=None, chunk_size=None
+) -> ndarray:
+    """
+    Extract intervals from a long sequence splitting it into chunks
+    processed in parallel.
+
+    Every chunk is sorted independently by a worker thread, which scatters
+    intervals between occurrences inside the chunk into the result and
+    returns the first and last occurrences of every element of the chunk.
+    Then the occurrences of the chunks are matched by element and
+    the intervals crossing the borders of the chunks are stitched.
+    The result is identical to [foapy.intervals()][foapy.intervals]
+    for every binding and mode, while the sort scratch memory is bounded
+    by the chunk size of every worker instead of the sequence length.
+
+    Parameters
+    ----------
+    X: array_like
+        Array to exctact an intervals from. Must be a 1-dimensional array.
+        Chunks are sliced from it, so a `np.memmap` is read chunk by chunk.
+    binding: int or list of int
+        [start][foapy.binding.start] = 1 - Intervals are extracted from left to right.
+        [end][foapy.binding.end] = 2 – Intervals are extracted from right to left.
+    mode: int or list of int
+        [lossy][foapy.mode.lossy], [normal][foapy.mode.normal],
+        [cycle][foapy.mode.cycle] or [redundant][foapy.mode.redundant]
+        handling of the intervals at the sequence boundaries, the same as
+        in [foapy.intervals()][foapy.intervals].
+    dtype: dtype or "auto", optional
+        Integer dtype of the intervals. Defaults to `np.intp`.
+    workers: int, optional
+        Number of worker threads, the number of CPUs by default.
+    chunk_size: int, optional
+        Number of elements in a chunk. By default the sequence is split
+        evenly between workers into chunks of at most 2^24 elements.
+
+    Returns
+    -------
+    order : ndarray or list
+        Intervals extracted from the sequence, nested the same way as
+        [foapy.intervals()][foapy.intervals] returns them for lists
+        of bindings and modes.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not a 1-dimensional array
+
+    ValueError
+        When binding or mode is not valid
+
+    ValueError
+        When dtype is not an integer dtype or is too narrow
+        for the sequence length
+
+    ValueError
+        When workers or chunk_size is not a positive integer
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    source = ['a', 'b', 'a', 'c', 'a', 'd']
+    intervals = foapy.parallel_intervals(
+        source, foapy.binding.start, foapy.mode.normal, chunk_size=2
+    )
+    print(intervals)
+    # [1 2 2 4 2 6]
+    ```
+    """  # noqa: E501
+
+    validate_intervals_args(binding, mode)
+    if (workers is not None and workers < 1) or (
+        chunk_size is not None and chunk_size < 1
+    ):
+        message = (
+            f"Invalid workers {workers} or chunk size {chunk_size}. "
+            "Use positive integers."
+        )
+        raise ValueError({"message": message})
+
+    ar = np.asanyarray(X)
+    if ar.ndim != 1:
+        message = f"Incorrect array form. Expected d1 array, exists {ar.ndim}"
+        raise Not1DArrayException({"message": message})
+    length = ar.shape[0]
+    if length == 0:
+        return intervals(ar, binding, mode, dtype)
+    dtype = intervals_dtype(dtype, length)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = min(-(-length // workers), default_chunk_size)
+    bounds = [
+        (start, min(start + chunk_size, length))
+        for start in range(0, length, chunk_size)
+    ]
+
+    bindings = binding if isinstance(binding, (list, tuple)) else [binding]
+    modes = mode if isinstance(mode, (list, tuple)) else [mode]
+    normals = {_binding: np.empty(length, dtype=dtype) for _binding in bindings}
+
+    def process(bound):
+        return chunk_intervals(ar, bound[0], bound[1], normals)
+
+    if workers == 1 or len(bounds) == 1:
+        chunks = [process(bound) for bound in bounds]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(process, bounds))
+
+    first, last = stitch_chunks(chunks, normals)
+    del chunks
+
+    result = []
+    for index, _binding in enumerate(bindings):
+        # A repeated binding gets its own copy, the last use frees the array
+        if _binding in bindings[index + 1 :]:
+            normal = normals[_binding].copy()
+        else:
+            normal = normals.pop(_binding)
+        buffer = None
+        if constants_mode.redundant in modes:
+            buffer = np.empty(length + first.shape[0], dtype=dtype)
+            if _binding == constants_binding.start:
+                buffer[:length] = normal
+                buffer[length:] = length - last
+                normal = buffer[:length]
+            else:
+                buffer[first.shape[0] :] = normal
+                buffer[: first.shape[0]] = first + 1
+                normal = buffer[first.shape[0] :]
+        by_mode = boundary_modes(normal, buffer, first, last, _binding, modes, dtype)
+        result.append(by_mode if isinstance(mode, (list, tuple)) else by_mode[0])
+
+    if isinstance(binding, (list, tuple)):
+        return result
+    return result[0]
+
+
+def chunk_intervals(ar, start, stop, normals):
+    """
+    Scatter intervals of `ar[start:stop]` into the normal intervals
+    of every binding.
+
+    Occurrences, which are the first (or the last) inside the chunk,
+    get intervals to the sequence start (or end) to be corrected
+    by stitching. Returns elements of the chunk with the positions
+    of their first and last occurrences in sorted order.
+    """
+    chunk = ar[start:stop]
+    length = ar.shape[0]
+    perm, mask = sort_groups(chunk)
+    first = perm[mask[:-1]]
+    last = perm[mask[1:]]
+    distances = np.subtract(perm[1:], perm[:-1])
+
+    for binding, normal in normals.items():
+        view = normal[start:stop]
+        if binding == constants_binding.start:
+            view[perm[1:]] = distances
+            view[first] = first + (start + 1)
+        else:
+            view[perm[:-1]] = distances
+            view[last] = (length - start) - last
+    del distances, perm, mask
+
+    return chunk[first], first + start, last + start
+
+
+def stitch_chunks(chunks, normals):
+    """
+    Correct intervals crossing borders of chunks.
+
+    Elements of all chunks are grouped by one stable sort, which keeps
+    the chunks in order inside every group: an occurrence, which starts
+    a chunk group, is linked with the last occurrence of the previous one.
+    Returns the positions of the first and last occurrences of every element
+    of the sequence in sorted order.
+    """
+    values = np.concatenate([chunk[0] for chunk in chunks])
+    firsts = np.concatenate([chunk[1] for chunk in chunks])
+    lasts = np.concatenate([chunk[2] for chunk in chunks])
+
+    perm, mask = sort_groups(values)
+    firsts = firsts[perm]
+    lasts = lasts[perm]
+
+    linked = ~mask[1:-1]
+    next_first = firsts[1:][linked]
+    prev_last = lasts[:-1][linked]
+    for binding, normal in normals.items():
+        if binding == constants_binding.start:
+            normal[next_first] = next_first - prev_last
+        else:
+            normal[prev_last] = next_first - prev_last
+
+    return firsts[mask[:-1]], lasts[mask[1:]]
@@ -0,0 +1,176 @@
+import numpy as np
+from numpy import ndarray
+
+from foapy.core._intervals import (
+    intervals_dtype,
+    select_intervals,
+    validate_intervals_args,
+)
+from foapy.core._sort import sort_groups
+from foapy.exceptions import Not1DArrayException
+
+
+class PreparedSequence:
+    """
+    Sequence with cached stable sort, ready for repeated decomposition.
+
+    [foapy.order()][foapy.order], [foapy.alphabet()][foapy.alphabet] and
+    [foapy.intervals()][foapy.intervals] each sort the input array. A prepared
+    sequence performs the stable sort and builds the first/last occurrence
+    masks once, then derives the order, the alphabet and the intervals
+    for any binding and mode from the cached permutation.
+
+    Intervals for [binding.end][foapy.binding.end] are derived from
+    the same forward sort as the intervals for [binding.start][foapy.binding.start]:
+    the distance to the previous occurrence of the element becomes
+    the distance to the next occurrence.
+
+    Parameters
+    ----------
+    X : array_like
+        Array to prepare. Must be a 1-dimensional array.
+
+    Raises
+    -------
+    Not1DArrayException
+        When X parameter is not a 1-dimensional array
+
+    Examples
+    --------
+
+    Decompose a sequence and extract intervals for all bindings and modes
+    with one sort.
+
+    ``` py linenums="1"
+    import foapy
+
+    source = ['a', 'b', 'a', 'c', 'a', 'd']
+    sequence = foapy.PreparedSequence(source)
+    print(sequence.alphabet())
+    # ['a' 'b' 'c' 'd']
+    print(sequence.order())
+    # [0 1 0 2 0 3]
+    for binding in [foapy.binding.start, foapy.binding.end]:
+        for mode in [foapy.mode.lossy, foapy.mode.normal]:
+            print(sequence.intervals(binding, mode))
+    # [2 2]
+    # [1 2 2 4 2 6]
+    # [2 2]
+    # [2 5 2 3 2 1]
+    ```
+    """  # noqa: E501
+
+    def __init__(self, X):
+        data = np.asanyarray(X)
+        if data.ndim > 1:  # Checking for d1 array
+            message = f"Incorrect array form. Expected d1 array, exists {data.ndim}"
+            raise Not1DArrayException({"message": message})
+
+        self.data = data
+        # Borders of groups of equal elements in the sorted array
+        self.perm, mask = sort_groups(data)
+        self.first_mask = mask[:-1]
+        self.last_mask = mask[1:]
+
+        self._first_positions = None
+        self._order = None
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    @property
+    def power(self) -> int:
+        """
+        Count of unique elements in the sequence.
+        """
+        return int(np.count_nonzero(self.first_mask))
+
+    @property
+    def first_positions(self) -> ndarray:
+        """
+        Ascending positions of first occurrences of the alphabet elements.
+        """
+        if self._first_positions is None:
+            self._first_positions = np.sort(self.perm[self.first_mask])
+        return self._first_positions
+
+    def alphabet(self) -> ndarray:
+        """
+        Get an alphabet of the sequence.
+
+        Returns
+        -------
+        : ndarray
+            Array of unique values in order of their first appearance.
+            Same as [foapy.alphabet()][foapy.alphabet].
+        """
+        return self.data[self.first_positions]
+
+    def order(self, return_alphabet: bool = False) -> ndarray:
+        """
+        Get an order of the sequence.
+
+        Parameters
+        ----------
+        return_alphabet : bool, optional
+            If True also return sequence's alphabet
+
+        Returns
+        -------
+        order : ndarray
+            Order of the sequence. Same as [foapy.order()][foapy.order].
+
+        alphabet : ndarray
+            Alphabet of the sequence. Only provided if `return_alphabet` is True.
+        """
+        if self._order is None:
+            length = len(self)
+            groups = np.empty(length, dtype=np.intp)
+            groups[self.perm] = np.cumsum(self.first_mask) - 1
+
+            power = self.first_positions.shape[0]
+            appearance = np.empty(power, dtype=np.intp)
+            appearance[groups[self.first_positions]] = np.arange(power)
+            self._order = appearance[groups]
+
+        if return_alphabet:
+            return self._order, self.alphabet()
+        return self._order
+
+    def intervals(self, binding, mode, dtype=None) -> ndarray:
+        """
+        Extract intervals from the sequence.
+
+        Parameters
+        ----------
+        binding: int or list of int
+            [start][foapy.binding.start] = 1 - Intervals are extracted from left to right.
+            [end][foapy.binding.end] = 2 – Intervals are extracted from right to left.
+        mode: int or list of int
+            [lossy][foapy.mode.lossy] = 1,
+            [normal][foapy.mode.normal] = 2,
+            [cycle][foapy.mode.cycle] = 3 or
+            [redundant][foapy.mode.redundant] = 4.
+            See [foapy.intervals()][foapy.intervals] for details.
+        dtype: dtype or "auto", optional
+            Integer dtype of the intervals. Defaults to `np.intp`.
+            See [foapy.intervals()][foapy.intervals] for details.
+
+        Returns
+        -------
+        : ndarray or list
+            Intervals extracted from the sequence.
+            Same as [foapy.intervals()][foapy.intervals], lists of bindings
+            and modes give nested lists of intervals.
+
+        Raises
+        -------
+        ValueError
+            When binding, mode or dtype is not valid
+        """  # noqa: E501
+
+        validate_intervals_args(binding, mode)
+        dtype = intervals_dtype(dtype, len(self))
+        return select_intervals(
+            self.perm, self.first_mask, self.last_mask, binding, mode, dtype
+        )
@@ -0,0 +1,122 @@
+import numpy as np
+
+
+class RaggedArray:
+    """
+    Array of variable-length rows stored in one contiguous buffer.
+
+    Rows are kept as a flat `data` array and an `offsets` array of
+    `len(rows) + 1` monotonic indices (CSR-like layout): row `j`
+    is `data[offsets[j]:offsets[j + 1]]`.
+
+    The container is iterable and indexable like a list of ndarrays,
+    so it can be passed wherever a list of congeneric arrays is expected,
+    while storing all rows without creating a Python object per row.
+
+    | Rows                  | data              | offsets         |
+    |-----------------------|-------------------|-----------------|
+    | [ [1 2 1] [2 3] ]     | [ 1 2 1 2 3 ]     | [ 0 3 5 ]       |
+    | [ [5] [] [1 4] ]      | [ 5 1 4 ]         | [ 0 1 1 3 ]     |
+    | [ ]                   | [ ]               | [ 0 ]           |
+
+    Parameters
+    ----------
+    data : array_like
+        Flat buffer with values of all rows.
+    offsets : array_like
+        Row boundaries in the `data` buffer.
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    rows = foapy.core.RaggedArray([1, 2, 1, 2, 3], [0, 3, 5])
+    print(len(rows))
+    # 2
+    print(rows[1])
+    # [2 3]
+    print(rows.lengths)
+    # [3 2]
+    ```
+    """
+
+    def __init__(self, data, offsets):
+        self.data = np.asanyarray(data)
+        self.offsets = np.asanyarray(offsets, dtype=np.intp)
+
+    @classmethod
+    def from_arrays(cls, arrays, dtype=None):
+        """
+        Build a ragged array from a sequence of 1-dimensional arrays.
+
+        Parameters
+        ----------
+        arrays : sequence of array_like
+            Rows of the ragged array. Rows of a 2-dimensional ndarray
+            share its buffer when it is contiguous.
+        dtype : dtype, optional
+            The dtype of the flat buffer.
+
+        Returns
+        -------
+        : RaggedArray
+            Ragged array holding the given rows.
+        """
+        if isinstance(arrays, RaggedArray):
+            if dtype is None:
+                return arrays
+            return cls(arrays.data.astype(dtype, copy=False), arrays.offsets)
+
+        if isinstance(arrays, np.ndarray) and arrays.ndim == 2:
+            batch, length = arrays.shape
+            data = arrays.reshape(-1)
+            if dtype is not None:
+                data = data.astype(dtype, copy=False)
+            return cls(data, np.arange(batch + 1, dtype=np.intp) * length)
+
+        rows = [np.asanyarray(row) for row in arrays]
+        offsets = np.zeros(len(rows) + 1, dtype=np.intp)
+        np.cumsum([row.shape[0] for row in rows], out=offsets[1:])
+        if len(rows) == 0:
+            return cls(np.array([], dtype=dtype), offsets)
+        data = np.concatenate(rows)
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        return cls(data, offsets)
+
+    @property
+    def lengths(self):
+        """
+        Number of values in each row.
+        """
+        return np.diff(self.offsets)
+
+    def tolist(self):
+        """
+        Convert the ragged array into a list of ndarray views on the buffer.
+        """
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self):
+        return self.offsets.shape[0] - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError(f"Row index out of range for {size} rows")
+        return self.data[self.offsets[index] : self.offsets[index + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        rows = ", ".join(repr(row.tolist()) for row in self)
+        return f"{type(self).__name__}([{rows}])"
@@ -0,0 +1,185 @@
+import numpy as np
+from numpy import ndarray
+
+from foapy.core._workspace import scratch
+
+# Stable argsort of integers up to 16 bits is a linear-time radix sort
+radix_sort_max_range = np.iinfo(np.uint16).max
+
+# Wider integers are sorted by two radix passes over 16-bit digits
+two_pass_max_range = np.iinfo(np.uint32).max
+
+
+class Ids(dict):
+    """
+    Hash table giving the next id to a missing key.
+    """
+
+    def __missing__(self, key):
+        index = self[key] = len(self)
+        return index
+
+
+def hashed(data: ndarray) -> bool:
+    """
+    Check whether unique elements of data are found faster by a hash table
+    than by a sort: Python objects and strings longer than one character,
+    whose comparisons are expensive and keys cannot be radix sorted.
+    """
+    kind = data.dtype.kind
+    return kind in "OT" or (kind == "U" and data.dtype.itemsize > 4)
+
+
+def hash_order(data: ndarray):
+    """
+    Index every element by the first appearance of its value in one pass
+    over a hash table.
+
+    Returns the indexes and ascending positions of the first occurrences,
+    or None when the elements are not hashable.
+    """
+    ids = Ids()
+    length = data.shape[0]
+    try:
+        order = np.fromiter(
+            map(ids.__getitem__, np.asarray(data).tolist()), dtype=np.intp, count=length
+        )
+    except TypeError:
+        return None
+
+    # Indexes appear in ascending order, a new one exceeds all before it
+    first_mask = np.empty(length, dtype=bool)
+    first_mask[:1] = True
+    np.greater(order[1:], np.maximum.accumulate(order[:-1]), out=first_mask[1:])
+    return order, np.flatnonzero(first_mask)
+
+
+def sort_keys(data: ndarray) -> ndarray:
+    """
+    Get keys with the same ordering and equality as data, but cheaper to sort.
+
+    Small-range integers, bytes (`S1`), single characters (`U1`) and booleans
+    are shifted to `uint8`/`uint16` codes, which stable argsort
+    processes with radix sort in O(n). Other data is returned as is.
+    """
+    dtype = data.dtype
+    if dtype == np.bool_ or (dtype.kind == "S" and dtype.itemsize == 1):
+        return data.view(np.uint8)
+
+    if dtype.kind == "U" and dtype.itemsize == 4:
+        codes = data.view(np.uint32)
+    elif dtype.kind in "iu":
+        codes = data
+    else:
+        return data
+
+    if codes.dtype.itemsize <= 2 or codes.shape[0] == 0:
+        return codes
+
+    low = codes.min()
+    values_range = int(codes.max()) - int(low)
+    if values_range > radix_sort_max_range:
+        return codes
+
+    keys_dtype = np.uint8 if values_range <= np.iinfo(np.uint8).max else np.uint16
+    return (codes - low).astype(keys_dtype)
+
+
+def sort_groups(ar: ndarray, workspace=None):
+    """
+    Stable sort the array and mark borders of groups of equal elements.
+
+    Returns the sort permutation and a mask of `len(ar) + 1` items,
+    where `mask[:-1]` marks first and `mask[1:]` marks last occurrences
+    in the sorted order. Sorted keys are materialized once and released
+    before returning. The mask and the sorted keys are taken from
+    the workspace when it is given.
+    """
+    keys = sort_keys(ar)
+    perm = stable_argsort(keys)
+
+    length = ar.shape[0]
+    mask = scratch(workspace, "mask", length + 1, bool)
+    sorted_keys = scratch(workspace, "sorted_keys", length, keys.dtype)
+    np.take(keys, perm, out=sorted_keys)
+    del keys
+
+    mask[:1] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=mask[1:-1])
+    del sorted_keys
+    mask[-1:] = True
+    return perm, mask
+
+
+def stable_argsort(keys: ndarray) -> ndarray:
+    """
+    Stable argsort of keys. Integers spanning up to 32 bits are sorted
+    by two radix passes in O(n) instead of a comparison sort.
+    """
+    if keys.dtype.kind in "iu" and keys.dtype.itemsize > 2 and keys.shape[0] != 0:
+        low = keys.min()
+        values_range = int(keys.max()) - int(low)
+        if values_range <= two_pass_max_range:
+            # Differences are exact in unsigned wrapping arithmetic,
+            # bytes of the keys are read in the native byte order
+            unsigned = np.dtype(f"u{keys.dtype.itemsize}")
+            native = keys.astype(keys.dtype.newbyteorder("="), copy=False)
+            return radix_argsort(native.view(unsigned) - np.asarray(low).view(unsigned))
+    return keys.argsort(kind="mergesort")
+
+
+def radix_argsort(codes: ndarray) -> ndarray:
+    """
+    Stable argsort of non-negative integers below 2^32: a stable sort
+    by the low 16 bits followed by a stable sort by the high 16 bits.
+    """
+    digits = (codes & 0xFFFF).astype(np.uint16)
+    perm = digits.argsort(kind="stable")
+    np.right_shift(codes, 16, out=digits, casting="unsafe")
+    return perm[digits[perm].argsort(kind="stable")]
+
+
+def order_groups(order: ndarray, power: int, workspace=None):
+    """
+    Stable sort an order of integers `0..power - 1` and mark borders
+    of groups of equal elements the same way as sort_groups.
+
+    Values are not scanned for the keys range: the power gives the width
+    of the radix sort keys, an order of 8 or 16-bit integers is sorted
+    without a copy. Borders of the groups come from the table of counts
+    of the elements instead of comparing sorted values.
+    """
+    if order.dtype.kind not in "iu":
+        message = f"Invalid order dtype {order.dtype}. Use an integer dtype."
+        raise ValueError({"message": message})
+
+    length = order.shape[0]
+    # Values of an order fit into int64, larger ones turn negative
+    if order.dtype.kind == "u" and order.dtype.itemsize == 8:
+        values = order.view(order.dtype.str.replace("u", "i"))
+    else:
+        values = order
+    try:
+        counts = np.bincount(values, minlength=power)
+    except ValueError:
+        counts = None
+    if counts is None or counts.shape[0] > power:
+        message = f"Order has values out of the range 0..{power - 1}."
+        raise ValueError({"message": message})
+
+    if order.dtype.itemsize <= 2:
+        perm = order.argsort(kind="stable")
+    elif power - 1 <= radix_sort_max_range:
+        keys_dtype = np.uint8 if power - 1 <= np.iinfo(np.uint8).max else np.uint16
+        perm = order.astype(keys_dtype).argsort(kind="stable")
+    elif power - 1 <= two_pass_max_range:
+        perm = radix_argsort(order)
+    else:
+        perm = order.argsort(kind="mergesort")
+
+    mask = scratch(workspace, "mask", length + 1, bool)
+    mask[:] = False
+    starts = np.cumsum(counts) - counts
+    mask[starts[counts != 0]] = True
+    mask[-1:] = True
+    return perm, mask
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+class Workspace:
+    """
+    Reusable scratch buffers for repeated calls on equally-sized inputs.
+
+    [foapy.order()][foapy.order], [foapy.intervals()][foapy.intervals]
+    and the characteristics based on [depth][foapy.characteristics.depth]
+    allocate masks, group numbers and logarithms of intervals on every call.
+    A workspace passed as `workspace=` keeps these temporaries between calls:
+    a buffer is allocated when it is requested for the first time
+    and reused while the requested size fits into it.
+
+    Results are never stored in a workspace, use `out=` parameters
+    to reuse result arrays. The stable sort permutation is allocated
+    by argsort on every call.
+
+    Examples
+    --------
+
+    Extract intervals of many windows of a sequence with the same buffers.
+
+    ``` py linenums="1"
+    import foapy
+    import numpy as np
+
+    source = np.array([1, 2, 1, 3, 1, 2, 2, 3, 1, 1])
+    workspace = foapy.Workspace()
+    out = np.empty(5, dtype=np.intp)
+    for start in range(0, 10, 5):
+        window = source[start:start + 5]
+        print(foapy.intervals(window, foapy.binding.start, foapy.mode.normal, out=out, workspace=workspace))
+    # [1 2 2 4 2]
+    # [1 2 5 4 1]
+    ```
+    """  # noqa: E501
+
+    def __init__(self):
+        self._buffers = {}
+
+    def buffer(self, name, size, dtype):
+        """
+        Get a 1-dimensional scratch buffer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the buffer. Buffers with different names never overlap.
+        size : int
+            Required count of items.
+        dtype : dtype
+            Required dtype of items.
+
+        Returns
+        -------
+        : ndarray
+            Uninitialized array of `size` items, a view into the cached buffer.
+        """
+        dtype = np.dtype(dtype)
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.shape[0] < size:
+            buffer = np.empty(size, dtype=dtype)
+            self._buffers[name] = buffer
+        return buffer[:size]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total bytes held by the buffers of the workspace.
+        """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self):
+        """
+        Release all buffers of the workspace.
+        """
+        self._buffers.clear()
+
+
+def scratch(workspace, name, size, dtype):
+    """
+    Get a scratch buffer from the workspace or a new array without it.
+    """
+    if workspace is None:
+        return np.empty(size, dtype=dtype)
+    return workspace.buffer(name, size, dtype)
@@ -0,0 +1,20 @@
+import sys
+
+# We first need to detect if we're being called as part of the numpy setup
+# procedure itself in a reliable manner.
+try:
+    __FOAPY_SETUP__
+except NameError:
+    __FOAPY_SETUP__ = False
+
+if __FOAPY_SETUP__:
+    sys.stderr.write("Running from foapy.io source directory.\n")
+else:
+    from ._fasta import read_fasta  # noqa: F401
+    from ._fasta import read_fastq  # noqa: F401
+    from ._text import encode_words  # noqa: F401
+
+    __all__ = list({"read_fasta", "read_fastq", "encode_words"})
+
+    def __dir__():
+        return __all__
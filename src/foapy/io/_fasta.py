@@ -0,0 +1,395 @@
+import gzip
+import os
+
+import numpy as np
+
+from foapy.core import RaggedArray
+
+# Bytes read from the source at once
+default_chunk_size = 2**24
+
+newline = ord("\n")
+carriage_return = ord("\r")
+
+
+def read_fasta(
+    source,
+    alphabet="ACGT",
+    out=None,
+    return_names: bool = False,
+    chunk_size=default_chunk_size,
+) -> RaggedArray:
+    """
+    Read records of a FASTA file as arrays of symbol codes.
+
+    The file is read by chunks of bytes, headers and line breaks are dropped
+    and the remaining bytes are decoded by a lookup table straight into
+    `uint8` codes, without creating Python strings for the sequences.
+    Lines of any length are supported, a sequence line does not have
+    to fit into a chunk.
+
+    Records are returned as [RaggedArray][foapy.core.RaggedArray]
+    of codes with offsets of the records, ready for
+    [foapy.batch][foapy.batch] functions. A single record is a 1-dimensional
+    array for [foapy.intervals()][foapy.intervals].
+
+    Parameters
+    ----------
+    source : path or binary file
+        FASTA file to read. Paths ending with `.gz` are decompressed.
+    alphabet : str, optional
+        Symbols to decode, "ACGT" by default. A symbol is decoded to its index
+        in the alphabet ignoring the case, any other symbol (e.g. `N`)
+        is decoded to `len(alphabet)`. If None the bytes are kept as is.
+    out : np.memmap or path, optional
+        Memory-mapped array or path of a raw binary file to write the codes
+        into. An array must be long enough for the codes, a file is created
+        with the length of the codes. A new in-memory array by default.
+    return_names : bool, optional
+        If True also return the names of the records
+    chunk_size : int, optional
+        Bytes read from the file at once, 16 MiB by default.
+
+    Returns
+    -------
+    records : RaggedArray
+        Codes of the symbols of every record.
+
+    names : list of str
+        Header lines of the records without `>`.
+        Only provided if `return_names` is True.
+
+    Raises
+    -------
+    ValueError
+        When the alphabet is longer than 255 symbols or out is too short
+
+    ValueError
+        When chunk_size is not a positive integer
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    with open("sequences.fasta", "w") as file:
+        file.write(">first\\nACGT\\nacgN\\n>second\\nGATTACA\\n")
+    records, names = foapy.io.read_fasta("sequences.fasta", return_names=True)
+    print(names)
+    # ['first', 'second']
+    print(records[0])
+    # [0 1 2 3 0 1 2 4]
+    print(foapy.batch.intervals(records, foapy.binding.start, foapy.mode.normal)[1])
+    # [1 2 3 1 3 6 2]
+    ```
+    """  # noqa: E501
+
+    validate_chunk_size(chunk_size)
+    table = decode_table(alphabet)
+    output = CodesOutput(out)
+    offsets = []
+    names = []
+    # A header line continues from the previous chunk
+    in_header = False
+    at_line_start = True
+
+    with open_binary(source) as file:
+        while True:
+            chunk = np.frombuffer(file.read(chunk_size), dtype=np.uint8)
+            size = chunk.shape[0]
+            if size == 0:
+                break
+
+            ends = np.flatnonzero(chunk == newline)
+            starts = np.concatenate(([0], ends + 1))
+            starts = starts[starts < size]
+            line_ends = np.append(ends, size)[: starts.shape[0]]
+            headers = chunk[starts] == ord(">")
+            if not at_line_start:
+                headers[0] = in_header
+
+            # Drop headers, line breaks and carriage returns
+            keep = np.zeros(size + 1, dtype=np.int8)
+            keep[starts[headers]] = 1
+            keep[line_ends[headers]] -= 1
+            keep = np.cumsum(keep[:-1], dtype=np.int8).view(np.bool_)
+            keep |= chunk == newline
+            keep |= chunk == carriage_return
+            np.logical_not(keep, out=keep)
+
+            # Records start at the headers, their offsets are the counts
+            # of codes written before them
+            returns = np.flatnonzero(chunk == carriage_return)
+            kept = (
+                line_ends
+                - starts
+                - np.bincount(
+                    np.searchsorted(starts, returns, side="right") - 1,
+                    minlength=starts.shape[0],
+                )
+            )
+            kept[headers] = 0
+            before = output.size + np.cumsum(kept) - kept
+            opened = headers.copy()
+            if not at_line_start and in_header:
+                opened[0] = False
+                if return_names:
+                    names[-1] += decode_name(chunk[: line_ends[0]])
+            offsets.extend(before[opened].tolist())
+            if return_names:
+                for begin, end in zip(starts[opened], line_ends[opened]):
+                    names.append(decode_name(chunk[begin + 1 : end]))
+
+            output.write(table[chunk[keep]])
+            at_line_start = chunk[-1] == newline
+            in_header = bool(headers[-1]) and not at_line_start
+            del chunk, keep
+
+    # Sequence before the first header is a record without a name
+    if output.size != 0 and (len(offsets) == 0 or offsets[0] != 0):
+        offsets.insert(0, 0)
+        names.insert(0, "")
+    offsets.append(output.size)
+    records = RaggedArray(output.close(), np.array(offsets, dtype=np.intp))
+    if return_names:
+        return records, [name.rstrip("\r") for name in names]
+    return records
+
+
+def read_fastq(
+    source,
+    alphabet="ACGT",
+    out=None,
+    return_names: bool = False,
+    chunk_size=default_chunk_size,
+) -> RaggedArray:
+    """
+    Read records of a FASTQ file as arrays of symbol codes.
+
+    Every record takes four lines: `@` and a name, a sequence, `+`
+    and the qualities. The file is read by chunks of bytes, bytes
+    of the sequence lines are decoded by a lookup table straight into `uint8`
+    codes, without creating Python strings for the sequences.
+    Qualities are skipped.
+
+    Records are returned as [RaggedArray][foapy.core.RaggedArray]
+    of codes with offsets of the records, ready for
+    [foapy.batch][foapy.batch] functions.
+
+    Parameters
+    ----------
+    source : path or binary file
+        FASTQ file to read. Paths ending with `.gz` are decompressed.
+    alphabet : str, optional
+        Symbols to decode, "ACGT" by default. A symbol is decoded to its index
+        in the alphabet ignoring the case, any other symbol (e.g. `N`)
+        is decoded to `len(alphabet)`. If None the bytes are kept as is.
+    out : np.memmap or path, optional
+        Memory-mapped array or path of a raw binary file to write the codes
+        into. An array must be long enough for the codes, a file is created
+        with the length of the codes. A new in-memory array by default.
+    return_names : bool, optional
+        If True also return the names of the records
+    chunk_size : int, optional
+        Bytes read from the file at once, 16 MiB by default.
+
+    Returns
+    -------
+    records : RaggedArray
+        Codes of the symbols of every record.
+
+    names : list of str
+        Names of the records without `@`.
+        Only provided if `return_names` is True.
+
+    Raises
+    -------
+    ValueError
+        When the file is not a valid FASTQ file
+
+    ValueError
+        When the alphabet is longer than 255 symbols or out is too short
+
+    ValueError
+        When chunk_size is not a positive integer
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    with open("reads.fastq", "w") as file:
+        file.write("@read1\\nACGTTA\\n+\\nIIIIII\\n@read2\\nGGCN\\n+\\nIIII\\n")
+    records = foapy.io.read_fastq("reads.fastq")
+    print(records)
+    # RaggedArray([[0, 1, 2, 3, 3, 0], [2, 2, 1, 4]])
+    ```
+    """  # noqa: E501
+
+    validate_chunk_size(chunk_size)
+    table = decode_table(alphabet)
+    output = CodesOutput(out)
+    offsets = [0]
+    names = []
+    lines = 0
+    rest = np.empty(0, dtype=np.uint8)
+
+    with open_binary(source) as file:
+        while True:
+            data = file.read(chunk_size)
+            chunk = np.frombuffer(data, dtype=np.uint8)
+            if rest.shape[0] != 0:
+                chunk = np.concatenate((rest, chunk))
+            if len(data) == 0:
+                # The last line may have no line break
+                if chunk.shape[0] == 0:
+                    break
+                chunk = np.append(chunk, np.uint8(newline))
+
+            ends = np.flatnonzero(chunk == newline)
+            rest = chunk[ends[-1] + 1 :] if ends.shape[0] != 0 else chunk
+            if ends.shape[0] == 0:
+                continue
+            starts = np.concatenate(([0], ends[:-1] + 1))
+            # Line breaks may be preceded by carriage returns
+            ends = ends - (chunk[np.maximum(ends - 1, 0)] == carriage_return)
+            ends = np.maximum(ends, starts)
+            kinds = (lines + np.arange(starts.shape[0])) % 4
+            lines += starts.shape[0]
+
+            validate_lines(chunk, starts, ends, kinds)
+            sequences = kinds == 1
+            keep = np.zeros(chunk.shape[0] + 1, dtype=np.int8)
+            keep[starts[sequences]] = 1
+            keep[ends[sequences]] -= 1
+            keep = np.cumsum(keep[:-1], dtype=np.int8).view(np.bool_)
+
+            lengths = ends[sequences] - starts[sequences]
+            offsets.extend((output.size + np.cumsum(lengths)).tolist())
+            if return_names:
+                for begin, end in zip(starts[kinds == 0], ends[kinds == 0]):
+                    names.append(decode_name(chunk[begin + 1 : end]))
+
+            output.write(table[chunk[keep]])
+            del chunk, keep
+
+    if lines % 4 != 0:
+        message = f"Incomplete FASTQ record. Expected 4 lines, exists {lines % 4}"
+        raise ValueError({"message": message})
+    records = RaggedArray(output.close(), np.array(offsets, dtype=np.intp))
+    if return_names:
+        return records, names
+    return records
+
+
+def validate_lines(chunk, starts, ends, kinds):
+    """
+    Check markers of the name and the separator lines of FASTQ records.
+    """
+    for kind, marker in ((0, "@"), (2, "+")):
+        lines = kinds == kind
+        empty = starts[lines] == ends[lines]
+        markers = chunk[np.minimum(starts[lines], chunk.shape[0] - 1)]
+        if np.any(empty | (markers != ord(marker))):
+            message = f"Invalid FASTQ record. Expected a line starting with {marker}"
+            raise ValueError({"message": message})
+
+
+def validate_chunk_size(chunk_size):
+    """
+    Check that chunks read from a file are not empty.
+    """
+    if chunk_size < 1:
+        message = f"Invalid chunk size {chunk_size}. Use a positive integer."
+        raise ValueError({"message": message})
+
+
+def decode_table(alphabet):
+    """
+    Table of codes of all byte values for the alphabet.
+    """
+    if alphabet is None:
+        return np.arange(256, dtype=np.uint8)
+    if len(alphabet) > 255:
+        message = f"Alphabet is too long. Expected at most 255 symbols, exists {len(alphabet)}"  # noqa: E501
+        raise ValueError({"message": message})
+    table = np.full(256, len(alphabet), dtype=np.uint8)
+    for code, symbol in enumerate(alphabet):
+        for variant in {symbol.upper(), symbol.lower()}:
+            table[ord(variant)] = code
+    return table
+
+
+def decode_name(name):
+    return name.tobytes().decode("utf-8", errors="replace")
+
+
+def open_binary(source):
+    """
+    Open a file given by path, decompressing gzip files, or use
+    a given binary file without closing it.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source).endswith(".gz"):
+            return gzip.open(source, "rb")
+        return open(source, "rb")
+    return KeepOpen(source)
+
+
+class KeepOpen:
+    """
+    Context manager of a file opened by the caller.
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def __enter__(self):
+        return self.file
+
+    def __exit__(self, *args):
+        return False
+
+
+class CodesOutput:
+    """
+    Destination of the decoded codes: chunks in memory, a raw binary file
+    created by path or a given array.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self.size = 0
+        self.parts = []
+        self.file = None
+        if isinstance(out, (str, os.PathLike)):
+            self.file = open(out, "wb")
+
+    def write(self, codes):
+        if self.file is not None:
+            self.file.write(codes.tobytes())
+        elif self.out is not None:
+            if self.out.shape[0] < self.size + codes.shape[0]:
+                message = (
+                    f"Incorrect out shape. Expected at least "
+                    f"({self.size + codes.shape[0]},), exists {self.out.shape}"
+                )
+                raise ValueError({"message": message})
+            self.out[self.size : self.size + codes.shape[0]] = codes
+        else:
+            self.parts.append(codes)
+        self.size += codes.shape[0]
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            if self.size == 0:
+                return np.empty(0, dtype=np.uint8)
+            return np.memmap(self.out, dtype=np.uint8, mode="r+", shape=(self.size,))
+        if self.out is not None:
+            return self.out[: self.size]
+        if len(self.parts) == 0:
+            return np.empty(0, dtype=np.uint8)
+        return np.concatenate(self.parts)
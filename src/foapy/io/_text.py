@@ -0,0 +1,125 @@
+import re
+
+import numpy as np
+from numpy import ndarray
+
+from foapy.core._sort import Ids
+from foapy.exceptions import Not1DArrayException
+
+# Words are runs of letters, digits and underscores
+default_pattern = r"\w+"
+
+
+def encode_words(
+    source,
+    pattern=default_pattern,
+    lower: bool = False,
+    return_alphabet: bool = False,
+    vocabulary=None,
+) -> ndarray:
+    """
+    Encode a text or a sequence of words into an order of integer ids.
+
+    Every word gets its id from a hashed vocabulary in one pass:
+    a new word gets the next id, a known word its id. Ids of words
+    of a new vocabulary are indexes in order of the first appearance,
+    so the result is the same as [foapy.order()][foapy.order] of an array
+    of the words returns, without building a fixed-width string array
+    and sorting it.
+
+    Parameters
+    ----------
+    source : str, text file or iterable of str
+        Text to split into words by the pattern, a text file read line
+        by line, or a sequence of words (e.g. a list or an array of strings).
+    pattern : str, optional
+        Regular expression matching words of a text, `\\w+` by default.
+        Not used for a sequence of words.
+    lower : bool, optional
+        If True words are converted to lower case.
+    return_alphabet : bool, optional
+        If True also return the alphabet of the words.
+    vocabulary : dict, optional
+        Ids of known words, updated in place with new words. Shares ids
+        between texts, ids of the words must be `0..len(vocabulary) - 1`.
+        A new vocabulary by default.
+
+    Returns
+    -------
+    order : ndarray
+        Ids of the words.
+
+    alphabet : ndarray
+        Words of the vocabulary ordered by their ids.
+        Only provided if `return_alphabet` is True.
+
+    Raises
+    -------
+    Not1DArrayException
+        When source is an array that is not 1-dimensional
+
+    Examples
+    --------
+
+    ``` py linenums="1"
+    import foapy
+
+    order, alphabet = foapy.io.encode_words("To be, or not to be", lower=True, return_alphabet=True)
+    print(order)
+    # [0 1 2 3 0 1]
+    print(alphabet)
+    # ['to' 'be' 'or' 'not']
+    print(foapy.intervals(order, foapy.binding.start, foapy.mode.normal))
+    # [1 2 3 4 4 4]
+    ```
+
+    Share ids of the words between texts.
+
+    ``` py linenums="1"
+    import foapy
+
+    vocabulary = {}
+    first = foapy.io.encode_words(["a", "b", "a"], vocabulary=vocabulary)
+    second = foapy.io.encode_words(["c", "a"], vocabulary=vocabulary)
+    print(first, second, vocabulary)
+    # [0 1 0] [2 0] {'a': 0, 'b': 1, 'c': 2}
+    ```
+    """  # noqa: E501
+
+    words = split_words(source, pattern, lower)
+    count = len(words) if hasattr(words, "__len__") else -1
+    if vocabulary is None:
+        ids = Ids()
+        order = np.fromiter(map(ids.__getitem__, words), dtype=np.intp, count=count)
+    else:
+        ids = vocabulary
+        assign = ids.setdefault
+        order = np.fromiter(
+            (assign(word, len(ids)) for word in words), dtype=np.intp, count=count
+        )
+
+    if return_alphabet:
+        alphabet = list(ids) if vocabulary is None else sorted(ids, key=ids.get)
+        return order, np.array(alphabet, dtype=str)
+    return order
+
+
+def split_words(source, pattern, lower):
+    """
+    Iterate over words of a text, of lines of a text file
+    or of a sequence of words.
+    """
+    if isinstance(source, str):
+        return re.findall(pattern, source.lower() if lower else source)
+
+    if hasattr(source, "read"):
+        expression = re.compile(pattern)
+        lines = map(str.lower, source) if lower else source
+        return (word for line in lines for word in expression.findall(line))
+
+    if isinstance(source, np.ndarray):
+        if source.ndim != 1:
+            message = f"Incorrect array form. Expected d1 array, exists {source.ndim}"
+            raise Not1DArrayException({"message": message})
+        source = source.tolist()
+    return map(str.lower, source) if lower else source
@@ -13,5 +13,6 @@ else:
     from ._alphabet import alphabet  # noqa: F401
     from ._intervals import intervals  # noqa: F401
     from ._order import order  # noqa: F401
+    from ._sparse_order import SparseOrder  # noqa: F401
 
-    __all__ = list({"order", "intervals", "alphabet"})
+    __all__ = list({"order", "intervals", "alphabet", "SparseOrder"})
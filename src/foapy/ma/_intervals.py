@@ -3,18 +3,83 @@ from numpy import ma
 
 from foapy import binding as binding_enum
 from foapy import mode as mode_enum
+from foapy.core import RaggedArray
+from foapy.core._intervals import intervals_dtype
+from foapy.core._sort import order_groups
 from foapy.exceptions import InconsistentOrderException, Not1DArrayException
+from foapy.ma._sparse_order import SparseOrder
 
 
-def intervals(X, binding, mode):
+def sparse_intervals(X, binding, mode, dtype):
+    """
+    Extract congeneric intervals from positions of a sparse order.
+
+    All congeneric sequences are processed at once on the flat
+    positions buffer, the result shares the offsets layout.
+    """
+    positions = X.positions
+    offsets = X.offsets
+    length = X.length
+
+    first = offsets[:-1]
+    last = offsets[1:] - 1
+
+    indecies = np.empty(positions.shape[0], dtype=dtype)
+    if binding == binding_enum.start:
+        indecies[1:] = positions[1:] - positions[:-1]
+        delta = length - positions[last] if mode == mode_enum.cycle else 1
+        indecies[first] = positions[first] + delta
+        boundary = first
+    else:
+        indecies[:-1] = positions[1:] - positions[:-1]
+        delta = positions[first] if mode == mode_enum.cycle else 0
+        indecies[last] = length - positions[last] + delta
+        boundary = last
+
+    counts = np.arange(len(X) + 1)
+    if mode == mode_enum.lossy:
+        indecies = np.delete(indecies, boundary)
+        offsets = offsets - counts
+    elif mode == mode_enum.redundant:
+        if binding == binding_enum.start:
+            indecies = np.insert(indecies, last + 1, length - positions[last])
+        else:
+            indecies = np.insert(indecies, first, positions[first] + 1)
+        offsets = offsets + counts
+
+    return RaggedArray(indecies, offsets)
+
+
+def order_positions(X, power):
+    """
+    Group positions of every element of an order with a known power
+    into a sparse congeneric order.
+    """
+    order = np.asanyarray(X)
+    if order.ndim != 1:
+        message = f"Incorrect array form. Expected d1 array, exists {order.ndim}"
+        raise Not1DArrayException({"message": message})
+    perm, mask = order_groups(order, power)
+    starts = np.flatnonzero(mask[:-1])
+    if starts.shape[0] != power:
+        message = f"Order must contain every value of the range 0..{power - 1}."
+        raise ValueError({"message": message})
+    offsets = np.append(starts, order.shape[0])
+    return SparseOrder(perm, offsets, order.shape[0])
+
+
+def intervals(X, binding, mode, ragged=False, dtype=None, power=None):
     """
     Finding array of array of intervals of the uniform
     sequences in the given input sequence
 
     Parameters
     ----------
-    X: masked_array
-        Array to get intervals.
+    X: masked_array, SparseOrder or array_like
+        Congeneric order to get intervals. Either the dense masked array
+        or the [SparseOrder][foapy.ma.SparseOrder] returned by
+        `foapy.ma.order(X, sparse=True)`, or an order returned by
+        [foapy.order()][foapy.order] when power is given.
 
     binding: int
         binding.start = 1 - Intervals are extracted from left to right.
@@ -46,10 +111,30 @@ def intervals(X, binding, mode):
         array is determined
         by the binding.
 
+    ragged: bool, optional
+        If True return intervals of all congeneric sequences as one
+        [RaggedArray][foapy.core.RaggedArray] - a contiguous intervals
+        buffer plus offsets - instead of a list of arrays.
+        The result is always ragged when X is SparseOrder.
+
+    dtype: dtype or "auto", optional
+        Integer dtype of the intervals, `np.intp` by default.
+        "auto" selects `int32` for sequences shorter than 2^31
+        and `int64` otherwise.
+
+    power: int, optional
+        Power of the alphabet of the order X given as a 1-dimensional array
+        of integers from 0 to `power - 1`, every one of them occurring.
+        Positions of every element are grouped by radix sort keys
+        of the width given by the power and a table of counts of
+        the elements, without building the congeneric order.
+
     Returns
     -------
-    result: array or Exception.
-        Exception if not d1 array or wrong mask, array otherwise.
+    result: array, RaggedArray or Exception.
+        Exception if not d1 array or wrong mask,
+        [RaggedArray][foapy.core.RaggedArray] if X is SparseOrder
+        or ragged is True, array otherwise.
 
     Examples
     --------
@@ -140,6 +225,24 @@ def intervals(X, binding, mode):
 
     ----9----
     >>> import foapy.ma as ma
+    >>> a = ma.masked_array([2, 4, 2, 2, 4])
+    >>> X = ma.order(a, sparse=True)
+    >>> b = ma.intervals(X, binding.start, mode.normal)
+    >>> b
+    RaggedArray([[1, 2, 1], [2, 3]])
+
+    ----10----
+    >>> import foapy.ma as ma
+    >>> a = ma.masked_array([2, 4, 2, 2, 4])
+    >>> X = ma.order(a)
+    >>> b = ma.intervals(X, binding.end, mode.normal, ragged=True)
+    >>> b
+    RaggedArray([[2, 1, 2], [3, 1]])
+    >>> b.data, b.offsets
+    [2 1 2 3 1] [0 3 5]
+
+    ----11----
+    >>> import foapy.ma as ma
     >>> a = ['a', 'b', 'c', 'a', 'b', 'c', 'c', 'c', 'b', 'a', 'c', 'b', 'c']
     >>> mask = [0, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0, 1, 0]
     >>> masked_a = ma.masked_array(a, mask)
@@ -147,7 +250,7 @@ def intervals(X, binding, mode):
     >>> b
     Exception
 
-    ----10----
+    ----12----
     >>> import foapy.ma as ma
     >>> a = [[2, 2, 2], [2, 2, 2]]
     >>> mask = [[0, 0, 0], [0, 0, 0]]
@@ -174,11 +277,21 @@ def intervals(X, binding, mode):
         raise ValueError(
             {"message": "Invalid mode value. Use mode.lossy,normal,cycle or redundant."}
         )
+    if power is not None:
+        X = order_positions(X, power)
+        result = sparse_intervals(X, binding, mode, intervals_dtype(dtype, X.length))
+        return result if ragged else result.tolist()
+    if isinstance(X, SparseOrder):
+        return sparse_intervals(X, binding, mode, intervals_dtype(dtype, X.length))
+
     # ex.:
     # ar = ['a', 'c', 'c', 'e', 'd', 'a']
 
     power = X.shape[0]
+    dtype = intervals_dtype(dtype, X.shape[1] if len(X.shape) > 1 else 0)
     if power == 0:
+        if ragged:
+            return RaggedArray(np.array([], dtype=dtype), np.zeros(1, dtype=np.intp))
         return np.array([])
 
     if len(X.shape) != 2:
@@ -222,7 +335,7 @@ def intervals(X, binding, mode):
     first_indexes = np.argwhere(border_indexes[:-1]).ravel()
     last_indexes = np.argwhere(border_indexes[1:]).ravel()
 
-    indecies = np.zeros(positions.shape[1], dtype=int)
+    indecies = np.zeros(positions.shape[1], dtype=dtype)
     indecies[1:] = positions[1, 1:] - positions[1, :-1]
     delta = indecies[last_indexes] if mode == mode_enum.cycle else 1
     indecies[first_indexes] = positions[1][first_indexes] + delta
@@ -248,13 +361,27 @@ def intervals(X, binding, mode):
         split_boarders[positions[0][last_indexes[1:]] * 2] = 0
         split_boarders[positions[0][last_indexes] * 2 + 1] = last_indexes + 1
 
-    preserve_previous = np.frompyfunc(lambda x, y: x if y == 0 else y, 2, 1)
-    split_boarders = preserve_previous.accumulate(split_boarders)
+    # Elements without intervals have zero borders, they take the border
+    # of the closest previous element: index of the last non-zero border
+    # is carried forward by maximum.accumulate.
+    carry = np.where(split_boarders != 0, np.arange(power * 2), 0)
+    np.maximum.accumulate(carry, out=carry)
+    split_boarders = split_boarders[carry]
     if binding == binding_enum.end:
         split_boarders[:-1] = np.diff(split_boarders)
         split_boarders[-1:] = len(indecies) - split_boarders[-1]
         split_boarders = np.cumsum(split_boarders[::-1])
         indecies = indecies[::-1]
 
+    if ragged:
+        # Gather intervals of all congeneric sequences into one buffer
+        # skipping the gaps between [start, end) borders of neighbours
+        starts = split_boarders[0::2]
+        lengths = split_boarders[1::2] - starts
+        offsets = np.zeros(power + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+        shifts = np.repeat(starts - offsets[:-1], lengths)
+        return RaggedArray(indecies[np.arange(offsets[-1]) + shifts], offsets)
+
     indecies = np.array_split(indecies, split_boarders)
     return indecies[1:-1:2]
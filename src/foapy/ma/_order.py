@@ -3,9 +3,10 @@ import numpy.ma as ma
 
 from foapy import order as general_order
 from foapy.exceptions import Not1DArrayException
+from foapy.ma._sparse_order import sparse_order
 
 
-def order(X, return_alphabet=False) -> np.ma.MaskedArray:
+def order(X, return_alphabet=False, sparse=False) -> np.ma.MaskedArray:
     """
     Find array sequence  in order of their appearance
 
@@ -17,10 +18,16 @@ def order(X, return_alphabet=False) -> np.ma.MaskedArray:
     return_alphabet: bool, optional
         If True also return array's alphabet
 
+    sparse: bool, optional
+        If True return [SparseOrder][foapy.ma.SparseOrder] - positions
+        of each element stored in one flat array plus offsets -
+        instead of the dense power × length masked array.
+
     Returns
     -------
-    result: masked_array or Exception.
-        Exception if not d1 array, masked_array otherwise.
+    result: masked_array, SparseOrder or Exception.
+        Exception if not d1 array, SparseOrder if sparse is True,
+        masked_array otherwise.
 
     Examples
     --------
@@ -99,19 +106,28 @@ def order(X, return_alphabet=False) -> np.ma.MaskedArray:
 
     ----7----
     >>> import foapy.ma as ma
+    >>> a = ['a', 'b', 'a', 'c', 'd']
+    >>> b = ma.order(a, sparse=True)
+    >>> b
+    SparseOrder([[0, 2], [1], [3], [4]], length=5)
+    >>> b.positions, b.offsets
+    [0 2 1 3 4] [0 2 3 4 5]
+
+    ----8----
+    >>> import foapy.ma as ma
     >>> a = []
     >>> b = ma.order(a)
     >>> b
     []
 
-    ----8----
+    ----9----
     >>> import foapy.ma as ma
     >>> a = [[2, 2, 2], [2, 2, 2]]
     >>> b = ma.order(a)
     >>> b
     Exception
 
-    ----9----
+    ----10----
     >>> import foapy.ma as ma
     >>> a = [[[1], [3]], [[6], [9]], [[6], [3]]]
     >>> b = ma.order(a)
@@ -129,6 +145,12 @@ def order(X, return_alphabet=False) -> np.ma.MaskedArray:
     power = len(alphabet_values)
     length = len(X)
 
+    if sparse:
+        result, indecies_selector = sparse_order(order, ma.getmaskarray(X), power)
+        if return_alphabet:
+            return result, alphabet_values[indecies_selector]
+        return result
+
     result_data = np.tile(order, power).reshape(power, length)
     alphabet_indecies = np.arange(power).reshape(power, 1)
     result_mask = result_data != alphabet_indecies
@@ -0,0 +1,75 @@
+import numpy as np
+
+from foapy.core import RaggedArray
+
+
+class SparseOrder(RaggedArray):
+    """
+    Compact congeneric order of a sequence.
+
+    Instead of the dense alphabet power × length masked matrix returned by
+    [foapy.ma.order()][foapy.ma.order], every congeneric sequence is stored
+    as the ascending list of positions where its element occurs.
+    All position lists share one flat buffer split by an offsets array,
+    so the representation costs O(length) memory.
+
+    |     **X**     |  a |  b |  a |  c |  d |
+    |:-------------:|:--:|:--:|:--:|:--:|:--:|
+    | a             |  0 | -- |  0 | -- | -- |
+    | b             | -- |  1 | -- | -- | -- |
+    | c             | -- | -- | -- |  2 | -- |
+    | d             | -- | -- | -- | -- |  3 |
+
+    The order above is stored as positions `[0 2 1 3 4]`,
+    offsets `[0 2 3 4 5]` and length `5`.
+
+    Parameters
+    ----------
+    positions : array_like
+        Flat buffer with positions of all congeneric sequences.
+    offsets : array_like
+        Boundaries of congeneric sequences in the `positions` buffer.
+    length : int
+        Length of the source sequence.
+    """
+
+    def __init__(self, positions, offsets, length):
+        super().__init__(positions, offsets)
+        self.length = int(length)
+
+    @property
+    def positions(self):
+        """
+        Flat buffer with positions of all congeneric sequences.
+        """
+        return self.data
+
+    @property
+    def shape(self):
+        """
+        Shape of the equivalent dense congeneric order.
+        """
+        return (len(self), self.length)
+
+    def __repr__(self):
+        rows = ", ".join(repr(row.tolist()) for row in self)
+        return f"{type(self).__name__}([{rows}], length={self.length})"
+
+
+def sparse_order(order, mask, power):
+    """
+    Group positions of the order by element the same way as the dense
+    congeneric order: elements with an unmasked occurrence keep all
+    their positions, including masked ones, elements masked everywhere
+    are dropped.
+    """
+    selector = np.bincount(order[~mask], minlength=power) != 0
+    positions = np.flatnonzero(selector[order])
+    elements = order[positions]
+    positions = positions[elements.argsort(kind="mergesort")]
+
+    counts = np.bincount(elements, minlength=power)[selector]
+
+    offsets = np.zeros(np.count_nonzero(selector) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+    return SparseOrder(positions, offsets, order.shape[0]), selector
@@ -58,3 +58,20 @@ class TestAlphabet(TestCase):
         expected = np.array(["m"])
         exists = alphabet(X)
         assert_array_equal(expected, exists)
+
+    def test_word_values(self):
+        X = np.array(["the", "cat", "the", "dog", "cat"])
+        expected = np.array(["the", "cat", "dog"])
+        exists = alphabet(X)
+        assert_array_equal(expected, exists)
+
+    def test_object_values(self):
+        X = np.array(["ab", ("c", 1), 3, "ab", 3], dtype=object)
+        exists = alphabet(X)
+        self.assertEqual(exists.tolist(), ["ab", ("c", 1), 3])
+
+    def test_unhashable_object_values(self):
+        X = np.empty(3, dtype=object)
+        X[:] = [[2], [1], [2]]
+        exists = alphabet(X)
+        self.assertEqual(exists.tolist(), [[2], [1]])
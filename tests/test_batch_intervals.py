@@ -0,0 +1,121 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import binding, characteristics, intervals, mode
+from foapy.batch import intervals as batch_intervals
+from foapy.core import RaggedArray
+from foapy.exceptions import Not1DArrayException
+
+
+class TestBatchIntervals(TestCase):
+    """
+    Test list of intervals of batches of sequences
+    """
+
+    bindings = [binding.start, binding.end]
+    modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+
+    def AssertBatch(self, X):
+        for _binding in self.bindings:
+            for _mode in self.modes:
+                exists = batch_intervals(X, _binding, _mode)
+                self.assertEqual(len(X), len(exists))
+                for row, row_intervals in zip(X, exists):
+                    assert_array_equal(intervals(row, _binding, _mode), row_intervals)
+
+    def test_start_normal(self):
+        X = [["a", "b", "a", "c"], ["c", "c", "a", "b"]]
+        expected = np.array([[1, 2, 2, 4], [1, 1, 3, 4]])
+        exists = batch_intervals(X, binding.start, mode.normal)
+        assert_array_equal(expected, exists)
+
+    def test_end_redundant(self):
+        X = [[2, 4, 2, 2, 4], [1, 1, 1, 1, 1]]
+        exists = batch_intervals(X, binding.end, mode.redundant)
+        self.assertIsInstance(exists, RaggedArray)
+        assert_array_equal([1, 2, 2, 3, 1, 2, 1, 1, 1, 1, 1, 1, 1], exists.data)
+        assert_array_equal([0, 7, 13], exists.offsets)
+
+    def test_start_lossy(self):
+        X = [[2, 4, 2, 2, 4], [1, 2, 3, 4, 5]]
+        exists = batch_intervals(X, binding.start, mode.lossy)
+        assert_array_equal([2, 1, 3], exists.data)
+        assert_array_equal([0, 3, 3], exists.offsets)
+
+    def test_int_values(self):
+        self.AssertBatch([[2, 4, 2, 2, 4], [4, 4, 4, 4, 4], [1, 2, 3, 4, 5]])
+
+    def test_equal_values_in_neighbour_rows(self):
+        self.AssertBatch([[1, 1], [1, 1], [2, 1]])
+
+    def test_random_values(self):
+        rng = np.random.default_rng(0)
+        self.AssertBatch(rng.integers(0, 5, (20, 30)))
+        self.AssertBatch(rng.choice(np.array(list("ACGT"), dtype="S1"), (5, 40)))
+
+    def test_dtype(self):
+        X = [[2, 4, 2, 2, 4], [4, 4, 4, 4, 4]]
+        exists = batch_intervals(X, binding.start, mode.cycle, dtype="auto")
+        self.assertEqual(np.int32, exists.dtype)
+
+    def test_characteristics(self):
+        rng = np.random.default_rng(1)
+        X = rng.integers(0, 4, (10, 25))
+        exists = batch_intervals(X, binding.start, mode.normal)
+        depths = characteristics.ma.depth(exists)
+        means = characteristics.ma.arithmetic_mean(exists)
+        for row, row_depth, row_mean in zip(X, depths, means):
+            row_intervals = intervals(row, binding.start, mode.normal)
+            self.assertAlmostEqual(characteristics.depth(row_intervals), row_depth)
+            self.assertAlmostEqual(
+                characteristics.arithmetic_mean(row_intervals), row_mean
+            )
+
+    def test_ragged(self):
+        X = RaggedArray(["a", "b", "a", "c", "c", "b", "c"], [0, 3, 7])
+        exists = batch_intervals(X, binding.end, mode.normal)
+        self.assertIsInstance(exists, RaggedArray)
+        assert_array_equal([2, 2, 1, 1, 2, 2, 1], exists.data)
+        assert_array_equal([0, 3, 7], exists.offsets)
+
+    def test_ragged_random_values(self):
+        rng = np.random.default_rng(2)
+        lengths = rng.integers(0, 20, 30)
+        offsets = np.zeros(31, dtype=int)
+        np.cumsum(lengths, out=offsets[1:])
+        for values in [
+            rng.integers(0, 4, offsets[-1]),
+            rng.integers(-(2**62), 2**62, offsets[-1]),
+            rng.choice(["A", "C", "G", "T"], offsets[-1]),
+        ]:
+            self.AssertBatch(RaggedArray(values, offsets))
+
+    def test_ragged_offsets_inside_buffer(self):
+        X = RaggedArray([9, 1, 2, 1, 9], [1, 2, 4])
+        exists = batch_intervals(X, binding.start, mode.redundant)
+        assert_array_equal([1, 1, 1, 2, 1, 2], exists.data)
+        assert_array_equal([0, 2, 6], exists.offsets)
+
+    def test_void(self):
+        X = np.empty((0, 5), dtype=int)
+        for _mode in self.modes:
+            self.assertEqual(0, len(batch_intervals(X, binding.start, _mode)))
+
+    def test_empty_rows(self):
+        X = np.empty((2, 0), dtype=int)
+        self.AssertBatch(X)
+
+    def test_not_d2(self):
+        with pytest.raises(Not1DArrayException):
+            batch_intervals([1, 2, 3], binding.start, mode.normal)
+
+    def test_binding_exception(self):
+        with pytest.raises(ValueError):
+            batch_intervals([[1, 2]], 5, mode.normal)
+
+    def test_mode_exception(self):
+        with pytest.raises(ValueError):
+            batch_intervals([[1, 2]], binding.start, 7)
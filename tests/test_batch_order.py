@@ -0,0 +1,105 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import alphabet, order
+from foapy.batch import alphabet as batch_alphabet
+from foapy.batch import order as batch_order
+from foapy.core import RaggedArray
+from foapy.exceptions import Not1DArrayException
+
+
+class TestBatchOrder(TestCase):
+    """
+    Test list of batches of sequences
+    """
+
+    def AssertBatch(self, X):
+        exists, exists_alphabet = batch_order(X, True)
+        if not isinstance(X, RaggedArray):
+            self.assertEqual(np.shape(X), exists.shape)
+        self.assertEqual(len(X), len(exists_alphabet))
+        self.assertEqual(len(X), len(batch_alphabet(X)))
+        for row, row_order, row_alphabet, row_batch_alphabet in zip(
+            X, exists, exists_alphabet, batch_alphabet(X)
+        ):
+            assert_array_equal(order(row), row_order)
+            assert_array_equal(alphabet(row), row_alphabet)
+            assert_array_equal(alphabet(row), row_batch_alphabet)
+
+    def test_string_values(self):
+        X = [["a", "b", "a", "c"], ["c", "c", "a", "b"]]
+        expected = np.array([[0, 1, 0, 2], [0, 0, 1, 2]])
+        exists, exists_alphabet = batch_order(X, True)
+        assert_array_equal(expected, exists)
+        assert_array_equal(["a", "b", "c", "c", "a", "b"], exists_alphabet.data)
+        assert_array_equal([0, 3, 6], exists_alphabet.offsets)
+
+    def test_int_values(self):
+        self.AssertBatch([[2, 4, 2, 2, 4], [4, 4, 4, 4, 4], [1, 2, 3, 4, 5]])
+
+    def test_equal_values_in_neighbour_rows(self):
+        self.AssertBatch([[1, 1], [1, 1], [2, 1]])
+
+    def test_random_values(self):
+        rng = np.random.default_rng(0)
+        self.AssertBatch(rng.integers(0, 5, (20, 30)))
+        self.AssertBatch(rng.choice(np.array(list("ACGT"), dtype="S1"), (5, 40)))
+
+    def test_alphabet(self):
+        exists = batch_alphabet([[3, 1, 3, 2], [2, 2, 2, 2]])
+        assert_array_equal([3, 1, 2, 2], exists.data)
+        assert_array_equal([3, 1], exists.lengths)
+
+    def test_ragged(self):
+        X = RaggedArray(["a", "b", "a", "c", "c", "b"], [0, 3, 6])
+        exists, exists_alphabet = batch_order(X, True)
+        self.assertIsInstance(exists, RaggedArray)
+        assert_array_equal([0, 1, 0, 0, 0, 1], exists.data)
+        assert_array_equal([0, 3, 6], exists.offsets)
+        assert_array_equal(["a", "b", "c", "b"], exists_alphabet.data)
+        assert_array_equal([0, 2, 4], exists_alphabet.offsets)
+
+    def test_ragged_random_values(self):
+        rng = np.random.default_rng(3)
+        lengths = rng.integers(0, 20, 30)
+        offsets = np.zeros(31, dtype=int)
+        np.cumsum(lengths, out=offsets[1:])
+        self.AssertBatch(RaggedArray(rng.integers(0, 5, offsets[-1]), offsets))
+        self.AssertBatch(RaggedArray(rng.integers(0, 5, offsets[-1]) * 10**9, offsets))
+
+    def test_ragged_byte_values(self):
+        rng = np.random.default_rng(4)
+        lengths = rng.integers(0, 50, 40)
+        offsets = np.zeros(41, dtype=int)
+        np.cumsum(lengths, out=offsets[1:])
+        values = rng.integers(0, 256, offsets[-1]).astype(np.uint8)
+        self.AssertBatch(RaggedArray(values, offsets))
+        self.AssertBatch(RaggedArray(values.view(np.int8), offsets))
+        self.AssertBatch(RaggedArray(values.view("S1"), offsets))
+
+    def test_ragged_big_endian_values(self):
+        X = np.random.default_rng(5).integers(0, 10**6, 40).astype(">i8")
+        X[::3] = X[0]
+        exists = batch_order(RaggedArray(X, [0, 20, 40]))
+        expected = batch_order(RaggedArray(X.astype("<i8"), [0, 20, 40]))
+        assert_array_equal(expected.data, exists.data)
+        self.AssertBatch(RaggedArray(X, [0, 20, 40]))
+
+    def test_void(self):
+        exists = batch_order(np.empty((0, 5), dtype=int))
+        self.assertEqual((0, 5), exists.shape)
+        self.assertEqual(0, len(batch_alphabet(np.empty((0, 5), dtype=int))))
+
+    def test_empty_rows(self):
+        exists = batch_order(np.empty((3, 0), dtype=int))
+        self.assertEqual((3, 0), exists.shape)
+        assert_array_equal([0, 0, 0], batch_alphabet(np.empty((3, 0))).lengths)
+
+    def test_not_d2(self):
+        with pytest.raises(Not1DArrayException):
+            batch_order([1, 2, 3])
+        with pytest.raises(Not1DArrayException):
+            batch_alphabet([[[1]]])
@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from foapy import binding, mode
+from foapy.batch import profile as batch_profile
+from foapy.characteristics import profile
+from foapy.core import RaggedArray
+from foapy.exceptions import Not1DArrayException
+from foapy.ma import intervals, order
+
+
+class TestBatchProfile(TestCase):
+    """
+    Test characteristics of batches of sequences calculated in parallel
+    """
+
+    def AssertBatch(self, X, names, **kwargs):
+        exists = batch_profile(X, names, **kwargs)
+        self.assertEqual(list(names), list(exists.keys()))
+        bind = kwargs.get("binding", binding.start)
+        mod = kwargs.get("mode", mode.normal)
+        for index, row in enumerate(X):
+            grouped = intervals(order(np.ma.masked_array(row), sparse=True), bind, mod)
+            expected = profile(grouped, names)
+            for name in names:
+                self.assertEqual(len(X), len(exists[name]))
+                assert_allclose(expected[name], exists[name][index])
+
+    def test_example(self):
+        X = [["a", "b", "a", "c"], ["c", "c", "a", "b"]]
+        exists = batch_profile(X, ["depth", "regularity"], workers=2)
+        assert_allclose([4.0, 3.5849625], exists["depth"])
+        assert_allclose([0.97098354, 1.0], exists["regularity"])
+
+    def test_threads(self):
+        X = np.random.default_rng(0).integers(0, 4, (20, 30))
+        self.AssertBatch(
+            X, ["depth", "uniformity"], workers=3, chunk_size=4, mode=mode.cycle
+        )
+
+    def test_single_worker(self):
+        X = np.random.default_rng(1).integers(0, 4, (7, 10))
+        self.AssertBatch(
+            X, ["volume", "geometric_mean"], workers=1, binding=binding.end
+        )
+
+    def test_processes(self):
+        X = np.random.default_rng(2).integers(0, 5, (9, 12)).astype(np.uint8)
+        self.AssertBatch(
+            X,
+            ["depth", "identifying_information"],
+            workers=2,
+            chunk_size=2,
+            executor="process",
+        )
+
+    def test_processes_objects(self):
+        X = RaggedArray(
+            np.array(["a", "bb", "a", "c", "bb", "a"], dtype=object), [0, 2, 2, 6]
+        )
+        self.AssertBatch(X, ["volume"], workers=2, chunk_size=1, executor="process")
+
+    def test_ragged(self):
+        X = RaggedArray([1, 2, 1, 3, 3, 3, 2, 1], [0, 4, 5, 8])
+        self.AssertBatch(X, ["depth", "arithmetic_mean"], workers=2, chunk_size=1)
+
+    def test_all_characteristics(self):
+        X = [[1, 2, 1, 3], [4, 4, 2, 4]]
+        self.AssertBatch(X, list(batch_profile(X, workers=1).keys()), workers=2)
+
+    def test_empty_batch(self):
+        exists = batch_profile(np.empty((0, 3)), ["depth"])
+        assert_array_equal([], exists["depth"])
+
+    def test_invalid_executor(self):
+        with pytest.raises(ValueError):
+            batch_profile([[1, 2]], ["depth"], executor="cluster")
+
+    def test_invalid_workers_or_chunk_size(self):
+        X = [[1, 2], [2, 2], [1, 1]]
+        for chunk_size in [0, -1]:
+            with pytest.raises(ValueError):
+                batch_profile(X, ["depth"], chunk_size=chunk_size)
+        with pytest.raises(ValueError):
+            batch_profile(X, ["depth"], workers=0)
+
+    def test_invalid_characteristic(self):
+        with pytest.raises(ValueError):
+            batch_profile([[1, 2]], ["depth", "unknown"])
+
+    def test_several_modes(self):
+        with pytest.raises(ValueError):
+            batch_profile([[1, 2]], ["depth"], mode=[mode.normal, mode.cycle])
+
+    def test_not_d2_array(self):
+        with pytest.raises(Not1DArrayException):
+            batch_profile([1, 2, 3], ["depth"])
@@ -75,6 +75,19 @@ class MACharacteristicsTest(TestCase):
             for _mode, expected in v.items():
                 self.AssertCase(X, _binding, _mode, expected, dtype)
 
+    def AssertRaggedCase(self, X, binding, mode, dtype=None):
+        order_seq = ma.order(X)
+        intervals_seq = ma.intervals(order_seq, binding, mode)
+        ragged_seq = ma.intervals(order_seq, binding, mode, ragged=True)
+        expected = self.target(intervals_seq, dtype)
+        exists = self.target(ragged_seq, dtype)
+
+        self.assertEqual(len(expected), len(exists))
+
+        diff = np.absolute(expected - exists)
+        err_message = f"Binding: {binding}, Mode: {mode}, Diff: {diff} > {self.epsilon}"
+        self.assertTrue(np.all(diff < self.epsilon), err_message)
+
     def GetPrecision(self, length, dtype=None):
         alphabet = np.arange(0, np.fix(length * 0.2), dtype=int)
         X = np.random.choice(alphabet, length)
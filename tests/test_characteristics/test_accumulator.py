@@ -0,0 +1,136 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+import foapy.characteristics as characteristics
+import foapy.characteristics.ma as ma_characteristics
+import foapy.ma as ma
+from foapy import IntervalsStream, binding, mode
+from foapy.characteristics import Accumulator
+from foapy.characteristics.ma import Accumulator as ElementsAccumulator
+
+element_names = [
+    "arithmetic_mean",
+    "average_remoteness",
+    "depth",
+    "geometric_mean",
+    "identifying_information",
+    "periodicity",
+    "uniformity",
+    "volume",
+]
+
+
+def volume_from_depth(intervals_grouped):
+    return np.power(2, ma_characteristics.depth(intervals_grouped))
+
+
+class TestAccumulator(TestCase):
+    """
+    Test characteristics accumulated from chunks and partitions of intervals
+    """
+
+    def grouped(self, X, _mode):
+        return ma.intervals(ma.order(np.ma.masked_array(X)), binding.start, _mode)
+
+    def AssertAccumulated(self, X, chunks, _mode):
+        intervals_grouped = self.grouped(X, _mode)
+
+        stream = IntervalsStream(_mode)
+        accumulator = Accumulator()
+        for chunk in chunks:
+            intervals, order = stream.update(chunk, return_order=True)
+            accumulator.update(intervals, order, power=stream.power)
+        accumulator.update(*stream.finalize(return_order=True))
+
+        expected = characteristics.profile(intervals_grouped)
+        # Accumulated volume is derived from the depth and does not overflow
+        expected["volume"] = np.power(2, expected["depth"])
+        for name, value in accumulator.profile().items():
+            assert_allclose(expected[name], value, rtol=1e-12, err_msg=name)
+            assert_allclose(expected[name], getattr(accumulator, name)())
+
+        # Periodicity of elements without intervals is not defined
+        not_empty = accumulator.elements.counts != 0
+        for name in element_names:
+            if name == "volume":
+                target = volume_from_depth
+            else:
+                target = getattr(ma_characteristics, name)
+            assert_allclose(
+                target(intervals_grouped)[not_empty],
+                getattr(accumulator.elements, name)()[not_empty],
+                rtol=1e-12,
+                err_msg=name,
+            )
+
+    def test_stream_chunks(self):
+        X = ["b", "a", "b", "c", "b", "a", "a", "d", "c", "b"]
+        chunks = [X[:3], X[3:4], X[4:9], X[9:]]
+        for _mode in [mode.lossy, mode.normal, mode.redundant]:
+            self.AssertAccumulated(X, chunks, _mode)
+
+    def test_random_stream(self):
+        rng = np.random.default_rng(0)
+        X = rng.integers(0, 6, 500)
+        chunks = np.split(X, [50, 51, 200, 420])
+        for _mode in [mode.lossy, mode.normal, mode.redundant]:
+            self.AssertAccumulated(X, list(chunks), _mode)
+
+    def test_merge_partitions(self):
+        X = np.random.default_rng(1).integers(0, 4, 200)
+        intervals_grouped = self.grouped(X, mode.cycle)
+        # Every partition holds every second interval of each element
+        parts = []
+        for start in range(2):
+            part = Accumulator()
+            part.update([np.asarray(group)[start::2] for group in intervals_grouped])
+            parts.append(part)
+        total = Accumulator()
+        for part in parts:
+            total.merge(part)
+
+        expected = characteristics.profile(intervals_grouped)
+        expected["volume"] = np.power(2, expected["depth"])
+        for name, value in total.profile().items():
+            assert_allclose(expected[name], value, rtol=1e-12, err_msg=name)
+
+    def test_merge_elements(self):
+        left = ElementsAccumulator()
+        left.update([[1, 2], [2]])
+        right = ElementsAccumulator()
+        right.update([[4], [1], [3]])
+        left.merge(right)
+        assert_array_equal([3, 2, 1], left.counts)
+        assert_allclose([8, 2, 3], left.volume())
+        assert_allclose([7 / 3, 1.5, 3], left.arithmetic_mean())
+
+    def test_volume_does_not_overflow(self):
+        elements = ElementsAccumulator()
+        elements.update([[1000] * 7])
+        assert_allclose([1e21], elements.volume())
+        total = Accumulator()
+        for _ in range(3):
+            total.update([[1000] * 3])
+        assert_allclose(1e27, total.volume())
+
+    def test_power(self):
+        elements = ElementsAccumulator()
+        elements.update([[2], []], power=4)
+        assert_array_equal([1, 0, 0, 0], elements.counts)
+        assert_array_equal([2, 0, 0, 0], elements.arithmetic_mean())
+
+    def test_empty(self):
+        exists = Accumulator().profile(["depth", "arithmetic_mean", "volume"])
+        self.assertEqual({"depth": 0, "arithmetic_mean": 0, "volume": 1}, exists)
+        assert_array_equal([], ElementsAccumulator().depth())
+
+    def test_unknown_characteristic(self):
+        with pytest.raises(ValueError):
+            Accumulator().profile(["unknown"])
+
+    def test_order_length(self):
+        with pytest.raises(ValueError):
+            ElementsAccumulator().update([1, 2, 3], [0, 1])
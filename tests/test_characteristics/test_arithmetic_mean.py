@@ -102,3 +102,7 @@ class Test_arithmetic_mean(CharacteristicsTest):
     def test_calculate_end_lossy_different_values_arithmetic_mean_2(self):
         X = np.array(["2", "1"])
         self.AssertCase(X, binding.end, mode.lossy, 0)
+
+    def test_zero_intervals(self):
+        self.assertEqual(0, arithmetic_mean([]))
+        self.assertEqual(0, arithmetic_mean(np.zeros(5, dtype=int)))
@@ -206,3 +206,7 @@ class Test_average_remoteness(CharacteristicsTest):
     def test_inequality_5(self):
         X = np.array(["B"])
         self.AssertInEquality(X)
+
+    def test_zero_intervals(self):
+        self.assertEqual(0, average_remoteness([]))
+        self.assertEqual(0, average_remoteness(np.zeros(5, dtype=int)))
@@ -163,3 +163,7 @@ class Test_geometric_mean(CharacteristicsTest):
         intervals_seq = intervals(X, binding.start, mode.normal)
         result = geometric_mean(intervals_seq, dtype=np.longdouble)
         self.assertNotEqual(result, np.longdouble("inf"))
+
+    def test_zero_intervals(self):
+        self.assertEqual(0, geometric_mean([]))
+        self.assertEqual(0, geometric_mean(np.zeros(5, dtype=int)))
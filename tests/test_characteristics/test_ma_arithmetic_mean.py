@@ -107,3 +107,9 @@ class TestMaArithmeticMean(MACharacteristicsTest):
     def test_calculate_start_lossy_different_values(self):
         X = ma.masked_array(["B", "A", "C", "D"])
         self.AssertCase(X, binding_constant.start, mode_constant.lossy, [0, 0, 0, 0])
+
+    def test_ragged_intervals_lossy(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B", "D"]
+        masked_X = ma.masked_array(X)
+        for _binding in [binding_constant.start, binding_constant.end]:
+            self.AssertRaggedCase(masked_X, _binding, mode_constant.lossy)
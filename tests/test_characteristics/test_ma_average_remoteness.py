@@ -161,3 +161,9 @@ class TestMaAverageRemoteness(MACharacteristicsTest):
     def test_inequality_5(self):
         X = ma.masked_array([58, 58, 100, 100])
         self.AssertInEquality(X)
+
+    def test_ragged_intervals_lossy(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B", "D"]
+        masked_X = ma.masked_array(X)
+        for _binding in [binding_constant.start, binding_constant.end]:
+            self.AssertRaggedCase(masked_X, _binding, mode_constant.lossy)
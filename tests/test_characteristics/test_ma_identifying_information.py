@@ -133,3 +133,9 @@ class TestMaIdentifyingInformation(MACharacteristicsTest):
         X = ma.masked_array(["B", "A", "C", "D"])
         expected = [0, 0, 0, 0]
         self.AssertCase(X, binding_constant.start, mode_constant.lossy, expected)
+
+    def test_ragged_intervals_lossy(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B", "D"]
+        masked_X = ma.masked_array(X)
+        for _binding in [binding_constant.start, binding_constant.end]:
+            self.AssertRaggedCase(masked_X, _binding, mode_constant.lossy)
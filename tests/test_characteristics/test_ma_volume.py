@@ -73,3 +73,9 @@ class TestMaVolume(MACharacteristicsTest):
         masked_X = ma.masked_array(X)
         expected = [1]
         self.AssertCase(masked_X, binding_constant.start, mode_constant.cycle, expected)
+
+    def test_ragged_intervals_lossy(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B", "D"]
+        masked_X = ma.masked_array(X)
+        for _binding in [binding_constant.start, binding_constant.end]:
+            self.AssertRaggedCase(masked_X, _binding, mode_constant.lossy)
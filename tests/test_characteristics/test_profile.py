@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+
+import foapy.characteristics as characteristics
+import foapy.ma as ma
+from foapy import binding, mode
+from foapy.characteristics import profile
+
+
+class TestProfile(TestCase):
+    """
+    Test list for profile calculate
+
+    Every characteristic of the profile should match the value
+    calculated by the separate characteristic function.
+    """
+
+    epsilon = np.float_power(10, -12)
+
+    grouped = [
+        "descriptive_information",
+        "identifying_information",
+        "regularity",
+        "uniformity",
+    ]
+
+    def AssertProfile(self, X, binding, mode, ragged=False):
+        order_seq = ma.order(np.array(X))
+        intervals_seq = ma.intervals(order_seq, binding, mode, ragged=ragged)
+        total = np.concatenate(list(intervals_seq))
+
+        exists = profile(intervals_seq)
+        for name, value in exists.items():
+            target = getattr(characteristics, name)
+            source = intervals_seq if name in self.grouped else total
+            expected = target(source)
+            diff = np.absolute(expected - value)
+            err_message = f"{name}, Binding: {binding}, Mode: {mode}, Diff: {diff}"
+            self.assertTrue(diff < self.epsilon, err_message)
+
+    def test_dataset_1(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B"]
+        for _binding in [binding.start, binding.end]:
+            for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+                self.AssertProfile(X, _binding, _mode)
+                self.AssertProfile(X, _binding, _mode, ragged=True)
+
+    def test_different_values_lossy(self):
+        X = ["B", "A", "C", "D"]
+        exists = profile(ma.intervals(ma.order(np.array(X)), binding.start, mode.lossy))
+        self.assertEqual(0, exists["arithmetic_mean"])
+        self.assertEqual(0, exists["geometric_mean"])
+        self.assertEqual(0, exists["identifying_information"])
+
+    def test_selected_characteristics(self):
+        X = ["a", "b", "a", "c", "a", "d"]
+        intervals_seq = ma.intervals(ma.order(np.array(X)), binding.start, mode.normal)
+        exists = profile(intervals_seq, ["depth", "regularity"])
+        self.assertEqual(["depth", "regularity"], list(exists.keys()))
+
+    def test_unknown_characteristic(self):
+        with pytest.raises(ValueError):
+            profile([np.array([1, 2])], ["entropy"])
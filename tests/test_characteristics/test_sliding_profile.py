@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import foapy.characteristics._sliding_profile as sliding_module
+import foapy.ma as ma
+from foapy import binding, mode
+from foapy.characteristics import profile, sliding_profile
+from foapy.exceptions import Not1DArrayException
+
+
+class TestSlidingProfile(TestCase):
+    """
+    Test characteristics of windows of a sequence
+
+    Every window should get the same characteristics as profile
+    of the intervals extracted from the window alone.
+    """
+
+    def AssertWindows(self, X, window, step, _binding, _mode):
+        exists = sliding_profile(X, window, step, binding=_binding, mode=_mode)
+        starts = range(0, len(X) - window + 1, step)
+        for name, values in exists.items():
+            self.assertEqual(len(starts), len(values), name)
+        for index, start in enumerate(starts):
+            source = np.array(X[start : start + window])
+            intervals_grouped = ma.intervals(ma.order(source), _binding, _mode)
+            expected = profile(intervals_grouped)
+            expected["volume"] = np.power(2.0, expected["depth"])
+            for name, value in expected.items():
+                err_message = f"{name}, Window: {start}, Mode: {_mode}"
+                assert_allclose(value, exists[name][index], 1e-12, 1e-12, err_message)
+
+    def AssertAllModes(self, X, window, step):
+        for _binding in [binding.start, binding.end]:
+            for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+                self.AssertWindows(X, window, step, _binding, _mode)
+
+    def test_string_values(self):
+        X = ["a", "b", "a", "c", "a", "d", "a", "b", "c", "c", "b"]
+        self.AssertAllModes(X, 4, 1)
+        self.AssertAllModes(X, 5, 3)
+
+    def test_random_values(self):
+        X = list(np.random.default_rng(0).integers(0, 5, 120))
+        self.AssertAllModes(X, 17, 2)
+
+    def test_small_blocks(self):
+        X = list(np.random.default_rng(1).integers(0, 3, 40))
+        block_pairs = sliding_module.block_pairs
+        sliding_module.block_pairs = 5
+        try:
+            self.AssertAllModes(X, 7, 1)
+        finally:
+            sliding_module.block_pairs = block_pairs
+
+    def test_whole_sequence(self):
+        X = [2, 1, 2, 2, 3]
+        self.AssertAllModes(X, 5, 1)
+
+    def test_single_element_windows(self):
+        X = [1, 1, 2]
+        self.AssertAllModes(X, 1, 1)
+
+    def test_example(self):
+        X = ["a", "b", "a", "c", "a", "d", "a", "b"]
+        exists = sliding_profile(X, 4, 2, ["depth", "uniformity"])
+        self.assertEqual(["depth", "uniformity"], list(exists.keys()))
+        assert_allclose([4, 4, 4], exists["depth"])
+
+    def test_window_longer_than_sequence(self):
+        exists = sliding_profile([1, 2, 3], 5, characteristics=["depth"])
+        self.assertEqual(0, len(exists["depth"]))
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            sliding_profile([1, 2, 3], 0)
+        with pytest.raises(ValueError):
+            sliding_profile([1, 2, 3], 2, step=0)
+
+    def test_invalid_characteristic(self):
+        with pytest.raises(ValueError):
+            sliding_profile([1, 2, 3], 2, characteristics=["unknown"])
+
+    def test_not_d1_array(self):
+        with pytest.raises(Not1DArrayException):
+            sliding_profile([[1, 2], [3, 4]], 1)
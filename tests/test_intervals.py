@@ -5,6 +5,7 @@ import pytest
 from numpy.testing import assert_array_equal
 
 from foapy import binding, intervals, mode
+from foapy import order as foapy_order
 
 
 class TestIntervals(TestCase):
@@ -161,3 +162,153 @@ class TestIntervals(TestCase):
                 "Invalid binding value. Use binding.start or binding.end.",
                 e_info.message,
             )
+
+    def test_bytes_start_normal(self):
+        X = np.array([b"a", b"b", b"a", b"c", b"d"], dtype="S1")
+        expected = np.array([1, 2, 2, 4, 5])
+        exists = intervals(X, binding.start, mode.normal)
+        assert_array_equal(expected, exists)
+
+    def test_uint8_end_cycle(self):
+        X = np.array([2, 4, 2, 2, 4], dtype=np.uint8)
+        expected = np.array([2, 3, 1, 2, 2])
+        exists = intervals(X, binding.end, mode.cycle)
+        assert_array_equal(expected, exists)
+
+    def test_small_range_int_start_redundant(self):
+        X = np.array([1000, 1003, 1000, 1000, 1003])
+        expected = np.array([1, 2, 2, 1, 3, 2, 1])
+        exists = intervals(X, binding.start, mode.redundant)
+        assert_array_equal(expected, exists)
+
+    def test_both_bindings_normal(self):
+        X = ["a", "b", "a", "c", "a", "d"]
+        expected_start = np.array([1, 2, 2, 4, 2, 6])
+        expected_end = np.array([2, 5, 2, 3, 2, 1])
+        exists_start, exists_end = intervals(
+            X, [binding.start, binding.end], mode.normal
+        )
+        assert_array_equal(expected_start, exists_start)
+        assert_array_equal(expected_end, exists_end)
+
+    def test_both_bindings_match_single_binding(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B"]
+        bindings = (binding.end, binding.start)
+        for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+            exists = intervals(X, bindings, _mode)
+            for _binding, result in zip(bindings, exists):
+                assert_array_equal(intervals(X, _binding, _mode), result)
+
+    def test_both_bindings_void(self):
+        exists = intervals([], [binding.start, binding.end], mode.normal)
+        self.assertEqual(2, len(exists))
+        assert_array_equal([], exists[0])
+
+    def test_both_bindings_with_binding_exception(self):
+        with pytest.raises(ValueError):
+            intervals([1, 2], [binding.start, 5], mode.normal)
+
+    def test_all_modes_start(self):
+        X = ["a", "b", "a", "c", "a", "d"]
+        modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+        expected = [
+            np.array([2, 2]),
+            np.array([1, 2, 2, 4, 2, 6]),
+            np.array([2, 6, 2, 6, 2, 6]),
+            np.array([1, 2, 2, 4, 2, 6, 2, 5, 3, 1]),
+        ]
+        exists = intervals(X, binding.start, modes)
+        self.assertEqual(len(expected), len(exists))
+        for expected_mode, exists_mode in zip(expected, exists):
+            assert_array_equal(expected_mode, exists_mode)
+
+    def test_all_modes_match_single_mode(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B"]
+        bindings = [binding.start, binding.end]
+        modes = [mode.redundant, mode.cycle, mode.lossy, mode.normal]
+        exists = intervals(X, bindings, modes)
+        for _binding, by_mode in zip(bindings, exists):
+            for _mode, result in zip(modes, by_mode):
+                assert_array_equal(intervals(X, _binding, _mode), result)
+
+    def test_all_modes_void(self):
+        exists = intervals([], binding.end, [mode.normal, mode.redundant])
+        self.assertEqual(2, len(exists))
+        assert_array_equal([], exists[1])
+
+    def test_all_modes_with_mode_exception(self):
+        with pytest.raises(ValueError):
+            intervals([1, 2], binding.start, [mode.normal, 5])
+
+    def test_dtype_auto(self):
+        X = ["B", "B", "A", "A", "C", "B", "A", "C", "C", "B"]
+        for _binding in [binding.start, binding.end]:
+            for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+                expected = intervals(X, _binding, _mode)
+                exists = intervals(X, _binding, _mode, dtype="auto")
+                self.assertEqual(np.int32, exists.dtype)
+                assert_array_equal(expected, exists)
+
+    def test_dtype_uint8(self):
+        X = [2, 4, 2, 2, 4]
+        expected = np.array([1, 2, 2, 1, 3, 2, 1], dtype=np.uint8)
+        exists = intervals(X, binding.start, mode.redundant, dtype=np.uint8)
+        self.assertEqual(np.uint8, exists.dtype)
+        assert_array_equal(expected, exists)
+
+    def test_dtype_too_narrow_exception(self):
+        X = np.arange(300)
+        with pytest.raises(ValueError):
+            intervals(X, binding.start, mode.normal, dtype=np.uint8)
+
+    def test_dtype_not_integer_exception(self):
+        with pytest.raises(ValueError):
+            intervals([1, 2], binding.start, mode.normal, dtype=np.float32)
+
+    def test_order_with_power(self):
+        X = np.random.default_rng(0).integers(0, 70000, 5000)
+        for source in [["B", "B", "A", "C", "B", "A"], X]:
+            order, alphabet = foapy_order(source, return_alphabet=True)
+            power = alphabet.shape[0]
+            for dtype in [np.uint8, np.int32, np.intp]:
+                if power - 1 > np.iinfo(dtype).max:
+                    continue
+                ar = order.astype(dtype)
+                for _binding in [binding.start, binding.end]:
+                    for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+                        expected = intervals(ar, _binding, _mode)
+                        exists = intervals(ar, _binding, _mode, power=power)
+                        assert_array_equal(expected, exists)
+
+    def test_order_with_power_missing_values(self):
+        expected = np.array([1, 2, 2, 1])
+        exists = intervals([0, 3, 0, 0], binding.start, mode.normal, power=5)
+        assert_array_equal(expected, exists)
+
+    def test_order_with_power_exception(self):
+        with pytest.raises(ValueError):
+            intervals([0, 1, 2], binding.start, mode.normal, power=2)
+        with pytest.raises(ValueError):
+            intervals([0, -1], binding.start, mode.normal, power=2)
+        with pytest.raises(ValueError):
+            intervals([0.0, 1.0], binding.start, mode.normal, power=2)
+
+    def test_wide_range_int_values(self):
+        X = np.random.default_rng(0).integers(-(2**30), 2**30, 5000)
+        expected = intervals(X.astype(str), binding.start, mode.normal)
+        exists = intervals(X, binding.start, mode.normal)
+        assert_array_equal(expected, exists)
+
+    def test_big_endian_int_values(self):
+        X = np.random.default_rng(0).integers(0, 10**6, 40).astype(">i8")
+        X[::3] = X[0]
+        native = X.astype("<i8")
+        assert_array_equal(foapy_order(native), foapy_order(X))
+        order = foapy_order(native).astype(">u8")
+        for _binding in [binding.start, binding.end]:
+            for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+                expected = intervals(native, _binding, _mode)
+                assert_array_equal(expected, intervals(X, _binding, _mode))
+                expected = intervals(order.astype("<u8"), _binding, _mode)
+                exists = intervals(order, _binding, _mode, power=int(order.max()) + 1)
+                assert_array_equal(expected, exists)
@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import IntervalsStream, alphabet, binding, intervals, mode
+from foapy.exceptions import Not1DArrayException
+
+
+class TestIntervalsStream(TestCase):
+    """
+    Test intervals extracted from a sequence given by chunks
+    """
+
+    def AssertStream(self, chunks, _mode):
+        X = np.concatenate(chunks)
+        stream = IntervalsStream(_mode)
+        parts = [stream.update(chunk) for chunk in chunks]
+        exists = np.concatenate(parts)
+        if _mode == mode.cycle:
+            exists[stream.first_positions] = stream.finalize()
+        else:
+            exists = np.concatenate((exists, stream.finalize()))
+        assert_array_equal(intervals(X, binding.start, _mode), exists)
+        assert_array_equal(alphabet(X), stream.alphabet())
+        self.assertEqual(len(X), len(stream))
+
+    def test_all_modes(self):
+        chunks = [["b", "a"], ["b"], [], ["c", "b", "a", "a"], ["d", "c"]]
+        for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+            self.AssertStream(chunks, _mode)
+
+    def test_random_chunks(self):
+        rng = np.random.default_rng(0)
+        X = rng.integers(0, 5, 300)
+        chunks = np.split(X, np.sort(rng.integers(0, 300, 10)))
+        for _mode in [mode.lossy, mode.normal, mode.cycle, mode.redundant]:
+            self.AssertStream(chunks, _mode)
+
+    def test_example(self):
+        stream = IntervalsStream(mode.redundant)
+        assert_array_equal([1, 2], stream.update(["a", "b"]))
+        assert_array_equal([2, 4], stream.update(["a", "c"]))
+        assert_array_equal([2, 6], stream.update(["a", "d"]))
+        assert_array_equal([2, 5, 3, 1], stream.finalize())
+        self.assertEqual(4, stream.power)
+
+    def test_normal_finalize_is_empty(self):
+        stream = IntervalsStream()
+        assert_array_equal([1, 2, 1], stream.update([1, 2, 2]))
+        assert_array_equal([], stream.finalize())
+
+    def test_empty(self):
+        stream = IntervalsStream(mode.redundant)
+        assert_array_equal([], stream.finalize())
+        assert_array_equal([], stream.alphabet())
+
+    def test_dtype(self):
+        stream = IntervalsStream(dtype=np.int8)
+        self.assertEqual(np.int8, stream.update([1, 2, 1]).dtype)
+        with pytest.raises(ValueError):
+            stream.update(np.zeros(200))
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            IntervalsStream(42)
+
+    def test_several_modes(self):
+        with pytest.raises(ValueError):
+            IntervalsStream([mode.normal, mode.cycle])
+
+    def test_not_d1_array(self):
+        with pytest.raises(Not1DArrayException):
+            IntervalsStream().update([[1, 2], [3, 4]])
+
+    def test_return_order(self):
+        stream = IntervalsStream(mode.redundant)
+        exists, exists_order = stream.update(["b", "a", "b"], return_order=True)
+        assert_array_equal([1, 2, 2], exists)
+        assert_array_equal([0, 1, 0], exists_order)
+        exists, exists_order = stream.update(["c", "a"], return_order=True)
+        assert_array_equal([4, 3], exists)
+        assert_array_equal([2, 1], exists_order)
+        exists, exists_order = stream.finalize(return_order=True)
+        assert_array_equal([1, 3, 2], exists)
+        assert_array_equal([1, 0, 2], exists_order)
+        assert_array_equal(["b", "a", "c"], stream.alphabet())
@@ -0,0 +1,141 @@
+import gzip
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import binding, intervals, mode
+from foapy.batch import intervals as batch_intervals
+from foapy.io import read_fasta, read_fastq
+
+
+class TestReadFasta(TestCase):
+    """
+    Test decoding FASTA records into symbol codes
+    """
+
+    def AssertRecords(self, records, expected):
+        self.assertEqual(len(records), len(expected))
+        for record, codes in zip(records, expected):
+            assert_array_equal(record, np.array(codes, dtype=np.uint8))
+            self.assertEqual(record.dtype, np.uint8)
+
+    def test_records(self):
+        source = b">first\nACGT\nacgN\n>second sample\nGATTACA\n"
+        expected = [[0, 1, 2, 3, 0, 1, 2, 4], [2, 0, 3, 3, 0, 1, 0]]
+        records, names = read_fasta(io.BytesIO(source), return_names=True)
+        self.AssertRecords(records, expected)
+        self.assertEqual(names, ["first", "second sample"])
+
+    def test_any_chunk_size(self):
+        source = b">a\r\nAC\r\nGT\r\n>long header\nTTTT\nGGGG\n>empty\n>c\nCA"
+        expected = [[0, 1, 2, 3], [3, 3, 3, 3, 2, 2, 2, 2], [], [1, 0]]
+        for chunk_size in range(1, len(source) + 2):
+            records, names = read_fasta(
+                io.BytesIO(source), return_names=True, chunk_size=chunk_size
+            )
+            self.AssertRecords(records, expected)
+            self.assertEqual(names, ["a", "long header", "empty", "c"])
+
+    def test_sequence_without_header(self):
+        records, names = read_fasta(io.BytesIO(b"AC\nG\n>x\nT\n"), return_names=True)
+        self.AssertRecords(records, [[0, 1, 2], [3]])
+        self.assertEqual(names, ["", "x"])
+
+    def test_empty(self):
+        records = read_fasta(io.BytesIO(b""))
+        self.assertEqual(len(records), 0)
+
+    def test_alphabet(self):
+        source = b">p\nMKVLA\n"
+        records = read_fasta(io.BytesIO(source), alphabet="ACDEFGHIKLMNPQRSTVWY")
+        self.AssertRecords(records, [[10, 8, 17, 9, 0]])
+        raw = read_fasta(io.BytesIO(source), alphabet=None)
+        self.AssertRecords(raw, [list(b"MKVLA")])
+
+    def test_long_alphabet(self):
+        with pytest.raises(ValueError):
+            read_fasta(io.BytesIO(b">a\nA\n"), alphabet="A" * 256)
+
+    def test_invalid_chunk_size(self):
+        for chunk_size in [0, -1]:
+            with pytest.raises(ValueError):
+                read_fasta(io.BytesIO(b">a\nA\n"), chunk_size=chunk_size)
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            plain = os.path.join(directory, "sequences.fasta")
+            packed = os.path.join(directory, "sequences.fasta.gz")
+            target = os.path.join(directory, "codes.bin")
+            source = b">a\nACGTTGCA\n>b\nGG\n"
+            with open(plain, "wb") as file:
+                file.write(source)
+            with gzip.open(packed, "wb") as file:
+                file.write(source)
+
+            expected = [[0, 1, 2, 3, 3, 2, 1, 0], [2, 2]]
+            self.AssertRecords(read_fasta(plain), expected)
+            self.AssertRecords(read_fasta(packed), expected)
+
+            records = read_fasta(plain, out=target, chunk_size=5)
+            self.assertIsInstance(records.data, np.memmap)
+            self.AssertRecords(records, expected)
+            self.assertEqual(os.path.getsize(target), 10)
+            del records
+
+    def test_out_array(self):
+        out = np.zeros(12, dtype=np.uint8)
+        records = read_fasta(io.BytesIO(b">a\nAC\n>b\nGT\n"), out=out)
+        self.AssertRecords(records, [[0, 1], [2, 3]])
+        assert_array_equal(out[:4], [0, 1, 2, 3])
+
+        with pytest.raises(ValueError):
+            read_fasta(io.BytesIO(b">a\nACGT\n"), out=np.zeros(3, dtype=np.uint8))
+
+    def test_intervals(self):
+        source = b">a\nACGTTGCA\n>b\nGATTACA\n"
+        records = read_fasta(io.BytesIO(source))
+        result = batch_intervals(records, binding.start, mode.normal)
+        for row, record in zip(result, records):
+            assert_array_equal(row, intervals(record, binding.start, mode.normal))
+
+
+class TestReadFastq(TestCase):
+    """
+    Test decoding FASTQ records into symbol codes
+    """
+
+    def test_records(self):
+        source = b"@r1\nACGTTA\n+\nIIIIII\n@r2 x\nGGCN\n+r2 x\n@III\n@r3\n\n+\n\n"
+        for chunk_size in range(1, len(source) + 2):
+            records, names = read_fastq(
+                io.BytesIO(source), return_names=True, chunk_size=chunk_size
+            )
+            self.assertEqual(names, ["r1", "r2 x", "r3"])
+            assert_array_equal(records.offsets, [0, 6, 10, 10])
+            assert_array_equal(records.data, [0, 1, 2, 3, 3, 0, 2, 2, 1, 4])
+
+    def test_without_last_line_break(self):
+        records = read_fastq(io.BytesIO(b"@r\r\nAC\r\n+\r\nII"))
+        assert_array_equal(records[0], [0, 1])
+
+    def test_empty(self):
+        records = read_fastq(io.BytesIO(b""))
+        self.assertEqual(len(records), 0)
+
+    def test_invalid_chunk_size(self):
+        for chunk_size in [0, -1]:
+            with pytest.raises(ValueError):
+                read_fastq(io.BytesIO(b"@r\nAC\n+\nII\n"), chunk_size=chunk_size)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            read_fastq(io.BytesIO(b"@r\nAC\n+\n"))
+        with pytest.raises(ValueError):
+            read_fastq(io.BytesIO(b">r\nAC\n+\nII\n"))
+        with pytest.raises(ValueError):
+            read_fastq(io.BytesIO(b"@r\nAC\n-\nII\n"))
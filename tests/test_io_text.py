@@ -0,0 +1,74 @@
+import io
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import order
+from foapy.exceptions import Not1DArrayException
+from foapy.io import encode_words
+
+
+class TestEncodeWords(TestCase):
+    """
+    Test encoding words into orders by a hashed vocabulary
+    """
+
+    def AssertOrder(self, source, words):
+        expected, expected_alphabet = order(np.array(words), return_alphabet=True)
+        result, alphabet = encode_words(source, return_alphabet=True)
+        assert_array_equal(result, expected)
+        assert_array_equal(alphabet, expected_alphabet)
+
+    def test_text(self):
+        text = "the cat saw the dog, the dog saw the cat"
+        self.AssertOrder(text, text.replace(",", "").split())
+
+    def test_words(self):
+        words = ["b", "a", "b", "c", "a", "a", "d"]
+        self.AssertOrder(words, words)
+        self.AssertOrder(np.array(words), words)
+        self.AssertOrder(iter(words), words)
+
+    def test_random_words(self):
+        words = np.random.default_rng(0).integers(0, 50, 1000).astype(str)
+        self.AssertOrder(words, words)
+
+    def test_lower(self):
+        result, alphabet = encode_words("A a B b", lower=True, return_alphabet=True)
+        assert_array_equal(result, [0, 0, 1, 1])
+        assert_array_equal(alphabet, ["a", "b"])
+        assert_array_equal(encode_words(["A", "a"], lower=True), [0, 0])
+
+    def test_pattern(self):
+        result, alphabet = encode_words(
+            "don't stop", pattern=r"[\w']+", return_alphabet=True
+        )
+        assert_array_equal(result, [0, 1])
+        assert_array_equal(alphabet, ["don't", "stop"])
+
+    def test_file(self):
+        source = io.StringIO("One two\nTWO three\n\none\n")
+        result, alphabet = encode_words(source, lower=True, return_alphabet=True)
+        assert_array_equal(result, [0, 1, 1, 2, 0])
+        assert_array_equal(alphabet, ["one", "two", "three"])
+
+    def test_vocabulary(self):
+        vocabulary = {}
+        assert_array_equal(encode_words("a b a", vocabulary=vocabulary), [0, 1, 0])
+        result, alphabet = encode_words(
+            "c a", vocabulary=vocabulary, return_alphabet=True
+        )
+        assert_array_equal(result, [2, 0])
+        assert_array_equal(alphabet, ["a", "b", "c"])
+        self.assertEqual(vocabulary, {"a": 0, "b": 1, "c": 2})
+
+    def test_empty(self):
+        result, alphabet = encode_words("", return_alphabet=True)
+        self.assertEqual(result.shape, (0,))
+        self.assertEqual(alphabet.shape, (0,))
+
+    def test_not_1d(self):
+        with pytest.raises(Not1DArrayException):
+            encode_words(np.array([["a", "b"], ["c", "d"]]))
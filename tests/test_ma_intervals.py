@@ -6,7 +6,7 @@ import pytest
 from numpy.ma.testutils import assert_equal
 
 from foapy.exceptions import InconsistentOrderException, Not1DArrayException
-from foapy.ma import intervals
+from foapy.ma import intervals, order
 
 
 class TestMaIntervals(TestCase):
@@ -787,3 +787,132 @@ class TestMaIntervals(TestCase):
                 "Invalid binding value. Use binding.start or binding.end.",
                 e_info.message,
             )
+
+    def test_sparse_order_matches_dense_order(self):
+        X = ma.masked_array(
+            ["a", "b", "c", "a", "b", "c", "c", "c", "b", "a", "c", "b", "c"],
+            mask=[0, 1, 0, 0, 1, 0, 0, 0, 1, 0, 0, 1, 0],
+        )
+        dense = order(X)
+        sparse = order(X, sparse=True)
+        for _binding in [1, 2]:
+            for _mode in [1, 2, 3, 4]:
+                expected = list(intervals(dense, _binding, _mode))
+                exists = list(intervals(sparse, _binding, _mode))
+                assert_equal(expected, exists)
+
+    def test_sparse_order_matches_dense_order_partial_mask(self):
+        sources = [
+            ma.masked_array([0, 0, 0, 0, 0, 0], mask=[1, 0, 0, 0, 1, 0]),
+            ma.masked_array([1, 2, 1, 3, 2, 1, 3], mask=[0, 1, 1, 1, 0, 0, 1]),
+        ]
+        for X in sources:
+            dense, dense_alphabet = order(X, return_alphabet=True)
+            sparse, sparse_alphabet = order(X, return_alphabet=True, sparse=True)
+            assert_equal(dense_alphabet, sparse_alphabet)
+            for _binding in [1, 2]:
+                for _mode in [1, 2, 3, 4]:
+                    expected = list(intervals(dense, _binding, _mode))
+                    exists = list(intervals(sparse, _binding, _mode))
+                    assert_equal(expected, exists)
+
+    def test_sparse_int_values_start_redundant(self):
+        X = order(ma.masked_array([2, 4, 2, 2, 4]), sparse=True)
+        expected = [np.array([1, 2, 1, 2]), np.array([2, 3, 1])]
+        exists = intervals(X, 1, 4)
+        assert_equal([0, 4, 7], exists.offsets)
+        assert_equal(expected, list(exists))
+
+    def test_sparse_int_values_end_lossy(self):
+        X = order(ma.masked_array([2, 4, 2, 2, 4]), sparse=True)
+        expected = [np.array([2, 1]), np.array([3])]
+        exists = intervals(X, 2, 1)
+        assert_equal(expected, list(exists))
+
+    def test_ragged_str_values_start_None(self):
+        X = ma.masked_array(
+            [
+                [0, None, None, None, None, 0, None],
+                [None, 1, 1, None, None, None, 1],
+                [None, None, None, 2, None, None, None],
+                [None, None, None, None, None, 3, None],
+            ],
+            mask=[
+                [0, 1, 1, 1, 1, 0, 1],
+                [1, 0, 0, 1, 1, 1, 0],
+                [1, 1, 1, 0, 1, 1, 1],
+                [1, 1, 1, 1, 1, 0, 1],
+            ],
+        )
+        exists = intervals(X, 1, 1, ragged=True)
+        assert_equal([5, 1, 4], exists.data)
+        assert_equal([0, 1, 3, 3, 3], exists.offsets)
+
+    def test_ragged_matches_list(self):
+        X = ma.masked_array(
+            [
+                [0, None, 0, None, None, None, None, None],
+                [None, None, None, None, None, None, None, None],
+                [None, None, None, None, 2, None, 2, 2],
+            ],
+            mask=[
+                [0, 1, 0, 1, 1, 1, 1, 1],
+                [1, 1, 1, 1, 1, 1, 1, 1],
+                [1, 1, 1, 1, 0, 1, 0, 0],
+            ],
+        )
+        for _binding in [1, 2]:
+            for _mode in [1, 2, 3, 4]:
+                expected = list(intervals(X, _binding, _mode))
+                exists = intervals(X, _binding, _mode, ragged=True)
+                self.assertEqual(len(expected), len(exists))
+                assert_equal(expected, list(exists))
+
+    def test_ragged_empty(self):
+        X = ma.masked_array([], mask=[])
+        exists = intervals(X, 1, 1, ragged=True)
+        self.assertEqual(0, len(exists))
+
+    def test_dtype_auto(self):
+        X = order(ma.masked_array([2, 4, 2, 2, 4]))
+        for _binding in [1, 2]:
+            for _mode in [1, 2, 3, 4]:
+                expected = list(intervals(X, _binding, _mode))
+                exists = intervals(X, _binding, _mode, dtype="auto")
+                for expected_item, exists_item in zip(expected, exists):
+                    self.assertEqual(np.int32, exists_item.dtype)
+                    assert_equal(expected_item, exists_item)
+
+    def test_dtype_ragged(self):
+        X = order(ma.masked_array([2, 4, 2, 2, 4]), sparse=True)
+        exists = intervals(X, 1, 4, dtype=np.uint16)
+        self.assertEqual(np.uint16, exists.data.dtype)
+        assert_equal([1, 2, 1, 2, 2, 3, 1], exists.data)
+
+    def test_dtype_exception(self):
+        X = order(ma.masked_array([2, 4, 2, 2, 4]))
+        with pytest.raises(ValueError):
+            intervals(X, 1, 2, dtype=np.float64)
+
+    def test_order_with_power(self):
+        source = [2, 4, 2, 2, 4, 7]
+        X = order(ma.masked_array(source))
+        general_order = np.array([0, 1, 0, 0, 1, 2], dtype=np.uint8)
+        for _binding in [1, 2]:
+            for _mode in [1, 2, 3, 4]:
+                expected = intervals(X, _binding, _mode)
+                exists = intervals(general_order, _binding, _mode, power=3)
+                ragged = intervals(general_order, _binding, _mode, ragged=True, power=3)
+                self.assertEqual(len(expected), len(exists))
+                self.assertEqual(len(expected), len(ragged))
+                for expected_item, exists_item, ragged_item in zip(
+                    expected, exists, ragged
+                ):
+                    assert_equal(expected_item, exists_item)
+                    assert_equal(expected_item, ragged_item)
+
+    def test_order_with_power_exception(self):
+        with pytest.raises(ValueError):
+            intervals([0, 2, 0], 1, 2, power=3)
+        with pytest.raises(Not1DArrayException):
+            intervals([[0, 1], [1, 0]], 1, 2, power=2)
@@ -215,3 +215,28 @@ class TestMaOrder(TestCase):
         )
         exists = order(X)
         assert_equal(expected, exists)
+
+    def test_sparse_string_values(self):
+        X = ma.masked_array(["a", "b", "a", "c", "d"])
+        exists = order(X, sparse=True)
+        assert_equal([0, 2, 1, 3, 4], exists.positions)
+        assert_equal([0, 2, 3, 4, 5], exists.offsets)
+        assert_equal((4, 5), exists.shape)
+
+    def test_sparse_int_values_with_middle_mask(self):
+        X = ma.masked_array([1, 2, 3, 3, 4, 2], mask=[0, 0, 1, 1, 0, 0])
+        expected_alphabet = ma.masked_array([1, 2, 4])
+        exists, exists_alphabet = order(X, return_alphabet=True, sparse=True)
+        assert_equal([[0], [1, 5], [4]], [row.tolist() for row in exists])
+        assert_equal(expected_alphabet, exists_alphabet)
+
+    def test_sparse_int_values_with_partial_mask(self):
+        X = ma.masked_array([0, 0, 0, 0, 0, 0], mask=[1, 0, 0, 0, 1, 0])
+        exists = order(X, sparse=True)
+        assert_equal([[0, 1, 2, 3, 4, 5]], [row.tolist() for row in exists])
+
+    def test_sparse_void_int_values_with_mask(self):
+        X = ma.masked_array([1], mask=[1])
+        exists = order(X, sparse=True)
+        self.assertEqual(0, len(exists))
+        self.assertEqual(1, exists.length)
@@ -0,0 +1,149 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import (
+    alphabet,
+    binding,
+    intervals,
+    mapped_intervals,
+    mapped_order,
+    mode,
+    order,
+)
+from foapy.exceptions import Not1DArrayException
+
+bindings = [binding.start, binding.end]
+modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+
+
+class TestMapped(TestCase):
+    """
+    Test intervals and orders of sequences read from files by chunks
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "source.bin")
+        self.target = os.path.join(self.directory.name, "target.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def AssertFile(self, X, memory):
+        X = np.asarray(X, dtype=np.uint8)
+        X.tofile(self.source)
+        for _binding in bindings:
+            for _mode in modes:
+                expected = intervals(X, _binding, _mode)
+                exists = mapped_intervals(
+                    self.source, _binding, _mode, out=self.target, memory=memory
+                )
+                assert_array_equal(expected, exists)
+                self.assertEqual(expected.nbytes, os.path.getsize(self.target))
+                del exists
+
+    def test_file(self):
+        X = [1, 2, 1, 3, 1, 4, 4, 2, 3, 1]
+        # One element per chunk and all elements in one chunk
+        self.AssertFile(X, 1)
+        self.AssertFile(X, 2**20)
+
+    def test_random_file(self):
+        X = np.random.default_rng(0).integers(0, 6, 500)
+        self.AssertFile(X, 7 * 50)
+
+    def test_example(self):
+        np.frombuffer(b"ACGTTGCA", dtype=np.uint8).tofile(self.source)
+        exists = mapped_intervals(
+            self.source,
+            binding.start,
+            mode.normal,
+            out=self.target,
+            dtype=np.int32,
+            memory=2**20,
+        )
+        assert_array_equal([1, 2, 3, 4, 1, 3, 5, 7], exists)
+        self.assertEqual(np.int32, exists.dtype)
+
+    def test_memmap_source(self):
+        X = np.memmap(self.source, dtype=np.int16, mode="w+", shape=(40,))
+        X[:] = np.random.default_rng(1).integers(-3, 3, 40)
+        for _binding in bindings:
+            for _mode in modes:
+                expected = intervals(np.asarray(X), _binding, _mode)
+                exists = mapped_intervals(X, _binding, _mode, memory=300)
+                assert_array_equal(expected, exists)
+
+    def test_source_dtype(self):
+        X = np.array([300, 2, 300, 2], dtype=np.uint16)
+        X.tofile(self.source)
+        exists = mapped_intervals(
+            self.source, binding.end, mode.normal, source_dtype=np.uint16
+        )
+        assert_array_equal([2, 2, 2, 1], exists)
+
+    def test_big_endian_source_dtype(self):
+        X = np.random.default_rng(5).integers(0, 10**6, 40).astype(">i8")
+        X[::3] = X[0]
+        X.tofile(self.source)
+        for _binding in bindings:
+            for _mode in modes:
+                expected = intervals(X.astype("<i8"), _binding, _mode)
+                exists = mapped_intervals(
+                    self.source, _binding, _mode, memory=300, source_dtype=">i8"
+                )
+                assert_array_equal(expected, exists)
+                del exists
+
+    def test_out_array(self):
+        X = [1, 2, 1, 3]
+        out = np.zeros(10, dtype=np.intp)
+        exists = mapped_intervals(X, binding.end, mode.redundant, out=out, memory=60)
+        assert_array_equal(intervals(X, binding.end, mode.redundant), exists)
+        assert_array_equal(exists, out[:7])
+
+    def test_out_array_too_short(self):
+        with pytest.raises(ValueError):
+            mapped_intervals([1, 2, 1], binding.start, mode.normal, out=np.zeros(2))
+
+    def test_out_array_too_short_for_redundant(self):
+        X = [1, 2, 1, 3, 1]
+        for _binding in [binding.start, binding.end]:
+            out = np.zeros(7, dtype=np.intp)
+            with pytest.raises(ValueError):
+                mapped_intervals(X, _binding, mode.redundant, out=out, memory=60)
+            assert_array_equal(np.zeros(7), out)
+
+            out = np.zeros(8, dtype=np.intp)
+            exists = mapped_intervals(X, _binding, mode.redundant, out=out, memory=60)
+            assert_array_equal(intervals(X, _binding, mode.redundant), exists)
+
+    def test_empty_file(self):
+        open(self.source, "wb").close()
+        exists = mapped_intervals(
+            self.source, binding.start, mode.redundant, out=self.target
+        )
+        assert_array_equal([], exists)
+        self.assertEqual(0, os.path.getsize(self.target))
+
+    def test_order(self):
+        X = np.random.default_rng(2).integers(0, 9, 300).astype(np.uint8)
+        X.tofile(self.source)
+        exists, exists_alphabet = mapped_order(
+            self.source, True, out=self.target, memory=1000
+        )
+        assert_array_equal(alphabet(X), exists_alphabet)
+        assert_array_equal(order(X), exists)
+
+    def test_several_modes(self):
+        with pytest.raises(ValueError):
+            mapped_intervals([1, 2], binding.start, [mode.normal, mode.lossy])
+
+    def test_not_d1_array(self):
+        with pytest.raises(Not1DArrayException):
+            mapped_intervals([[1, 2], [3, 4]], binding.start, mode.normal)
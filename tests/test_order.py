@@ -63,3 +63,72 @@ class TestOrder(TestCase):
         exists_array, exists_alphabet = order(X, True)
         assert_array_equal(expected_alphabet, exists_alphabet)
         assert_array_equal(expected_array, exists_array)
+
+    def test_bytes_values(self):
+        X = np.array([b"G", b"A", b"G", b"T", b"A"], dtype="S1")
+        expected_alphabet = np.array([b"G", b"A", b"T"], dtype="S1")
+        expected_array = [0, 1, 0, 2, 1]
+
+        exists_array, exists_alphabet = order(X, True)
+        assert_array_equal(expected_alphabet, exists_alphabet)
+        assert_array_equal(expected_array, exists_array)
+
+    def test_small_range_negative_int_values(self):
+        X = np.array([-1, 5, -3, 5, -1])
+        expected_array = [0, 1, 2, 1, 0]
+        exists = order(X)
+        assert_array_equal(expected_array, exists)
+
+    def test_large_range_int_values(self):
+        X = np.array([2**40, 0, 2**40, -(2**40)])
+        expected_array = [0, 1, 0, 2]
+        exists = order(X)
+        assert_array_equal(expected_array, exists)
+
+    def test_bool_values(self):
+        X = np.array([True, True, False, True])
+        expected_array = [0, 0, 1, 0]
+        exists = order(X)
+        assert_array_equal(expected_array, exists)
+
+    def test_word_values(self):
+        X = np.array(["the", "cat", "the", "dog", "cat"])
+        expected_alphabet = np.array(["the", "cat", "dog"])
+        expected_array = [0, 1, 0, 2, 1]
+
+        exists_array, exists_alphabet = order(X, True)
+        assert_array_equal(expected_alphabet, exists_alphabet)
+        assert_array_equal(expected_array, exists_array)
+        self.assertEqual(exists_alphabet.dtype, X.dtype)
+
+    def test_object_values(self):
+        X = np.array(["ab", ("c", 1), 3, "ab", 3, ("c", 1)], dtype=object)
+        expected_array = [0, 1, 2, 0, 2, 1]
+
+        exists_array, exists_alphabet = order(X, True)
+        assert_array_equal(expected_array, exists_array)
+        self.assertEqual(exists_alphabet.dtype, object)
+        self.assertEqual(exists_alphabet.tolist(), ["ab", ("c", 1), 3])
+
+    def test_unhashable_object_values(self):
+        X = np.empty(4, dtype=object)
+        X[:] = [[2], [1], [2], [3]]
+        expected_array = [0, 1, 0, 2]
+        exists_array, exists_alphabet = order(X, True)
+        assert_array_equal(expected_array, exists_array)
+        self.assertEqual(exists_alphabet.tolist(), [[2], [1], [3]])
+
+    def test_object_values_out(self):
+        X = np.array(["x", "yy", "x"], dtype=object)
+        out = np.empty(3, dtype=np.intp)
+        exists = order(X, out=out)
+        self.assertIs(exists, out)
+        assert_array_equal([0, 1, 0], out)
+
+    def test_random_word_values(self):
+        words = np.random.default_rng(0).integers(0, 100, 1000).astype(str)
+        expected_array, expected_alphabet = order(words.astype("S"), True)
+        for X in [words, words.astype(object)]:
+            exists_array, exists_alphabet = order(X, True)
+            assert_array_equal(expected_array, exists_array)
+            assert_array_equal(expected_alphabet.astype(str), exists_alphabet)
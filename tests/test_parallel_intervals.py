@@ -0,0 +1,101 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import binding, intervals, mode, parallel_intervals
+from foapy.exceptions import Not1DArrayException
+
+bindings = [binding.start, binding.end]
+modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+
+
+class TestParallelIntervals(TestCase):
+    """
+    Test intervals of a sequence extracted by chunks
+    """
+
+    def AssertChunks(self, X, chunk_sizes, workers=2):
+        expected = intervals(X, bindings, modes)
+        for chunk_size in chunk_sizes:
+            exists = parallel_intervals(
+                X, bindings, modes, workers=workers, chunk_size=chunk_size
+            )
+            for expected_binding, exists_binding in zip(expected, exists):
+                for expected_mode, exists_mode in zip(expected_binding, exists_binding):
+                    assert_array_equal(expected_mode, exists_mode)
+
+    def test_example(self):
+        X = ["a", "b", "a", "c", "a", "d"]
+        exists = parallel_intervals(X, binding.start, mode.normal, chunk_size=2)
+        assert_array_equal([1, 2, 2, 4, 2, 6], exists)
+
+    def test_string_values(self):
+        X = ["b", "a", "b", "c", "b", "a", "a", "d", "c"]
+        self.AssertChunks(X, [1, 2, 3, 4, 8, 9, 20])
+
+    def test_int_values(self):
+        X = np.random.default_rng(0).integers(0, 6, 200)
+        self.AssertChunks(X, [1, 7, 50, 199, 200])
+
+    def test_wide_int_values(self):
+        X = np.random.default_rng(1).integers(-5, 5, 100) * 10**15
+        self.AssertChunks(X, [3, 33])
+
+    def test_objects(self):
+        X = np.array(["x", "yy", "x", "zzz", "yy", "x"], dtype=object)
+        self.AssertChunks(X, [1, 2, 5])
+
+    def test_single_worker(self):
+        X = [2, 1, 2, 2, 3, 1]
+        self.AssertChunks(X, [2, 4], workers=1)
+
+    def test_single_element(self):
+        X = [7, 7, 7, 7, 7]
+        self.AssertChunks(X, [1, 2])
+
+    def test_single_binding_and_mode(self):
+        X = np.random.default_rng(2).integers(0, 3, 30)
+        for _binding in bindings:
+            for _mode in modes:
+                expected = intervals(X, _binding, _mode)
+                exists = parallel_intervals(X, _binding, _mode, chunk_size=4)
+                assert_array_equal(expected, exists)
+
+    def test_repeated_binding(self):
+        X = np.random.default_rng(3).integers(0, 4, 40)
+        repeated = [binding.start, binding.end, binding.start]
+        for _modes in [modes, [mode.cycle]]:
+            expected = intervals(X, repeated, _modes)
+            exists = parallel_intervals(X, repeated, _modes, chunk_size=7)
+            for expected_binding, exists_binding in zip(expected, exists):
+                for expected_mode, exists_mode in zip(expected_binding, exists_binding):
+                    assert_array_equal(expected_mode, exists_mode)
+            assert exists[0][0] is not exists[2][0]
+
+    def test_invalid_chunk_size(self):
+        for chunk_size in [0, -3]:
+            with pytest.raises(ValueError):
+                parallel_intervals(
+                    [1, 2, 1], binding.start, mode.normal, chunk_size=chunk_size
+                )
+        with pytest.raises(ValueError):
+            parallel_intervals([1, 2, 1], binding.start, mode.normal, workers=0)
+
+    def test_dtype(self):
+        exists = parallel_intervals([1, 2, 1], binding.start, mode.normal, "auto")
+        self.assertEqual(np.int32, exists.dtype)
+        assert_array_equal([1, 2, 2], exists)
+
+    def test_empty(self):
+        exists = parallel_intervals([], binding.start, mode.normal)
+        assert_array_equal([], exists)
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            parallel_intervals([1, 2], binding.start, 42)
+
+    def test_not_d1_array(self):
+        with pytest.raises(Not1DArrayException):
+            parallel_intervals([[1, 2], [3, 4]], binding.start, mode.normal)
@@ -0,0 +1,85 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import foapy.core
+from foapy import PreparedSequence, alphabet, binding, intervals, mode, order
+from foapy.exceptions import Not1DArrayException
+
+
+class TestPreparedSequence(TestCase):
+    """
+    Test list of prepared sequence decomposition
+    """
+
+    bindings = [binding.start, binding.end]
+    modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+
+    def AssertSequence(self, X):
+        sequence = PreparedSequence(X)
+        assert_array_equal(alphabet(X), sequence.alphabet())
+        assert_array_equal(order(X), sequence.order())
+        for _binding in self.bindings:
+            for _mode in self.modes:
+                expected = intervals(X, _binding, _mode)
+                exists = sequence.intervals(_binding, _mode)
+                assert_array_equal(expected, exists)
+
+    def test_int_values(self):
+        self.AssertSequence([2, 4, 2, 2, 4])
+
+    def test_string_values(self):
+        self.AssertSequence(["B", "B", "A", "A", "C", "B", "A", "C", "C", "B"])
+
+    def test_single_value(self):
+        self.AssertSequence(["A", "A", "A"])
+
+    def test_different_values(self):
+        self.AssertSequence([5, 4, 3, 2, 1])
+
+    def test_end_redundant(self):
+        X = ["b", "a", "b", "c", "b"]
+        expected = np.array([2, 1, 4, 2, 4, 2, 2, 1])
+        exists = PreparedSequence(X).intervals(binding.end, mode.redundant)
+        assert_array_equal(expected, exists)
+
+    def test_with_return_alphabet(self):
+        X = ["a", "c", "c", "e", "d", "a"]
+        exists, exists_alphabet = PreparedSequence(X).order(return_alphabet=True)
+        assert_array_equal([0, 1, 1, 2, 3, 0], exists)
+        assert_array_equal(["a", "c", "e", "d"], exists_alphabet)
+
+    def test_void(self):
+        sequence = PreparedSequence([])
+        assert_array_equal([], sequence.order())
+        assert_array_equal([], sequence.alphabet())
+        assert_array_equal([], sequence.intervals(binding.start, mode.normal))
+
+    def test_not_d1(self):
+        with pytest.raises(Not1DArrayException):
+            PreparedSequence([[1, 2], [3, 4]])
+
+    def test_with_binding_exception(self):
+        with pytest.raises(ValueError):
+            PreparedSequence([1, 2]).intervals(5, mode.normal)
+
+    def test_with_mode_exception(self):
+        with pytest.raises(ValueError):
+            PreparedSequence([1, 2]).intervals(binding.start, 6)
+
+    def test_all_modes(self):
+        X = ["a", "b", "a", "c", "a", "d"]
+        sequence = PreparedSequence(X)
+        modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+        for _binding, by_mode in zip(
+            [binding.start, binding.end],
+            sequence.intervals([binding.start, binding.end], modes),
+        ):
+            for _mode, result in zip(modes, by_mode):
+                assert_array_equal(intervals(X, _binding, _mode), result)
+
+    def test_core_export(self):
+        self.assertIn("PreparedSequence", dir(foapy.core))
+        self.assertIn("PreparedSequence", foapy.core.__all__)
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy.core import RaggedArray
+
+
+class TestRaggedArray(TestCase):
+    """
+    Test list of ragged array container
+    """
+
+    def test_rows(self):
+        X = RaggedArray([5, 1, 4], [0, 1, 1, 3])
+        self.assertEqual(3, len(X))
+        assert_array_equal([5], X[0])
+        assert_array_equal([], X[1])
+        assert_array_equal([1, 4], X[-1])
+        assert_array_equal([1, 0, 2], X.lengths)
+
+    def test_from_arrays(self):
+        expected = [np.array([1, 2, 1]), np.array([2, 3])]
+        exists = RaggedArray.from_arrays(expected)
+        assert_array_equal([1, 2, 1, 2, 3], exists.data)
+        assert_array_equal([0, 3, 5], exists.offsets)
+        for e, x in zip(expected, exists):
+            assert_array_equal(e, x)
+
+    def test_from_2d_array(self):
+        X = np.array([[1, 2, 1], [2, 3, 3]])
+        exists = RaggedArray.from_arrays(X)
+        assert_array_equal([1, 2, 1, 2, 3, 3], exists.data)
+        assert_array_equal([0, 3, 6], exists.offsets)
+        self.assertTrue(np.shares_memory(X, exists.data))
+
+    def test_from_empty_arrays(self):
+        exists = RaggedArray.from_arrays([])
+        self.assertEqual(0, len(exists))
+        self.assertEqual([], exists.tolist())
+
+    def test_slice(self):
+        X = RaggedArray([1, 2, 3, 4], [0, 1, 2, 3, 4])
+        exists = X[1:-1:2]
+        self.assertEqual(1, len(exists))
+        assert_array_equal([2], exists[0])
+
+    def test_out_of_range(self):
+        X = RaggedArray([1, 2], [0, 2])
+        with pytest.raises(IndexError):
+            X[1]
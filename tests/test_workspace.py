@@ -0,0 +1,130 @@
+from unittest import TestCase
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from foapy import Workspace, binding, characteristics, intervals, mode, order
+
+
+class TestWorkspace(TestCase):
+    """
+    Test reuse of scratch buffers and result arrays between calls
+    """
+
+    bindings = [binding.start, binding.end]
+    modes = [mode.lossy, mode.normal, mode.cycle, mode.redundant]
+
+    def windows(self):
+        source = np.array([1, 2, 1, 3, 1, 2, 2, 3, 1, 1, 4, 4, 2, 1, 3])
+        return [source[start : start + 5] for start in range(0, 15, 5)]
+
+    def test_buffer_reused(self):
+        workspace = Workspace()
+        first = workspace.buffer("a", 10, np.intp)
+        second = workspace.buffer("a", 5, np.intp)
+        self.assertTrue(np.shares_memory(first, second))
+        self.assertEqual(5, len(second))
+        self.assertEqual(10 * np.dtype(np.intp).itemsize, workspace.nbytes)
+
+    def test_buffer_grows(self):
+        workspace = Workspace()
+        first = workspace.buffer("a", 5, np.intp)
+        second = workspace.buffer("a", 10, np.intp)
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertEqual(10, len(second))
+
+    def test_clear(self):
+        workspace = Workspace()
+        workspace.buffer("a", 5, bool)
+        workspace.clear()
+        self.assertEqual(0, workspace.nbytes)
+
+    def test_order(self):
+        workspace = Workspace()
+        out = np.empty(5, dtype=np.intp)
+        for window in self.windows():
+            exists = order(window, out=out, workspace=workspace)
+            self.assertIs(out, exists)
+            assert_array_equal(order(window), exists)
+
+    def test_order_with_alphabet(self):
+        workspace = Workspace()
+        exists, alphabet = order([5, 3, 5], True, workspace=workspace)
+        assert_array_equal([0, 1, 0], exists)
+        assert_array_equal([5, 3], alphabet)
+
+    def test_order_out_exception(self):
+        with pytest.raises(ValueError):
+            order([1, 2, 1], out=np.empty(2, dtype=np.intp))
+
+    def test_intervals(self):
+        workspace = Workspace()
+        out = np.empty(10, dtype=np.intp)
+        for window in self.windows():
+            for _binding in self.bindings:
+                for _mode in self.modes:
+                    expected = intervals(window, _binding, _mode)
+                    exists = intervals(
+                        window, _binding, _mode, out=out, workspace=workspace
+                    )
+                    self.assertTrue(np.shares_memory(out, exists))
+                    assert_array_equal(expected, exists)
+
+    def test_intervals_no_new_buffers(self):
+        workspace = Workspace()
+        out = np.empty(10, dtype=np.int32)
+        windows = self.windows()
+        for _mode in self.modes:
+            intervals(windows[0], binding.start, _mode, out=out, workspace=workspace)
+        nbytes = workspace.nbytes
+        for window in windows[1:]:
+            for _mode in self.modes:
+                intervals(window, binding.start, _mode, out=out, workspace=workspace)
+        self.assertEqual(nbytes, workspace.nbytes)
+
+    def test_intervals_out_dtype(self):
+        out = np.empty(5, dtype=np.int32)
+        exists = intervals([2, 4, 2, 2, 4], binding.end, mode.normal, out=out)
+        self.assertEqual(np.int32, exists.dtype)
+        assert_array_equal([2, 3, 1, 2, 1], exists)
+
+    def test_intervals_out_short_exception(self):
+        out = np.empty(5, dtype=np.intp)
+        with pytest.raises(ValueError):
+            intervals([2, 4, 2, 2, 4], binding.start, mode.redundant, out=out)
+
+    def test_intervals_out_dtype_exception(self):
+        out = np.empty(5, dtype=np.intp)
+        with pytest.raises(ValueError):
+            intervals([2, 4, 2, 2, 4], binding.start, mode.normal, np.int32, out)
+
+    def test_intervals_out_lists_exception(self):
+        out = np.empty(10, dtype=np.intp)
+        with pytest.raises(ValueError):
+            intervals([2, 4, 2], self.bindings, mode.normal, out=out)
+
+    def test_characteristics(self):
+        workspace = Workspace()
+        for window in self.windows():
+            X = intervals(window, binding.start, mode.normal)
+            for characteristic in [
+                characteristics.depth,
+                characteristics.average_remoteness,
+                characteristics.geometric_mean,
+            ]:
+                expected = characteristic(X)
+                exists = characteristic(X, workspace=workspace)
+                self.assertEqual(expected, exists)
+
+    def test_ma_characteristics(self):
+        workspace = Workspace()
+        X = [[1, 1, 4, 4], [3, 1, 3], [5, 3, 1]]
+        for characteristic in [
+            characteristics.ma.depth,
+            characteristics.ma.average_remoteness,
+            characteristics.ma.geometric_mean,
+        ]:
+            expected = characteristic(X)
+            exists = characteristic(X, workspace=workspace)
+            assert_array_equal(expected, exists)